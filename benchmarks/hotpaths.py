@@ -0,0 +1,198 @@
+"""Time the scoring, ROI and prioritization hot paths at increasing portfolio sizes.
+
+Runs each computation the pages perform (readiness scoring, Impact
+Estimation ROI and payback, the ROI Calculator NPV, Portfolio Matrix
+quadrants, priority ordering, the priority index, the Action Plan roadmap,
+the scheduled portfolio and the budget optimizer) on synthetic portfolios of 10, 1k, 100k and 1M initiatives,
+outside Streamlit. Records
+the best time over ``--repeat`` runs and the tracemalloc peak of one run,
+and writes them to a JSON results file tagged with the current commit, so
+two commits can be compared:
+
+    python benchmarks/hotpaths.py [--sizes 10,1000,100000,1000000] [--repeat 3]
+    python benchmarks/hotpaths.py --compare benchmarks/results/hotpaths-<commit>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from strategy_mapper import capability, optimizer, portfolio, roi, scheduling  # noqa: E402
+from strategy_mapper.store import ENUM_FIELDS, InitiativeStore  # noqa: E402
+
+SIZES = [10, 1_000, 100_000, 1_000_000]
+
+RESULTS_DIRECTORY = os.path.join(ROOT, "benchmarks", "results")
+
+def synthetic_store(count, seed=0):
+    """A store of ``count`` initiatives with random levels and impact figures."""
+    rng = np.random.default_rng(seed)
+    columns = {
+        "name": np.array([f"Initiative {i}" for i in range(count)], dtype=object),
+        "owner": np.array([f"Owner {i % 25}" for i in range(count)], dtype=object),
+    }
+    for field, levels in ENUM_FIELDS.items():
+        columns[field] = rng.integers(0, len(levels), count).astype(np.int8)
+    investment = rng.uniform(1e4, 1e6, count)
+    benefits = rng.uniform(1e4, 2e6, count)
+    columns["investment_required"] = investment
+    columns["total_benefits"] = benefits
+    columns["expected_roi"] = (benefits - investment) / investment * 100
+    columns["payback_period"] = investment / benefits
+    return InitiativeStore.from_columns(np.arange(1, count + 1), columns)
+
+
+def synthetic_assessments(count, seed=0):
+    """``count`` saved-assessment score mappings (64 distinct ones, reused)."""
+    rng = np.random.default_rng(seed)
+    distinct = [
+        {dimension: options[rng.integers(len(options))] for dimension, options in capability.OPTIONS.items()}
+        for _ in range(64)
+    ]
+    return [distinct[i % len(distinct)] for i in range(count)]
+
+
+def cases(count):
+    """``{name: zero-argument callable}`` for one portfolio size."""
+    store = synthetic_store(count)
+    assessments = synthetic_assessments(count)
+    benefits = store.column("total_benefits")
+    investment = store.column("investment_required")
+    start = datetime(2024, 1, 1)
+
+    def priority_sort():
+        return portfolio.priority_order(store)
+
+    def quadrants():
+        return portfolio.quadrants(
+            portfolio.code_scores(store.codes("complexity")),
+            portfolio.code_scores(store.codes("business_impact")),
+        )
+
+    def roadmap():
+        # The Action Plan roadmap: the top five from the priority index, scheduled
+        return portfolio.roadmap(store.records(index.top(5)), start)
+
+    index = portfolio.PriorityIndex(store)
+    edited = store.get(int(store.ids()[-1]))
+
+    def priority_update():
+        # One saved impact analysis: rescore an initiative, then read the top five
+        index.apply([(edited, {**edited, "expected_roi": edited["expected_roi"] + 1})])
+        return index.top(5)
+
+    order = index.ordered()
+
+    def schedule():
+        # The whole portfolio under a quarterly budget and two initiatives per owner at once
+        return scheduling.schedule(store, order, budget_cap=2e6, owner_limit=2)
+
+    items = optimizer.candidates(store)
+    budget = float(investment.sum()) / 2
+
+    def optimize():
+        # The Portfolio Matrix optimizer for half the total investment (exact up to EXACT_LIMIT)
+        return optimizer.optimize(items, budget)
+
+    return {
+        "readiness_scoring": lambda: [capability.readiness(scores) for scores in assessments],
+        "impact_roi_payback": lambda: roi.impact_roi(benefits, investment),
+        "npv_roi_calculator": lambda: roi.evaluate(investment, investment * 0.1, 6, benefits, 5),
+        "quadrant_classification": quadrants,
+        "priority_sort": priority_sort,
+        "priority_index_build": lambda: portfolio.PriorityIndex(store),
+        "priority_index_update": priority_update,
+        "action_plan_timeline": roadmap,
+        "portfolio_schedule": schedule,
+        "budget_optimizer": optimize,
+        "ranked_selection": lambda: optimizer.ranked_selection(items, order, budget),
+    }
+
+
+def measure(function, repeat):
+    """Best wall time of ``repeat`` runs and the tracemalloc peak of one run."""
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best, peak
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    before = {(row["case"], row["size"]): row for row in baseline["results"]}
+    print(f"\nCompared with {baseline['commit']} ({baseline_path})")
+    print(f"{'Case':<26}{'Size':>10}{'Time':>10}{'Peak memory':>14}")
+    for row in results:
+        old = before.get((row["case"], row["size"]))
+        if old is None:
+            continue
+        time_ratio = row["seconds"] / old["seconds"] if old["seconds"] else float("nan")
+        peak_ratio = row["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else float("nan")
+        print(f"{row['case']:<26}{row['size']:>10,}{time_ratio:>9.2f}x{peak_ratio:>13.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/hotpaths-<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    commit = _git_commit()
+    results = []
+    print(f"{'Case':<26}{'Size':>10}{'Time (ms)':>12}{'Peak (MiB)':>12}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        for name, function in cases(size).items():
+            seconds, peak = measure(function, args.repeat)
+            results.append({"case": name, "size": size, "seconds": seconds, "peak_bytes": peak})
+            print(f"{name:<26}{size:>10,}{seconds * 1000:>12.2f}{peak / 2**20:>12.2f}")
+
+    output = args.output or os.path.join(RESULTS_DIRECTORY, f"hotpaths-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump({
+            "commit": commit,
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+            "results": results,
+        }, file, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
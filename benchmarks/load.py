@@ -0,0 +1,176 @@
+"""Load-test the app with many concurrent sessions in one process.
+
+Each simulated planner is its own AppTest session on its own thread, seeded
+with synthetic goals, initiatives (with impact figures) and stakeholders,
+and walks the pages in ``PAGE_ORDER`` through the sidebar. The sessions
+share one interpreter, as they would share one server, including the
+process-wide figure cache.
+
+AppTest swaps process-global state on every run, so concurrent runs
+interfere. Runs are therefore taken one at a time under a lock, and the
+sessions' reruns interleave, as CPU-bound runs do under the GIL on a real
+server. A rerun's latency is its wait for the lock plus its own run time.
+
+For each session count it reports rerun latency percentiles, mean run
+time, throughput across all sessions, the state each session holds and the
+process's resident memory. Everything runs locally; workspaces go to a
+temporary database. Run from the repository root:
+
+    python benchmarks/load.py [--app app.py] [--sessions 1,5,10,20] [--laps 2]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from benchmarks.reruns import synthetic_initiatives, synthetic_stakeholders  # noqa: E402
+from strategy_mapper.pages import PAGE_ORDER  # noqa: E402
+from strategy_mapper.store import InitiativeStore  # noqa: E402
+
+SESSION_COUNTS = [1, 5, 10, 20]
+
+# One script run at a time; see the module docstring
+_run_lock = threading.Lock()
+
+
+def resident_bytes():
+    """Current resident set size of this process (Linux), or its peak elsewhere."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        # ru_maxrss is in KiB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def rerun(at):
+    """Run ``at`` once; return its latency and its own run time, in seconds."""
+    requested = time.perf_counter()
+    with _run_lock:
+        started = time.perf_counter()
+        at.run()
+    finished = time.perf_counter()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return finished - requested, finished - started
+
+
+def planner(app, seed, initiatives, stakeholders, goals, laps, start):
+    """One session: seed it, wait for the others, then walk every page ``laps`` times.
+
+    Returns the ``(latency, run time)`` of each rerun in seconds and the
+    session's state size in bytes.
+    """
+    at = AppTest.from_file(app, default_timeout=300)
+    rerun(at)
+    at.session_state.initiatives = InitiativeStore(synthetic_initiatives(initiatives, seed=seed))
+    at.session_state.stakeholders = synthetic_stakeholders(stakeholders, seed=seed)
+    at.session_state.goals = [f"Goal {i}" for i in range(goals)]
+    at.session_state.business_objective = f"Planner {seed} objective"
+    rerun(at)
+    start.wait()
+
+    timings = []
+    for _ in range(laps):
+        for index, page in enumerate(PAGE_ORDER):
+            at.sidebar.button(key=f"nav_{index}").click()
+            try:
+                timings.append(rerun(at))
+            except RuntimeError as exc:
+                raise RuntimeError(f"{page}: {exc}") from None
+
+    account = at.session_state["memory_account"]
+    account.measure(at.session_state, force=True)
+    return timings, account.total
+
+
+def run_level(app, sessions, args):
+    """Run ``sessions`` planners at once and summarise their reruns."""
+    start = threading.Barrier(sessions + 1)
+    resident_before = resident_bytes()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [
+            pool.submit(planner, app, seed, args.initiatives, args.stakeholders, args.goals, args.laps, start)
+            for seed in range(sessions)
+        ]
+        # Seeding is not part of the measurement; time from when every session is ready
+        start.wait()
+        began = time.perf_counter()
+        results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - began
+    resident = resident_bytes()
+
+    timings = [timing for session_timings, _ in results for timing in session_timings]
+    latencies = [latency for latency, _ in timings]
+    state_bytes = [size for _, size in results]
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p90_ms": percentile(latencies, 0.90) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "run_ms": statistics.mean(run_time for _, run_time in timings) * 1000,
+        "reruns_per_second": len(latencies) / elapsed,
+        "state_mib_per_session": statistics.mean(state_bytes) / 2**20,
+        "resident_mib": resident / 2**20,
+        "resident_growth_mib": (resident - resident_before) / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--sessions", default=",".join(str(count) for count in SESSION_COUNTS),
+                        help="Comma-separated numbers of concurrent sessions to try, in order")
+    parser.add_argument("--laps", type=int, default=2, help="Walks through every page per session")
+    parser.add_argument("--initiatives", type=int, default=500)
+    parser.add_argument("--stakeholders", type=int, default=100)
+    parser.add_argument("--goals", type=int, default=10)
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    app = os.path.abspath(args.app)
+
+    # Workspaces are saved as sessions run; keep them out of the real database
+    os.environ["STRATEGY_MAPPER_DB"] = os.path.join(tempfile.mkdtemp(prefix="strategy_mapper_load_"), "load.db")
+
+    print(f"{args.initiatives:,} initiatives, {args.stakeholders:,} stakeholders and {args.goals} goals "
+          f"per session, {args.laps} walk(s) through {len(PAGE_ORDER)} pages")
+    print(f"{'Sessions':>8}{'Reruns':>8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'Max ms':>9}{'Run ms':>9}"
+          f"{'Reruns/s':>10}{'State MiB':>11}{'RSS MiB':>9}")
+    results = []
+    for sessions in (int(count) for count in args.sessions.split(",")):
+        result = run_level(app, sessions, args)
+        results.append(result)
+        print(f"{sessions:>8}{result['reruns']:>8}{result['p50_ms']:>9.0f}{result['p90_ms']:>9.0f}"
+              f"{result['p99_ms']:>9.0f}{result['max_ms']:>9.0f}{result['run_ms']:>9.0f}"
+              f"{result['reruns_per_second']:>10.1f}"
+              f"{result['state_mib_per_session']:>11.1f}{result['resident_mib']:>9.0f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"settings": vars(args), "results": results}, file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Time common interactions on a large session.
+
+Seeds a session with 1,000 initiatives, 50 goals and 200 stakeholders, then
+times sidebar navigation, removing an initiative and adding/removing goals
+through Streamlit's AppTest. Each timing covers every script or fragment
+run the click triggers. Workspaces go to a temporary database. Run from the
+repository root:
+
+    python benchmarks/reruns.py [--app app.py] [--initiatives 1000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from strategy_mapper.stakeholders import Stakeholder  # noqa: E402
+from strategy_mapper.store import InitiativeStore  # noqa: E402
+
+LEVELS = ["Low", "Medium", "High"]
+
+
+def synthetic_initiatives(count, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        investment = rng.uniform(1e4, 1e6)
+        benefits = rng.uniform(1e4, 2e6)
+        records.append({
+            "name": f"Initiative {i}",
+            "business_problem": f"Business problem {i}",
+            "ai_solution": "Predictive model",
+            "owner": f"Owner {i % 25}",
+            "timeline": rng.choice(["3-6 months", "6-12 months", "12+ months"]),
+            "complexity": rng.choice(LEVELS),
+            "business_impact": rng.choice(LEVELS),
+            "phase1": "Pilot", "phase2": "MVP", "phase3": "Scale",
+            "primary_metric": f"Metric {i % 10}",
+            "secondary_metrics": "",
+            "created_at": "2024-01-01 09:00",
+            "investment_required": investment,
+            "total_benefits": benefits,
+            "expected_roi": (benefits - investment) / investment * 100,
+            "payback_period": investment / benefits,
+            "technical_risk": rng.choice(LEVELS),
+            "business_risk": rng.choice(LEVELS),
+            "timeline_risk": rng.choice(LEVELS),
+        })
+    return records
+
+
+def synthetic_stakeholders(count, seed=0):
+    rng = random.Random(seed)
+    return [Stakeholder.from_dict({
+        "name": f"Stakeholder {i}",
+        "role": f"Department {i % 12}",
+        "influence": rng.choice(LEVELS + ["Very High"]),
+        "interest": rng.choice(LEVELS + ["Very High"]),
+        "sentiment": rng.choice(["Skeptical", "Neutral", "Supportive", "Champion"]),
+        "concerns": "Data privacy and change management",
+        "added_at": "2024-01-01",
+    }) for i in range(count)]
+
+
+def seeded_app(app, initiatives, page):
+    at = AppTest.from_file(app, default_timeout=300)
+    at.run()
+    at.session_state.initiatives = InitiativeStore(synthetic_initiatives(initiatives))
+    at.session_state.stakeholders = synthetic_stakeholders(200)
+    at.session_state.goals = [f"Goal {i}" for i in range(50)]
+    at.session_state.current_page = page
+    at.run()
+    return at
+
+
+def timed(at, action):
+    start = time.perf_counter()
+    action(at).run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def button(at, key=None, label=None):
+    for candidate in at.button:
+        if (key is not None and candidate.key == key) or (label is not None and candidate.label == label):
+            return candidate
+    raise LookupError(key or label)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--initiatives", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    app = os.path.abspath(args.app)
+
+    # Seeded sessions are saved as they run; keep them out of the real database
+    os.environ["STRATEGY_MAPPER_DB"] = os.path.join(tempfile.mkdtemp(prefix="strategy_mapper_reruns_"), "reruns.db")
+
+    scenarios = {
+        "Full rerun (Portfolio Matrix)": ("Portfolio Matrix", lambda at: at),
+        "Sidebar navigation": ("Portfolio Matrix", lambda at: button(at, key="nav_8")),
+        "Remove initiative": (
+            "3. Initiative Definition",
+            lambda at: button(at, key=[b.key for b in at.button if (b.key or "").startswith("remove_")][0]),
+        ),
+        "Add goal": (
+            "1. Goal Decomposition",
+            lambda at: (at.text_input[0].input(f"New goal {time.perf_counter()}"), button(at, label="Add Goal"))[1],
+        ),
+        "Remove goal": ("1. Goal Decomposition", lambda at: button(at, key="remove_goal_0")),
+    }
+
+    print(f"{args.initiatives:,} initiatives, median of {args.repeat} runs")
+    print(f"{'Interaction':<32}{'Time (ms)':>10}")
+    for name, (page, action) in scenarios.items():
+        timings = []
+        for _ in range(args.repeat):
+            at = seeded_app(app, args.initiatives, page)
+            timings.append(timed(at, action))
+        print(f"{name:<32}{statistics.median(timings) * 1000:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
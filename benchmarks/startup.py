@@ -0,0 +1,96 @@
+"""Measure first-paint and per-rerun time of the Streamlit app.
+
+Each page is measured in a fresh interpreter so the first run includes the
+app's own imports, as it would on a cold server. Reruns are timed on the
+same page afterwards. Workspaces go to a temporary database. Run from the
+repository root:
+
+    python benchmarks/startup.py [--app app.py] [--reruns 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PAGES = [
+    "Strategic Overview",
+    "1. Goal Decomposition",
+    "2. Capability Assessment",
+    "3. Initiative Definition",
+    "4. Impact Estimation",
+    "Portfolio Matrix",
+    "Stakeholder Alignment",
+    "ROI Calculator",
+    "Action Plan",
+]
+
+HEAVY_MODULES = ["numpy", "pandas", "plotly.express", "plotly.graph_objects"]
+
+
+def measure_page(app, page, reruns):
+    from streamlit.testing.v1 import AppTest
+
+    already_loaded = {name for name in HEAVY_MODULES if name in sys.modules}
+    at = AppTest.from_file(app, default_timeout=120)
+    at.session_state.current_page = page
+
+    start = time.perf_counter()
+    at.run()
+    first_paint = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].message}")
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules and name not in already_loaded]
+
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "page": page,
+        "first_paint_ms": first_paint * 1000,
+        "rerun_median_ms": statistics.median(timings) * 1000,
+        "imported": loaded,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--page", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    app = os.path.abspath(args.app)
+
+    if args.page:
+        print(json.dumps(measure_page(app, args.page, args.reruns)))
+        return
+
+    # Each page's session is saved as it runs; keep them out of the real
+    # database (the per-page interpreters inherit this)
+    os.environ["STRATEGY_MAPPER_DB"] = os.path.join(tempfile.mkdtemp(prefix="strategy_mapper_startup_"), "startup.db")
+
+    print(f"{'Page':<28}{'First paint (ms)':>18}{'Rerun (ms)':>12}  Heavy imports")
+    results = []
+    for page in PAGES:
+        output = subprocess.run(
+            [sys.executable, __file__, "--app", app, "--reruns", str(args.reruns), "--page", page],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(app),
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        results.append(result)
+        print(f"{page:<28}{result['first_paint_ms']:>18.0f}{result['rerun_median_ms']:>12.1f}  "
+              f"{', '.join(result['imported']) or '-'}")
+
+    print(f"{'Mean':<28}{statistics.mean(r['first_paint_ms'] for r in results):>18.0f}"
+          f"{statistics.mean(r['rerun_median_ms'] for r in results):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Computation modules behind the AI Strategy Mapper Streamlit app."""
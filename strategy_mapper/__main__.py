@@ -0,0 +1,57 @@
+"""Command-line entry point: ``python -m strategy_mapper batch INPUT_DIR OUTPUT_DIR``."""
+
+import argparse
+import sys
+from datetime import datetime
+
+
+def _batch(args):
+    from strategy_mapper import batch
+
+    def report(summary):
+        if summary["status"] == "ok":
+            print(
+                f"{summary['portfolio']}: {summary['initiatives']:,} initiatives, "
+                f"{summary['errors']:,} rejected rows ({summary['seconds']:.2f}s)",
+                file=sys.stderr,
+            )
+        else:
+            print(f"{summary['portfolio']}: failed: {summary['message']}", file=sys.stderr)
+
+    summaries = batch.run(
+        args.input_dir, args.output_dir, workers=args.workers, start=args.start_date, top=args.top, on_result=report
+    )
+    failed = sum(summary["status"] != "ok" for summary in summaries)
+    print(f"{len(summaries) - failed} of {len(summaries)} portfolios processed; results in {args.output_dir}",
+          file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m strategy_mapper", description="AI Strategy Mapper tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch_parser = commands.add_parser(
+        "batch",
+        help="Score every portfolio file in a directory",
+        description=(
+            "Run the strategy pipeline (ROI, quadrants, priority order, roadmap and readiness) on every "
+            "CSV, JSON or NDJSON portfolio in INPUT_DIR, writing one NDJSON result per portfolio and "
+            "summary.csv to OUTPUT_DIR."
+        ),
+    )
+    batch_parser.add_argument("input_dir")
+    batch_parser.add_argument("output_dir")
+    batch_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    batch_parser.add_argument("--top", type=int, default=5, help="Initiatives on the roadmap (default: 5)")
+    batch_parser.add_argument(
+        "--start-date", type=datetime.fromisoformat, default=None, help="Roadmap start, YYYY-MM-DD (default: today)"
+    )
+    batch_parser.set_defaults(handler=_batch)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""Headless batch runs of the strategy pipeline over a directory of portfolios.
+
+Each input file (CSV, JSON or NDJSON, in the bulk import format) is one
+portfolio. Files are processed in parallel worker processes, each running
+the same steps as the app: import and validation, Impact Estimation ROI and
+payback, Portfolio Matrix quadrants, Action Plan priority order and roadmap,
+and the Capability Assessment readiness score when the portfolio carries one.
+
+Every portfolio produces ``<name>.ndjson`` in the output directory, and
+``summary.csv`` gets one row per portfolio. A portfolio that fails is
+reported in the summary without stopping the others.
+"""
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+
+import numpy as np
+
+from strategy_mapper import capability, export, importer, portfolio
+from strategy_mapper import roi as roi_engine
+from strategy_mapper.store import InitiativeStore
+
+SUMMARY_FILE = "summary.csv"
+
+BENEFIT_FIELDS = ["cost_savings", "revenue_increase", "risk_reduction"]
+INVESTMENT_FIELDS = ["technology_cost", "personnel_cost", "infrastructure_cost"]
+
+SUMMARY_FIELDS = [
+    "portfolio", "status", "rows", "initiatives", "errors", "high_impact",
+    "total_investment", "average_roi", "readiness_score",
+    "quick_wins", "strategic_bets", "fill_ins", "question_marks", "top_initiative", "seconds", "message",
+]
+
+
+def portfolio_files(directory):
+    """Importable files in ``directory``, sorted by name."""
+    paths = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.rsplit(".", 1)[-1].lower() in importer.FORMATS:
+            paths.append(entry.path)
+    return sorted(paths)
+
+
+def _read_portfolio(path):
+    """Raw initiative rows from ``path`` and the capability scores it carries, if any."""
+    fmt = importer.file_format(path)
+    with open(path, "rb") as file:
+        if fmt == "json" and file.read(1024).lstrip().startswith(b"{"):
+            # An object holding the portfolio and, optionally, the saved assessment
+            file.seek(0)
+            document = json.load(file)
+            assessment = document.get("capability_assessment") or {}
+            scores = assessment.get("scores") or document.get("scores")
+            return list(document.get("initiatives") or []), scores
+        file.seek(0)
+        rows = []
+        scores = None
+        for row in importer.iter_rows(file, fmt, "initiatives"):
+            kind = row.get("type") if isinstance(row, dict) else None
+            if kind == "capability_assessment":
+                scores = row.get("scores")
+            # Records of other types (an Action Plan export's header and
+            # stakeholders) are not initiatives
+            elif kind in (None, "initiative"):
+                rows.append(row)
+        return rows, scores
+
+
+def _figures(store, component_fields, total_field):
+    """Per-initiative total of ``component_fields``, or ``total_field`` where none is set."""
+    components = np.array([store.column(field) for field in component_fields]).reshape(len(component_fields), -1)
+    has_components = ~np.isnan(components).all(axis=0)
+    return np.where(has_components, np.nansum(components, axis=0), store.column(total_field))
+
+
+def analyse(store):
+    """The portfolio scored as the pages score it, as a DataFrame indexed by ID.
+
+    Benefits and investment are totalled from the Impact Estimation figures
+    and ROI and payback recomputed from them; initiatives without any impact
+    figures keep the ROI and payback they were imported with.
+    """
+    benefits = _figures(store, BENEFIT_FIELDS, "total_benefits")
+    investment = _figures(store, INVESTMENT_FIELDS, "investment_required")
+    roi, payback = roi_engine.impact_roi(np.nan_to_num(benefits), np.nan_to_num(investment))
+    estimated = ~np.isnan(benefits) | ~np.isnan(investment)
+
+    frame = store.frame().copy()
+    frame["total_benefits"] = benefits
+    frame["investment_required"] = investment
+    frame["expected_roi"] = np.where(estimated, roi, store.column("expected_roi"))
+    frame["payback_period"] = np.where(estimated, payback, store.column("payback_period"))
+
+    complexity = portfolio.code_scores(store.codes("complexity"))
+    impact = portfolio.code_scores(store.codes("business_impact"))
+    frame["quadrant"] = portfolio.quadrants(complexity, impact)
+    frame["priority_score"] = portfolio.priority_scores(complexity, impact, frame["expected_roi"].fillna(0))
+    return frame
+
+
+def run_portfolio(path, output_directory, start=None, top=5):
+    """Run the pipeline on one portfolio file and write its results.
+
+    Returns the portfolio's ``summary.csv`` row. Runs in a worker process,
+    so everything it needs is passed in and everything it produces is
+    written to disk or returned.
+    """
+    started = time.perf_counter()
+    name = os.path.splitext(os.path.basename(path))[0]
+    summary = {"portfolio": name, "status": "ok"}
+    try:
+        rows, scores = _read_portfolio(path)
+        store = InitiativeStore()
+        result = importer.import_initiatives(store, rows)
+        frame = analyse(store)
+        order = frame.index[np.argsort(-frame["priority_score"].to_numpy(), kind="stable")]
+
+        start = start or datetime.combine(date.today(), datetime.min.time())
+        # Built from the scored frame, so the roadmap shows the recomputed investment
+        timeline = portfolio.roadmap(frame.loc[order[:top]].to_dict("records"), start)
+        investment = frame["investment_required"].fillna(0)
+        summary.update({
+            "rows": result["rows"],
+            "initiatives": len(store),
+            "errors": result["error_count"],
+            "high_impact": int((store.codes("business_impact") == portfolio.HIGH).sum()),
+            "total_investment": float(investment.sum()),
+            "average_roi": float(frame["expected_roi"].fillna(0).mean()) if len(store) else 0.0,
+            "readiness_score": capability.readiness(scores) if scores else None,
+            "quick_wins": int((frame["quadrant"] == "Quick Wins").sum()),
+            "strategic_bets": int((frame["quadrant"] == "Strategic Bets").sum()),
+            "fill_ins": int((frame["quadrant"] == "Fill-ins").sum()),
+            "question_marks": int((frame["quadrant"] == "Question Marks").sum()),
+            "top_initiative": timeline[0]["Initiative"] if timeline else None,
+        })
+
+        def records():
+            yield {"type": "header", "generated_date": datetime.now().strftime("%Y-%m-%d %H:%M"), **summary}
+            for rank, item in enumerate(timeline, 1):
+                # Initiatives without impact figures have a NaN investment
+                item = {key.lower(): export.finite(value) for key, value in item.items()}
+                item["start"], item["end"] = item["start"].date().isoformat(), item["end"].date().isoformat()
+                yield {"type": "timeline", "rank": rank, **item}
+            for rank, record in enumerate(export.initiative_records(frame, order), 1):
+                record["rank"] = rank
+                yield record
+            for row, message in result["errors"]:
+                yield {"type": "error", "row": row, "message": message}
+
+        with open(os.path.join(output_directory, f"{name}.ndjson"), "wb") as file:
+            file.writelines(export.ndjson_lines(records()))
+    except Exception as exc:  # one bad file must not stop the batch
+        summary.update({"status": "failed", "message": f"{type(exc).__name__}: {exc}"})
+    summary["seconds"] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+def run(input_directory, output_directory, workers=None, start=None, top=5, on_result=None):
+    """Run every portfolio in ``input_directory`` across a pool of processes.
+
+    ``workers`` defaults to the number of CPU cores. ``on_result(summary)``
+    is called in the parent process as each portfolio finishes. Returns the
+    summary rows in file-name order, as written to ``summary.csv``.
+    """
+    paths = portfolio_files(input_directory)
+    os.makedirs(output_directory, exist_ok=True)
+    # Largest files first, so a big portfolio does not start last and hold up the batch
+    paths_by_size = sorted(paths, key=os.path.getsize, reverse=True)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = {
+            pool.submit(run_portfolio, path, output_directory, start, top): path for path in paths_by_size
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                summary = future.result()
+            except Exception as exc:  # the worker itself died, e.g. out of memory
+                name = os.path.splitext(os.path.basename(path))[0]
+                summary = {"portfolio": name, "status": "failed", "message": f"{type(exc).__name__}: {exc}"}
+            results[path] = summary
+            if on_result is not None:
+                on_result(summary)
+
+    summaries = [results[path] for path in paths]
+    with open(os.path.join(output_directory, SUMMARY_FILE), "w", newline="") as file:
+        writer = csv.DictWriter(file, SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(summaries)
+    return summaries
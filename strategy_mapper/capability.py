@@ -0,0 +1,98 @@
+"""Readiness scoring for the Capability Assessment page and the batch CLI.
+
+Single assessments are scored from their answer labels; many business-unit
+assessments are encoded to int8 option codes and scored together through a
+dimension x option lookup table.
+"""
+
+import numpy as np
+
+# Points per answer level across all nine dimensions
+LEVEL_POINTS = {
+    "Poor": 1, "None": 1, "Legacy": 1, "Low": 1, "Limited": 1,
+    "Fair": 2, "Basic": 2, "Medium": 2, "Partial": 2, "Moderate": 2,
+    "Good": 3, "Intermediate": 3, "High": 3, "Structured": 3,
+    "Excellent": 4, "Advanced": 4, "Very High": 4, "Comprehensive": 4,
+    "Modern": 4, "Cloud-native": 4, "Generous": 4
+}
+
+# Keys of a saved assessment's ``scores`` mapping and their chart labels
+DIMENSIONS = {
+    "data_quality": "Data Quality",
+    "data_availability": "Data Availability",
+    "data_governance": "Data Governance",
+    "ai_expertise": "AI Expertise",
+    "infrastructure": "Infrastructure",
+    "dev_ops": "MLOps",
+    "leadership_support": "Leadership",
+    "change_readiness": "Change Mgmt",
+    "budget_availability": "Budget",
+}
+
+# Answer options per dimension, lowest first, as offered on the page
+OPTIONS = {
+    "data_quality": ["Poor", "Fair", "Good", "Excellent"],
+    "data_availability": ["Limited", "Partial", "Good", "Comprehensive"],
+    "data_governance": ["None", "Basic", "Structured", "Advanced"],
+    "ai_expertise": ["None", "Basic", "Intermediate", "Advanced"],
+    "infrastructure": ["Legacy", "Hybrid", "Modern", "Cloud-native"],
+    "dev_ops": ["None", "Basic", "Intermediate", "Advanced"],
+    "leadership_support": ["Low", "Medium", "High", "Very High"],
+    "change_readiness": ["Poor", "Fair", "Good", "Excellent"],
+    "budget_availability": ["Limited", "Moderate", "Good", "Generous"],
+}
+
+MAX_SCORE = 4 * len(DIMENSIONS)  # 36 points
+
+# Points for each dimension (row) and option code (column); the extra last
+# column is what code -1, an unanswered or unknown option, reads
+_LOOKUP = np.array(
+    [[LEVEL_POINTS.get(option, 0) for option in OPTIONS[dimension]] + [0] for dimension in DIMENSIONS],
+    dtype=np.int8,
+)
+
+
+def points(scores):
+    """Points per dimension, in ``DIMENSIONS`` order (0 for unanswered)."""
+    return [LEVEL_POINTS.get(scores.get(dimension), 0) for dimension in DIMENSIONS]
+
+
+def readiness(scores):
+    """Readiness as a percentage of the 36-point maximum."""
+    return sum(points(scores)) / MAX_SCORE * 100
+
+
+def encode(assessments):
+    """int8 option codes, one row per score mapping and one column per dimension.
+
+    Unanswered or unknown answers are coded -1.
+    """
+    import pandas as pd
+
+    codes = np.empty((len(assessments), len(DIMENSIONS)), dtype=np.int8)
+    for column, dimension in enumerate(DIMENSIONS):
+        answers = [assessment.get(dimension) for assessment in assessments]
+        codes[:, column] = pd.Categorical(answers, categories=OPTIONS[dimension]).codes
+    return codes
+
+
+def score_codes(codes):
+    """Points per dimension for ``encode`` output, in a single table lookup."""
+    return _LOOKUP[np.arange(len(DIMENSIONS)), codes]
+
+
+def rank_units(assessments):
+    """Readiness of business-unit assessments, best first.
+
+    ``assessments`` are records with a ``name`` and the nine dimension
+    answers. Returns a DataFrame with the name, the points per dimension,
+    ``readiness`` (%) and ``rank`` (ties share the better rank).
+    """
+    import pandas as pd
+
+    points = score_codes(encode(assessments))
+    frame = pd.DataFrame(points, columns=list(DIMENSIONS))
+    frame.insert(0, "name", [assessment["name"] for assessment in assessments])
+    frame["readiness"] = points.sum(axis=1, dtype=np.int64) / MAX_SCORE * 100
+    frame["rank"] = frame["readiness"].rank(method="min", ascending=False).astype(int)
+    return frame.sort_values("rank", kind="stable").reset_index(drop=True)
@@ -0,0 +1,107 @@
+"""Dependency-tracked cache for values derived from session data.
+
+Each derived value declares the sources it reads (``initiatives``,
+``stakeholders``, ``capability_assessment`` ...). A value is recomputed only
+when one of its sources has changed since it was last computed, and values
+that provide an ``apply`` function are patched in place from the store's
+change feed instead, so their cost follows the size of the change rather
+than the size of the portfolio.
+"""
+
+from strategy_mapper import capability, portfolio, stakeholders
+
+
+class DerivedData:
+    """Lazily computed, invalidation-aware values over named sources.
+
+    ``resolve(name)`` returns the current object for a source. Sources with
+    a ``version`` attribute (such as ``InitiativeStore``) are tracked
+    automatically; plain containers must be announced with ``invalidate``
+    after they are mutated. Replacing a source object also invalidates every
+    value that depends on it.
+    """
+
+    def __init__(self, resolve):
+        self._resolve = resolve
+        self._nodes = {}
+        self._values = {}
+        self._counters = {}
+        self._subscribed = set()
+
+    def define(self, name, deps, compute, apply=None):
+        """Register ``name = compute(*sources)`` over the ``deps`` sources.
+
+        ``apply(value, changes)`` may update a computed value in place from a
+        store change feed and return the new value.
+        """
+        self._nodes[name] = (list(deps), compute, apply)
+        self._values.pop(name, None)
+
+    def prime(self, name, value):
+        """Use ``value`` for ``name`` until one of its sources changes.
+
+        For values already available in the right form, e.g. from a snapshot.
+        """
+        deps = self._nodes[name][0]
+        self._values[name] = ({dep: self.version(dep) for dep in deps}, value)
+
+    def invalidate(self, source):
+        """Mark a source without a ``version`` attribute as changed."""
+        self._counters[source] = self._counters.get(source, 0) + 1
+
+    def version(self, source):
+        """Current version of ``source``; changes whenever the source does."""
+        return self._source_version(source, self._resolve(source))
+
+    def _source_version(self, source, obj):
+        version = getattr(obj, "version", None)
+        if version is None:
+            version = self._counters.get(source, 0)
+        return (id(obj), version)
+
+    def _watch(self, source, obj):
+        if hasattr(obj, "subscribe") and id(obj) not in self._subscribed:
+            obj.subscribe(lambda store, changes: self._on_change(source, store, changes))
+            self._subscribed.add(id(obj))
+
+    def _on_change(self, source, store, changes):
+        # Patch values that were current just before this change; anything
+        # older is left stale and recomputed on next access.
+        before = (id(store), store.version - 1)
+        after = (id(store), store.version)
+        for name, (deps, _, apply) in self._nodes.items():
+            if apply is None or source not in deps or name not in self._values:
+                continue
+            versions, value = self._values[name]
+            if versions.get(source) != before:
+                continue
+            versions = {**versions, source: after}
+            self._values[name] = (versions, apply(value, changes))
+
+    def __getitem__(self, name):
+        deps, compute, _ = self._nodes[name]
+        sources = [self._resolve(dep) for dep in deps]
+        versions = {}
+        for dep, obj in zip(deps, sources):
+            self._watch(dep, obj)
+            versions[dep] = self._source_version(dep, obj)
+
+        cached = self._values.get(name)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        value = compute(*sources)
+        self._values[name] = (versions, value)
+        return value
+
+
+def session_data(resolve):
+    """The derived values shared by the sidebar and pages of one session."""
+    derived = DerivedData(resolve)
+    derived.define("portfolio_summary", ["initiatives"], portfolio.summarize, portfolio.apply_summary_changes)
+    derived.define("scored_initiatives", ["initiatives"], portfolio.scored_frame)
+    derived.define(
+        "priority_index", ["initiatives", "roadmap_tie_break"], portfolio.PriorityIndex, portfolio.PriorityIndex.apply
+    )
+    derived.define("stakeholder_frame", ["stakeholders"], stakeholders.stakeholder_frame)
+    derived.define("unit_readiness", ["unit_assessments"], capability.rank_units)
+    return derived
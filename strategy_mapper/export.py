@@ -0,0 +1,118 @@
+"""Streaming NDJSON export of the action plan.
+
+The report is a generator of records (a summary header, then one record per
+initiative in priority order and one per stakeholder), encoded one line at a
+time into a temporary file by a background thread. Memory use is bounded by
+``CHUNK_SIZE`` rows regardless of portfolio size, and non-finite numbers such
+as an infinite payback period are written as ``null`` so every line is
+standard JSON.
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+import weakref
+from datetime import datetime
+
+CHUNK_SIZE = 1_000
+
+
+def finite(value):
+    """``value``, or None if it is a NaN or infinite float (JSON has no such numbers)."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def initiative_records(frame, ids):
+    """Yield one record per initiative in ``ids`` order, read ``CHUNK_SIZE`` rows at a time."""
+    # ``frame`` is the store's per-version snapshot, so the export reads a
+    # consistent portfolio even if the session edits it meanwhile
+    positions = frame.index.get_indexer(ids)
+    fields = list(frame.columns)
+    for start in range(0, len(positions), CHUNK_SIZE):
+        chunk = frame.iloc[positions[start:start + CHUNK_SIZE]]
+        columns = [chunk[field].tolist() for field in fields]
+        for initiative_id, values in zip(chunk.index.tolist(), zip(*columns)):
+            record = {"type": "initiative", "id": initiative_id}
+            for field, value in zip(fields, values):
+                # Fields never set are omitted, as in InitiativeStore.get
+                if value is None or value != value:
+                    continue
+                record[field] = finite(value)
+            yield record
+
+
+def report_records(summary, frame, ids, stakeholders, generated=None):
+    """Yield the action plan report as a header followed by one record per item."""
+    yield {
+        "type": "header",
+        "generated_date": (generated or datetime.now()).strftime("%Y-%m-%d %H:%M"),
+        "total_initiatives": summary["total_initiatives"],
+        "high_impact_initiatives": summary["high_impact"],
+        "total_investment": finite(summary["total_investment"]),
+        "average_roi": finite(summary["average_roi"]),
+        "stakeholders": len(stakeholders),
+    }
+    yield from initiative_records(frame, ids)
+    for stakeholder in stakeholders:
+        yield {"type": "stakeholder", **{field: finite(value) for field, value in stakeholder.to_dict().items()}}
+
+
+def ndjson_lines(records):
+    """Encode each record as one line of UTF-8 JSON."""
+    encoder = json.JSONEncoder(allow_nan=False, default=str, ensure_ascii=False)
+    for record in records:
+        yield (encoder.encode(record) + "\n").encode()
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ExportJob:
+    """Writes a report to a temporary NDJSON file on a background thread.
+
+    ``key`` identifies the data the report was built from, so callers can
+    keep a finished job until that data changes. The file is deleted when
+    the job is garbage collected.
+    """
+
+    def __init__(self, key, records):
+        self.key = key
+        self.rows = 0
+        self.error = None
+        self._done = threading.Event()
+        fd, self.path = tempfile.mkstemp(prefix="action_plan_", suffix=".ndjson")
+        self._file = os.fdopen(fd, "wb")
+        weakref.finalize(self, _remove, self.path)
+        self._thread = threading.Thread(target=self._write, args=(records,), daemon=True)
+        self._thread.start()
+
+    def _write(self, records):
+        try:
+            with self._file:
+                for line in ndjson_lines(records):
+                    self._file.write(line)
+                    self.rows += 1
+        except Exception as exc:  # reported to the page instead of lost in the thread
+            self.error = exc
+        finally:
+            self._done.set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Wait up to ``timeout`` seconds; return whether the export finished."""
+        return self._done.wait(timeout)
+
+    def read(self):
+        """The finished report as bytes."""
+        with open(self.path, "rb") as file:
+            return file.read()
@@ -0,0 +1,434 @@
+"""Plotly figure builders and a content-addressed figure cache.
+
+Each builder is a pure function of its inputs, so ``FigureCache`` can key a
+built figure on a hash of those inputs and hand back the same figure on
+every rerun until the underlying data actually changes. Because the key is
+the content, one cache is shared by every session in the process, within a
+fixed byte budget.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from strategy_mapper import timing
+from strategy_mapper.stakeholders import SENTIMENT_COLORS
+
+DEFAULT_MAX_ENTRIES = 32
+
+# Byte budget of the shared cache, overridable with STRATEGY_MAPPER_FIGURE_CACHE_MB
+DEFAULT_SHARED_MAX_BYTES = 256 * 2**20
+
+# Where each sentiment's bubble sits within a Stakeholder Matrix cell
+SENTIMENT_OFFSETS = {
+    "Skeptical": (-0.2, -0.2),
+    "Neutral": (0.2, -0.2),
+    "Supportive": (-0.2, 0.2),
+    "Champion": (0.2, 0.2),
+}
+
+# Largest offset of a Portfolio Matrix point from its cell centre
+MATRIX_JITTER = 0.35
+
+
+def _update_digest(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(b"frame")
+        digest.update(repr((list(value.columns), [str(t) for t in value.dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(b"series")
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f"array{value.dtype}{value.shape}".encode())
+        if value.dtype == object:
+            digest.update(pd.util.hash_array(value.ravel()).tobytes())
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"seq{len(value)}".encode())
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"map{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    else:
+        digest.update(repr(value).encode())
+
+
+def content_hash(*parts):
+    """Stable hash of DataFrames, arrays, containers and scalar reprs."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _update_digest(digest, part)
+    return digest.hexdigest()
+
+
+def figure_size(fig):
+    """Bytes of ``fig`` as sent to the browser, used to charge it to a cache budget."""
+    import plotly.io as pio
+
+    return len(pio.to_json(fig, validate=False))
+
+
+class FigureCache:
+    """Bounded LRU cache of built figures keyed by builder and input content.
+
+    Holds at most ``max_entries`` figures and, if ``max_bytes`` is set, at
+    most that many bytes of figures (as measured by ``figure_size``); the
+    least recently used figures are evicted first. Safe to share between
+    sessions. Cached figures are shared between reruns and sessions; treat
+    them as read-only.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._figures)
+
+    def figure(self, builder, *args, **kwargs):
+        """Return ``builder(*args, **kwargs)``, reusing a cached figure if any."""
+        key = (builder.__module__, builder.__qualname__, content_hash(args, kwargs))
+        with self._lock:
+            entry = self._figures.get(key)
+            if entry is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Built outside the lock so other sessions are not held up
+        with timing.section(f"build:{builder.__name__}"):
+            fig = builder(*args, **kwargs)
+        size = figure_size(fig) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return fig
+
+        with self._lock:
+            previous = self._figures.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._figures[key] = (fig, size)
+            self.bytes += size
+            while len(self._figures) > self.max_entries or (
+                self.max_bytes is not None and self.bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._figures.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self.bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._figures),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_cache():
+    """The process-wide figure cache used by every session."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            megabytes = os.environ.get("STRATEGY_MAPPER_FIGURE_CACHE_MB")
+            max_bytes = int(float(megabytes) * 2**20) if megabytes else DEFAULT_SHARED_MAX_BYTES
+            # The byte budget is the limit; the entry count only guards against many tiny figures
+            _shared_cache = FigureCache(max_entries=max_bytes // 1024, max_bytes=max_bytes)
+        return _shared_cache
+
+
+def readiness_radar(categories, values):
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=values,
+        theta=categories,
+        fill='toself',
+        name='Current State'
+    ))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 4])),
+        showlegend=True,
+        height=400
+    )
+    return fig
+
+
+def readiness_radar_comparison(categories, units, values):
+    """One radar trace per business unit, overlaid; ``values`` has a row per unit."""
+    fig = go.Figure()
+    for unit, row in zip(units, values):
+        fig.add_trace(go.Scatterpolar(
+            r=list(row),
+            theta=categories,
+            fill='toself',
+            opacity=0.6,
+            name=unit
+        ))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 4])),
+        showlegend=True,
+        height=450
+    )
+    return fig
+
+
+def readiness_heatmap(categories, units, values):
+    """Points per dimension (columns) for each business unit (rows)."""
+    fig = px.imshow(
+        values,
+        x=categories,
+        y=units,
+        zmin=0,
+        zmax=4,
+        color_continuous_scale='RdYlGn',
+        aspect='auto',
+        labels={'x': 'Dimension', 'y': 'Business unit', 'color': 'Points'}
+    )
+    fig.update_layout(height=min(200 + 18 * len(units), 1200))
+    return fig
+
+
+def jitter(ids, spread=MATRIX_JITTER):
+    """Deterministic ``(dx, dy)`` offsets in ``[-spread, spread]`` for each ID.
+
+    Offsets follow a low-discrepancy sequence over the ID, so points spread
+    evenly across a cell and keep their position from one rerun to the next.
+    """
+    ids = np.asarray(ids, dtype=float)
+    dx = (ids * 0.7548776662466927) % 1.0
+    dy = (ids * 0.5698402909980532) % 1.0
+    return (dx - 0.5) * 2 * spread, (dy - 0.5) * 2 * spread
+
+
+def _matrix_layout(fig):
+    # Update axes
+    fig.update_xaxes(
+        tickvals=[1, 2, 3],
+        ticktext=['Low', 'Medium', 'High'],
+        range=[0.5, 3.5]
+    )
+    fig.update_yaxes(
+        tickvals=[1, 2, 3],
+        ticktext=['Low', 'Medium', 'High'],
+        range=[0.5, 3.5]
+    )
+
+    # Add quadrant lines
+    fig.add_hline(y=2.5, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.add_vline(x=2.5, line_dash="dash", line_color="gray", opacity=0.5)
+
+    # Add quadrant labels
+    fig.add_annotation(x=1.25, y=3.25, text="Quick Wins<br>(Low Complexity, High Impact)",
+                       showarrow=False, font_color="green")
+    fig.add_annotation(x=3.25, y=3.25, text="Strategic Bets<br>(High Complexity, High Impact)",
+                       showarrow=False, font_color="blue")
+    fig.add_annotation(x=1.25, y=0.75, text="Fill-ins<br>(Low Complexity, Low Impact)",
+                       showarrow=False, font_color="orange")
+    fig.add_annotation(x=3.25, y=0.75, text="Question Marks<br>(High Complexity, Low Impact)",
+                       showarrow=False, font_color="red")
+
+    fig.update_layout(height=600, width=800)
+    return fig
+
+
+def portfolio_matrix(df):
+    """One WebGL marker per initiative, jittered within its complexity x impact cell."""
+    dx, dy = jitter(df.index)
+    fig = px.scatter(
+        df.assign(complexity=df['complexity'] + dx, impact=df['impact'] + dy),
+        x='complexity',
+        y='impact',
+        size='investment',
+        color='roi',
+        hover_name='name',
+        hover_data={'complexity': False, 'impact': False, 'quadrant': True},
+        title="AI Initiative Portfolio Matrix",
+        labels={
+            'complexity': 'Technical Complexity',
+            'impact': 'Business Impact',
+            'roi': 'Expected ROI (%)'
+        },
+        color_continuous_scale='RdYlGn',
+        render_mode='webgl',
+    )
+    return _matrix_layout(fig)
+
+
+def portfolio_matrix_cells(cells):
+    """One bubble per complexity x impact cell, sized by initiative count.
+
+    ``cells`` is ``portfolio.matrix_cells`` output, so the figure has at most
+    nine markers however large the portfolio is.
+    """
+    fig = px.scatter(
+        cells.assign(bubble=np.sqrt(cells['count'])),
+        x='complexity',
+        y='impact',
+        size='bubble',
+        size_max=60,
+        color='roi',
+        text='count',
+        hover_data={'complexity': False, 'impact': False, 'bubble': False,
+                    'quadrant': True, 'count': ':,', 'investment': ':$,.0f', 'roi': ':.1f'},
+        title="AI Initiative Portfolio Matrix (initiatives per cell)",
+        labels={
+            'complexity': 'Technical Complexity',
+            'impact': 'Business Impact',
+            'count': 'Initiatives',
+            'investment': 'Total investment',
+            'roi': 'Mean expected ROI (%)'
+        },
+        color_continuous_scale='RdYlGn',
+    )
+    fig.update_traces(texttemplate="%{text:,}", textposition="middle center")
+    return _matrix_layout(fig)
+
+
+def stakeholder_matrix(cells):
+    """Sentiment mix per influence-interest cell, from ``stakeholders.matrix_cells``.
+
+    Each cell shows one bubble per sentiment present, sized by its count, so
+    the figure has at most 64 markers however many stakeholders there are.
+    """
+    fig = go.Figure()
+    largest = max(int(cells['count'].max()), 1) if len(cells) else 1
+    for sentiment, color in SENTIMENT_COLORS.items():
+        rows = cells[cells['sentiment'] == sentiment]
+        if rows.empty:
+            continue
+        dx, dy = SENTIMENT_OFFSETS[sentiment]
+        fig.add_trace(go.Scatter(
+            x=rows['interest'] + dx,
+            y=rows['influence'] + dy,
+            mode='markers',
+            name=sentiment,
+            marker=dict(color=color, size=8 + 40 * np.sqrt(rows['count'] / largest), line=dict(width=1, color='gray')),
+            customdata=np.stack([rows['count'], rows['total'], rows['names']], axis=-1),
+            hovertemplate=(
+                f"{sentiment}: %{{customdata[0]:,}} of %{{customdata[1]:,}}<br>"
+                "%{customdata[2]}<extra></extra>"
+            ),
+        ))
+
+    fig.update_layout(
+        title="Stakeholder Influence-Interest Matrix",
+        xaxis_title='Interest Level',
+        yaxis_title='Influence Level',
+        legend_title_text='sentiment',
+    )
+    fig.update_xaxes(tickvals=[1, 2, 3, 4], ticktext=['Low', 'Medium', 'High', 'Very High'], range=[0.5, 4.5])
+    fig.update_yaxes(tickvals=[1, 2, 3, 4], ticktext=['Low', 'Medium', 'High', 'Very High'], range=[0.5, 4.5])
+
+    # Add quadrant lines
+    fig.add_hline(y=2.5, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.add_vline(x=2.5, line_dash="dash", line_color="gray", opacity=0.5)
+
+    fig.update_layout(height=500)
+    return fig
+
+
+def scenario_bar(results_df, column, title, axis_label):
+    return px.bar(
+        results_df,
+        x="Scenario",
+        y=column,
+        title=title,
+        labels={column: axis_label}
+    )
+
+
+def tornado(base_npv, tornado_df, swing):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=tornado_df["Input"],
+        x=tornado_df["Low NPV"] - base_npv,
+        base=base_npv,
+        orientation="h",
+        name=f"-{swing:.0%}",
+        marker_color="indianred"
+    ))
+    fig.add_trace(go.Bar(
+        y=tornado_df["Input"],
+        x=tornado_df["High NPV"] - base_npv,
+        base=base_npv,
+        orientation="h",
+        name=f"+{swing:.0%}",
+        marker_color="seagreen"
+    ))
+    fig.add_vline(x=base_npv, line_dash="dash", line_color="gray")
+    fig.update_layout(
+        barmode="overlay",
+        title=f"NPV Sensitivity (Base Case ${base_npv:,.0f})",
+        xaxis_title="NPV ($)",
+        height=400
+    )
+    return fig
+
+
+def npv_surface(npv, factors, periods):
+    fig = go.Figure(go.Heatmap(
+        z=npv.T,
+        x=factors * 100,
+        y=[f"{p} yr" for p in periods],
+        colorscale="RdYlGn",
+        zmid=0,
+        colorbar=dict(title="NPV ($)")
+    ))
+    fig.update_layout(xaxis_title="Benefits vs. Base Case (%)", height=350)
+    return fig
+
+
+def npv_histogram(counts, edges, draws):
+    fig = px.bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts / draws,
+        title=f"NPV Distribution ({draws:,} draws)",
+        labels={"x": "NPV ($)", "y": "Share of Draws"}
+    )
+    fig.update_traces(width=edges[1] - edges[0])
+    fig.add_vline(x=0, line_dash="dash", line_color="red", opacity=0.6)
+    return fig
+
+
+def roadmap_timeline(timeline_df, title):
+    fig = px.timeline(
+        timeline_df,
+        x_start="Start",
+        x_end="End",
+        y="Initiative",
+        color="Impact",
+        title=title,
+        color_discrete_map={"Low": "lightblue", "Medium": "orange", "High": "red"}
+    )
+    fig.update_layout(height=400)
+    return fig
@@ -0,0 +1,309 @@
+"""Streaming bulk import of initiatives, stakeholders and capability assessments.
+
+Files are read row by row straight from the upload buffer (CSV, NDJSON, or
+a JSON array decoded one element at a time), validated in chunks, and the
+valid rows are appended in a single batch. Only the validated records are
+held alongside the raw upload, never a second parsed copy of the file.
+"""
+
+import csv
+import io
+import json
+import math
+import time
+
+from strategy_mapper.capability import OPTIONS as ASSESSMENT_OPTIONS
+from strategy_mapper.stakeholders import ENGAGEMENT_SCORES, SENTIMENT_COLORS, Stakeholder
+from strategy_mapper.store import ENUM_FIELDS, FIELDS, NUMERIC_FIELDS, TEXT_FIELDS, TIMESTAMP_FIELDS, timestamp
+
+FORMATS = {"csv": "csv", "json": "json", "ndjson": "ndjson", "jsonl": "ndjson"}
+
+CHUNK_SIZE = 5_000
+
+# Errors kept for display; the rest are only counted
+MAX_ERRORS = 1_000
+
+_READ_SIZE = 1 << 16
+
+# Values the single-record forms preselect or submit empty, used when a
+# column is absent or blank
+INITIATIVE_DEFAULTS = {
+    **{field: "" for field in TEXT_FIELDS},
+    "timeline": ENUM_FIELDS["timeline"][0],
+    "complexity": ENUM_FIELDS["complexity"][0],
+    "business_impact": ENUM_FIELDS["business_impact"][0],
+}
+
+STAKEHOLDER_FIELDS = ["name", "role", "influence", "interest", "sentiment", "concerns", "added_at"]
+
+STAKEHOLDER_ENUMS = {
+    "influence": list(ENGAGEMENT_SCORES),
+    "interest": list(ENGAGEMENT_SCORES),
+    "sentiment": list(SENTIMENT_COLORS),
+}
+
+STAKEHOLDER_DEFAULTS = {**{field: levels[0] for field, levels in STAKEHOLDER_ENUMS.items()}, "concerns": ""}
+
+
+def file_format(filename):
+    """Import format for ``filename`` from its extension."""
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Unsupported file type '.{extension}'; use CSV, JSON or NDJSON")
+    return FORMATS[extension]
+
+
+def _text(binary):
+    return io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+
+
+def _json_array(text, collection):
+    """Yield the elements of a top-level JSON array without parsing it whole.
+
+    A top-level object (such as the Action Plan export) is read in one go
+    and its ``collection`` list is used instead.
+    """
+    decoder = json.JSONDecoder()
+    buffer = text.read(_READ_SIZE).lstrip()
+    if buffer.startswith("{"):
+        document = json.loads(buffer + text.read())
+        yield from document.get(collection) or []
+        return
+    if not buffer.startswith("["):
+        raise ValueError("Expected a JSON array of records")
+
+    position = 1
+    finished = False
+    while True:
+        # Skip separators between elements
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer) or finished:
+                break
+            chunk = text.read(_READ_SIZE)
+            buffer, position, finished = buffer[position:] + chunk, 0, not chunk
+        if position >= len(buffer):
+            raise ValueError("Unterminated JSON array")
+        if buffer[position] == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = text.read(_READ_SIZE)
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield value
+        position = end
+        if position > _READ_SIZE:
+            buffer, position = buffer[position:], 0
+
+
+class UnreadableRow:
+    """A row that could not be decoded; validating it raises ValueError with ``message``."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message):
+        self.message = message
+
+
+def iter_rows(binary, fmt, collection):
+    """Yield raw row dicts from an uploaded file in format ``fmt``.
+
+    ``collection`` names the list to use when a JSON file holds an object
+    with several lists, e.g. ``"initiatives"``. An NDJSON line that is not
+    valid JSON is yielded as an ``UnreadableRow``, so it is reported as that
+    row's error and the lines after it are still read.
+    """
+    text = _text(binary)
+    try:
+        if fmt == "csv":
+            yield from csv.DictReader(text)
+        elif fmt == "ndjson":
+            for line in text:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    yield UnreadableRow(f"Invalid JSON: {exc}")
+        else:
+            yield from _json_array(text, collection)
+    finally:
+        # Leave the upload open; Streamlit hands the same buffer to later runs
+        text.detach()
+
+
+# How each importable field is parsed: "text", "number", "timestamp" or a list of levels
+_INITIATIVE_PARSERS = {
+    **{field: "text" for field in FIELDS},
+    **{field: "number" for field in NUMERIC_FIELDS},
+    **{field: "timestamp" for field in TIMESTAMP_FIELDS},
+    **ENUM_FIELDS,
+}
+
+_STAKEHOLDER_PARSERS = {
+    **{field: "text" for field in STAKEHOLDER_FIELDS}, "added_at": "timestamp", **STAKEHOLDER_ENUMS
+}
+
+_ASSESSMENT_PARSERS = {"name": "text", "assessed_at": "timestamp", **ASSESSMENT_OPTIONS}
+
+
+def _parse(row, parsers, required, defaults):
+    if isinstance(row, UnreadableRow):
+        raise ValueError(row.message)
+    if not isinstance(row, dict):
+        raise ValueError("Expected an object")
+    record = {}
+    for field, value in row.items():
+        parser = parsers.get(field)
+        if parser is None or value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        elif isinstance(value, float) and math.isnan(value):
+            continue
+        if parser == "number":
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{field} must be a number, got '{value}'") from None
+        elif parser == "timestamp":
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                try:
+                    value = timestamp(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"{field} must be a date or a number of seconds, got '{value}'") from None
+        elif parser == "text":
+            value = str(value)
+        elif value not in parser:
+            raise ValueError(f"{field} must be one of {', '.join(parser)}, got '{value}'")
+        record[field] = value
+    for field in required:
+        if field not in record:
+            raise ValueError(f"{field} is required")
+    for field, default in defaults.items():
+        record.setdefault(field, default)
+    return record
+
+
+def validate_initiative(row):
+    """Initiative record from a raw row, or raise ValueError."""
+    return _parse(row, _INITIATIVE_PARSERS, ("name", "business_problem"), INITIATIVE_DEFAULTS)
+
+
+def validate_stakeholder(row):
+    """Stakeholder record from a raw row, or raise ValueError."""
+    return _parse(row, _STAKEHOLDER_PARSERS, ("name", "role"), STAKEHOLDER_DEFAULTS)
+
+
+def validate_assessment(row):
+    """Business-unit capability assessment from a raw row, or raise ValueError.
+
+    Dimensions left out count as unanswered.
+    """
+    return _parse(row, _ASSESSMENT_PARSERS, ("name",), {})
+
+
+def _validate_rows(rows, validate, record_type, taken, stamp_field, on_chunk, chunk_size):
+    stamp = time.time()
+    records = []
+    errors = []
+    error_count = 0
+    other_count = 0
+    row_number = 0
+
+    def error(message):
+        nonlocal error_count
+        error_count += 1
+        if len(errors) < MAX_ERRORS:
+            errors.append((row_number, message))
+
+    rows = iter(rows)
+    while True:
+        try:
+            row = next(rows)
+        except StopIteration:
+            break
+        except (ValueError, csv.Error, UnicodeDecodeError) as exc:
+            # The rest of the file cannot be read; keep the rows before it
+            row_number += 1
+            error(f"Could not read file: {exc}")
+            break
+        row_number += 1
+        kind = row.get("type") if isinstance(row, dict) else None
+        if kind is not None and kind != record_type:
+            # Records of other types (an Action Plan export's header, and its
+            # initiatives or stakeholders) belong to another collection
+            other_count += 1
+        else:
+            try:
+                record = validate(row)
+                if taken is not None and record["name"] in taken:
+                    raise ValueError(f"name '{record['name']}' already exists")
+            except ValueError as exc:
+                error(str(exc))
+            else:
+                if taken is not None:
+                    taken.add(record["name"])
+                record.setdefault(stamp_field, stamp)
+                records.append(record)
+        if on_chunk is not None and row_number % chunk_size == 0:
+            on_chunk(row_number)
+    if on_chunk is not None:
+        on_chunk(row_number)
+    summary = {"rows": row_number - other_count, "added": len(records), "error_count": error_count, "errors": errors}
+    return records, summary
+
+
+def import_initiatives(store, rows, on_chunk=None, chunk_size=CHUNK_SIZE):
+    """Validate ``rows`` and append the valid ones to ``store`` in one batch.
+
+    Records with a ``type`` other than ``"initiative"`` (such as an Action
+    Plan export's header and stakeholders) are skipped and not counted.
+    Returns a summary dict with ``rows``, ``added``, ``error_count`` and
+    ``errors`` (up to ``MAX_ERRORS`` ``(row_number, message)`` pairs).
+    ``on_chunk(rows_read)`` is called after every ``chunk_size`` rows.
+    """
+    records, result = _validate_rows(
+        rows, validate_initiative, "initiative", set(store.names()), "created_at", on_chunk, chunk_size
+    )
+    store.extend(records)
+    return result
+
+
+def import_stakeholders(stakeholders, rows, on_chunk=None, chunk_size=CHUNK_SIZE):
+    """Validate ``rows`` and append the valid ones to the ``stakeholders`` list as ``Stakeholder`` records.
+
+    Stakeholder names need not be unique, as with the single-record form.
+    Records with a ``type`` other than ``"stakeholder"`` are skipped.
+    Returns the same summary as ``import_initiatives``.
+    """
+    records, result = _validate_rows(
+        rows, validate_stakeholder, "stakeholder", None, "added_at", on_chunk, chunk_size
+    )
+    stakeholders.extend(Stakeholder.from_dict(record) for record in records)
+    return result
+
+
+def import_assessments(assessments, rows, on_chunk=None, chunk_size=CHUNK_SIZE):
+    """Validate ``rows`` and append the valid ones to the ``assessments`` list.
+
+    Each row is one business unit, named by ``name`` (unique) with one column
+    per assessment dimension. Records with a ``type`` other than
+    ``"assessment"`` are skipped. Returns the same summary as
+    ``import_initiatives``.
+    """
+    taken = {assessment["name"] for assessment in assessments}
+    records, result = _validate_rows(
+        rows, validate_assessment, "assessment", taken, "assessed_at", on_chunk, chunk_size
+    )
+    assessments.extend(records)
+    return result
@@ -0,0 +1,307 @@
+"""Static page chrome: styles, header, footer and step navigation.
+
+The HTML and CSS are module constants, so they are built once per server
+process rather than on every rerun. Navigation buttons switch pages from
+their ``on_click`` callback, so a click costs one script run rather than
+the run triggered by the click plus an explicit ``st.rerun()``.
+"""
+
+import streamlit as st
+
+from strategy_mapper import session, timing
+from strategy_mapper.pages import PAGE_ORDER
+
+# Custom CSS for professional styling
+CSS = """
+<style>
+    /* Import Google Fonts */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+    
+    /* Global styling */
+    .main {
+        font-family: 'Inter', sans-serif;
+    }
+    
+    /* Custom header styling */
+    .main-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 2rem;
+        border-radius: 10px;
+        margin-bottom: 2rem;
+        color: white;
+    }
+    
+    .main-header h1 {
+        color: white !important;
+        font-weight: 700;
+        font-size: 2.5rem;
+        margin-bottom: 0.5rem;
+    }
+    
+    .main-header p {
+        color: rgba(255, 255, 255, 0.9);
+        font-size: 1.1rem;
+        margin-bottom: 0;
+    }
+    
+    /* Card styling */
+    .info-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
+        border-left: 4px solid #667eea;
+        margin-bottom: 1.5rem;
+    }
+    
+    .metric-card {
+        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+        padding: 1.5rem;
+        border-radius: 10px;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    
+    /* Step indicator styling */
+    .step-indicator {
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 0.5rem 1rem;
+        border-radius: 20px;
+        font-weight: 500;
+        display: inline-block;
+        margin-bottom: 1rem;
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.5rem 1.5rem;
+        font-weight: 500;
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+    }
+    
+    /* Navigation button styling */
+    .nav-button-container {
+        background: #f8f9fa;
+        padding: 1.5rem;
+        border-radius: 10px;
+        margin-top: 2rem;
+    }
+    
+    /* Progress bar styling */
+    .stProgress .st-bo {
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    }
+    
+    /* Sidebar styling */
+    .css-1d391kg {
+        background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
+    }
+    
+    /* Form styling */
+    .stForm {
+        background: white;
+        padding: 2rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.05);
+        border: 1px solid #e9ecef;
+    }
+    
+    /* Expander styling */
+    .streamlit-expanderHeader {
+        background: #f8f9fa;
+        border-radius: 8px;
+        font-weight: 500;
+    }
+    
+    /* Success/Warning/Error styling */
+    .stSuccess {
+        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
+        border-left: 4px solid #28a745;
+    }
+    
+    .stWarning {
+        background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
+        border-left: 4px solid #ffc107;
+    }
+    
+    .stError {
+        background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
+        border-left: 4px solid #dc3545;
+    }
+    
+    /* Table styling */
+    .dataframe {
+        border: none !important;
+        border-radius: 10px;
+        overflow: hidden;
+    }
+    
+    .dataframe thead tr th {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+    }
+    
+    /* Hide Streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    
+    /* Custom metric styling */
+    .custom-metric {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    
+    .custom-metric h3 {
+        color: #667eea;
+        font-size: 2rem;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+    }
+    
+    .custom-metric p {
+        color: #6c757d;
+        font-size: 0.9rem;
+        margin: 0;
+    }
+</style>
+"""
+
+HEADER_HTML = """
+<div class="main-header">
+    <h1>AI Strategy Mapper</h1>
+    <p>Chapter 3 Tool: Transform business objectives into actionable AI initiatives using proven strategic frameworks</p>
+    <p style="font-size: 0.9rem; margin-top: 1rem; opacity: 0.9;">
+        Part of the <strong>AI Playbook for Organisations</strong> toolkit by Madhusudhan Konda
+    </p>
+</div>
+"""
+
+SIDEBAR_TOOLKIT_MARKDOWN = """
+    **Other Tools in the Series:**
+    
+    🔍 [**Ch2: AI Readiness Assessment**](https://aiready.streamlit.app/)  
+    *Evaluate your organization's AI readiness*
+    
+    🎯 **Ch3: AI Strategy Mapper** *(current)*  
+    *Align AI initiatives with business goals*
+    
+    📖 [**Read the Book**](https://medium.com/ai-playbook-for-organisations)  
+    *AI Playbook for Organisations*
+    """
+
+FOOTER_HTML = """
+<div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); padding: 2rem; border-radius: 10px; margin-top: 2rem;">
+    <div style="text-align: center;">
+        <h4 style="color: #667eea; margin-bottom: 1rem;">AI Strategy Mapper</h4>
+        <p style="margin-bottom: 1rem; color: #6c757d;">
+            <strong>Chapter 3 Tool from AI Playbook for Organisations</strong> • Strategic AI Planning Framework
+        </p>
+        
+        <!-- Book and Toolkit Links -->
+        <div style="margin: 1.5rem 0; padding: 1rem; background: rgba(102, 126, 234, 0.1); border-radius: 8px;">
+            <h5 style="color: #667eea; margin-bottom: 0.5rem;">📚 AI Playbook for Organisations Toolkit</h5>
+            <p style="margin: 0.5rem 0; font-size: 0.9rem; color: #6c757d;">
+                <strong>Ch2:</strong> <a href="https://aiready.streamlit.app/" target="_blank" style="color: #667eea; text-decoration: none;">AI Readiness Assessment</a> • 
+                <strong>Ch3:</strong> AI Strategy Mapper (this tool)
+            </p>
+            <p style="margin: 0; font-size: 0.9rem; color: #6c757d;">
+                📖 Read the book: <a href="https://medium.com/ai-playbook-for-organisations" target="_blank" style="color: #667eea; text-decoration: none;">AI Playbook for Organisations</a>
+            </p>
+        </div>
+        
+        <p style="margin: 0; font-size: 0.8rem; color: #6c757d;">
+            Based on: <a href="https://mkonda007.medium.com/ch3-aligning-ai-strategy-with-business-objectives-d4631681053d" 
+            target="_blank" style="color: #667eea; text-decoration: none;">Chapter 3: Aligning AI Strategy with Business Objectives</a>
+        </p>
+    </div>
+</div>
+"""
+
+# Lists longer than this render as one scrollable table instead of markdown
+MARKDOWN_LIST_LIMIT = 50
+
+
+def go_to_page(page_name):
+    st.session_state.current_page = page_name
+
+
+# Pages that change initiatives rerun this fragment instead of the whole app
+@st.fragment(key="portfolio_metrics")
+@timing.timed("sidebar_metrics")
+def portfolio_metrics():
+    if not st.session_state.initiatives:
+        return
+
+    st.markdown("### Portfolio Metrics")
+
+    summary = session.derived_data()["portfolio_summary"]
+    total_initiatives = summary["total_initiatives"]
+    high_impact = summary["high_impact"]
+    total_investment = summary["total_investment"]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"""
+        <div class="custom-metric">
+            <h3>{total_initiatives}</h3>
+            <p>Total Initiatives</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="custom-metric">
+            <h3>{high_impact}</h3>
+            <p>High Impact</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown(f"""
+    <div class="custom-metric">
+        <h3>${total_investment:,.0f}</h3>
+        <p>Total Investment</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def item_list(frame, bullets, columns):
+    """Show the rows of ``frame`` as a single element.
+
+    Short lists are one markdown block of ``bullets(frame)`` (a Series of
+    markdown lines); longer ones are one table of ``columns``.
+    """
+    if len(frame) > MARKDOWN_LIST_LIMIT:
+        st.dataframe(frame[columns], use_container_width=True, hide_index=True)
+    else:
+        st.markdown("\n".join(bullets(frame)))
+
+
+def show_navigation_buttons():
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    current_index = PAGE_ORDER.index(st.session_state.current_page)
+
+    with col1:
+        if current_index > 0:
+            st.button("← Previous Step", key="prev_btn", use_container_width=True,
+                      on_click=go_to_page, args=(PAGE_ORDER[current_index - 1],))
+
+    with col3:
+        if current_index < len(PAGE_ORDER) - 1:
+            st.button("Next Step →", key="next_btn", use_container_width=True,
+                      on_click=go_to_page, args=(PAGE_ORDER[current_index + 1],))
@@ -0,0 +1,140 @@
+"""Per-session memory accounting.
+
+Each session's state is measured at the end of a script run, at most once
+every ``MEASURE_INTERVAL_SECONDS``, logged, and recorded in a process-wide
+registry that the admin view lists. Figures are not counted per session:
+they live in the shared figure cache, which has its own byte budget.
+
+Sizes are estimates: arrays and DataFrames are measured deeply, containers
+and the package's own objects are walked (long containers from a sample),
+and anything else counts its ``sys.getsizeof``. An object reachable from
+several entries is counted once.
+"""
+
+import itertools
+import logging
+import sys
+import threading
+import time
+import weakref
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MEASURE_INTERVAL_SECONDS = 60
+
+# Sessions above this are logged as warnings
+SESSION_WARNING_BYTES = 256 * 2**20
+
+# Session-state entries that are shared between sessions or are handles
+# rather than data
+EXCLUDED_KEYS = {"figure_cache", "workspace", "memory_account"}
+
+# Containers longer than this are measured from an evenly spaced sample of
+# their items, so a 100k-initiative session is measured in milliseconds
+SAMPLE_ITEMS = 1_000
+
+_PACKAGE = __name__.split(".")[0]
+
+
+def _sample(items, count):
+    # The items to measure and the factor that scales their total to all items
+    if count <= SAMPLE_ITEMS:
+        return items, 1
+    step = count // SAMPLE_ITEMS
+    return itertools.islice(items, 0, None, step), count / len(range(0, count, step))
+
+
+def size_of(value, seen=None):
+    """Estimated bytes held by ``value``, skipping objects already in ``seen``."""
+    seen = set() if seen is None else seen
+    if id(value) in seen or value is None or callable(value):
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, np.ndarray):
+        size = value.nbytes
+        if value.dtype == object and value.size:
+            import pandas as pd
+
+            # Counts each element's object, from a sample; strings shared
+            # between rows are counted once per row
+            items = value.ravel()
+            step = max(len(items) // SAMPLE_ITEMS, 1)
+            sample = items[::step]
+            size = int(pd.Series(sample, dtype=object, copy=False).memory_usage(deep=True, index=False)
+                       * len(items) / len(sample))
+        return size
+    module = type(value).__module__
+    if module.startswith("pandas"):
+        if hasattr(value, "memory_usage"):
+            usage = value.memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        return sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        # dict.items, not value.items, so lazily loaded columns stay unloaded
+        items, scale = _sample(dict.items(value), len(value))
+        return sys.getsizeof(value) + int(scale * sum(size_of(key, seen) + size_of(item, seen) for key, item in items))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items, scale = _sample(value, len(value))
+        return sys.getsizeof(value) + int(scale * sum(size_of(item, seen) for item in items))
+    if module.startswith(_PACKAGE):
+        attributes = getattr(value, "__dict__", None)
+        if attributes is not None:
+            return sys.getsizeof(value) + size_of(attributes, seen)
+        slots = getattr(type(value), "__slots__", ())
+        return sys.getsizeof(value) + sum(size_of(getattr(value, slot, None), seen) for slot in slots)
+    return sys.getsizeof(value)
+
+
+class SessionAccount:
+    """The last measurement of one session's state."""
+
+    def __init__(self, label):
+        self.label = label
+        self.sizes = {}
+        self.total = 0
+        self.measured_at = None
+
+    def measure(self, state, force=False):
+        """Measure ``state`` (a mapping) unless it was measured recently; return whether it was."""
+        now = time.monotonic()
+        if not force and self.measured_at is not None and now - self.measured_at < MEASURE_INTERVAL_SECONDS:
+            return False
+        seen = set()
+        sizes = {}
+        for key in list(state.keys()):
+            if key in EXCLUDED_KEYS:
+                continue
+            sizes[key] = size_of(state[key], seen)
+        self.sizes = dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
+        self.total = sum(sizes.values())
+        self.measured_at = now
+
+        largest = ", ".join(f"{key}={size / 2**20:.1f} MiB" for key, size in list(self.sizes.items())[:3])
+        level = logging.WARNING if self.total > SESSION_WARNING_BYTES else logging.INFO
+        logger.log(level, "session %s holds %.1f MiB (%s)", self.label, self.total / 2**20, largest)
+        return True
+
+
+# Accounts of live sessions; an account goes when its session state does
+_accounts = weakref.WeakSet()
+_accounts_lock = threading.Lock()
+
+
+def register(label):
+    """A new account for a session, listed by ``sessions()`` while it is referenced."""
+    account = SessionAccount(label)
+    with _accounts_lock:
+        _accounts.add(account)
+    return account
+
+
+def sessions():
+    """Accounts of all live sessions, largest first."""
+    with _accounts_lock:
+        accounts = list(_accounts)
+    return sorted(accounts, key=lambda account: account.total, reverse=True)
@@ -0,0 +1,136 @@
+"""Monte Carlo ROI simulation with streaming percentile accumulators.
+
+Benefits, operating costs and implementation time are drawn from triangular
+distributions around the ROI Calculator inputs. Draws are generated in
+fixed-size chunks, evaluated with the vectorized NPV engine and folded into a
+fixed-range histogram, so memory stays flat however many draws are requested.
+"""
+
+import numpy as np
+
+from strategy_mapper import roi
+
+DEFAULT_DRAWS = 200_000
+CHUNK_SIZE = 65_536
+HISTOGRAM_BINS = 4096  # Accumulator resolution; quantiles are read from these bins
+DISPLAY_BINS = 60
+
+
+class StreamingHistogram:
+    """Fixed-range histogram that accumulates samples chunk by chunk.
+
+    Values outside ``[low, high]`` are clamped into the edge bins. Quantiles
+    are interpolated within a bin, so their error is bounded by the bin width.
+    """
+
+    def __init__(self, low, high, bins=HISTOGRAM_BINS):
+        if not high > low:
+            low, high = low - 0.5, low + 0.5
+        self.low = float(low)
+        self.high = float(high)
+        self.bins = int(bins)
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+        self.total = 0
+        self.sum = 0.0
+
+    @property
+    def edges(self):
+        return np.linspace(self.low, self.high, self.bins + 1)
+
+    @property
+    def mean(self):
+        return self.sum / self.total if self.total else float("nan")
+
+    def add(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        scaled = (values - self.low) * (self.bins / (self.high - self.low))
+        index = np.clip(scaled.astype(np.int64), 0, self.bins - 1)
+        self.counts += np.bincount(index, minlength=self.bins)
+        self.total += values.size
+        self.sum += float(values.sum())
+
+    def quantile(self, q):
+        """Approximate quantile(s) for ``q`` in [0, 1]."""
+        q = np.asarray(q, dtype=float)
+        if not self.total:
+            return np.full(q.shape, np.nan)
+        cumulative = np.cumsum(self.counts)
+        target = q * self.total
+        index = np.clip(np.searchsorted(cumulative, target, side="left"), 0, self.bins - 1)
+        before = np.where(index > 0, cumulative[index - 1], 0)
+        in_bin = self.counts[index]
+        fraction = np.where(in_bin > 0, (target - before) / np.maximum(in_bin, 1), 0.0)
+        width = (self.high - self.low) / self.bins
+        return self.low + (index + np.clip(fraction, 0.0, 1.0)) * width
+
+    def coarsen(self, bins=DISPLAY_BINS):
+        """Merge the accumulator into at most ``bins`` display bins."""
+        group = max(1, int(np.ceil(self.bins / bins)))
+        padded = np.zeros(group * int(np.ceil(self.bins / group)), dtype=np.int64)
+        padded[:self.bins] = self.counts
+        counts = padded.reshape(-1, group).sum(axis=1)
+        edges = np.linspace(self.low, self.low + (self.high - self.low) * len(padded) / self.bins, len(counts) + 1)
+        return counts, edges
+
+
+def _triangular(rng, low, mode, high, size):
+    if high <= low:
+        return np.full(size, float(mode))
+    return rng.triangular(low, mode, high, size)
+
+
+def simulate(initial_investment, annual_operating, implementation_time,
+             annual_benefits, years, discount_rate=roi.DISCOUNT_RATE,
+             benefit_range=(0.7, 1.3), operating_spread=0.2, schedule_overrun=0.5,
+             draws=DEFAULT_DRAWS, chunk_size=CHUNK_SIZE, seed=None):
+    """Simulate the NPV distribution for one set of ROI Calculator inputs.
+
+    Annual benefits are scaled by a triangular factor over ``benefit_range``
+    (mode 1.0), operating costs vary by ``±operating_spread`` and
+    implementation time runs from 10% early to ``schedule_overrun`` late.
+    Returns P10/P50/P90 NPV, the mean, the probability of a loss and a
+    display histogram.
+    """
+    rng = np.random.default_rng(seed)
+
+    benefit_low, benefit_high = min(benefit_range), max(benefit_range)
+    benefit_mode = min(max(1.0, benefit_low), benefit_high)
+    operating_low, operating_high = 1 - operating_spread, 1 + operating_spread
+    time_low = max(implementation_time * 0.9, 0.5)
+    time_high = max(implementation_time * (1 + schedule_overrun), time_low)
+
+    # NPV is monotone in each sampled input, so the corners bound every draw
+    bounds = roi.evaluate(
+        initial_investment,
+        annual_operating * np.array([operating_high, operating_low]),
+        np.array([time_high, time_low]),
+        annual_benefits * np.array([benefit_low, benefit_high]),
+        years, discount_rate,
+    )["npv"]
+    histogram = StreamingHistogram(bounds.min(), bounds.max())
+    losses = 0
+
+    remaining = int(draws)
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        benefits = annual_benefits * _triangular(rng, benefit_low, benefit_mode, benefit_high, size)
+        operating = annual_operating * _triangular(rng, operating_low, 1.0, operating_high, size)
+        months = _triangular(rng, time_low, max(implementation_time, time_low), time_high, size)
+
+        npv = roi.evaluate(initial_investment, operating, months, benefits, years, discount_rate)["npv"]
+        histogram.add(npv)
+        losses += int(np.count_nonzero(npv < 0))
+        remaining -= size
+
+    p10, p50, p90 = histogram.quantile([0.1, 0.5, 0.9])
+    counts, edges = histogram.coarsen()
+    return {
+        "draws": histogram.total,
+        "p10": float(p10),
+        "p50": float(p50),
+        "p90": float(p90),
+        "mean": histogram.mean,
+        "prob_loss": losses / histogram.total if histogram.total else float("nan"),
+        "histogram_counts": counts,
+        "histogram_edges": edges,
+    }
@@ -0,0 +1,218 @@
+"""Budget-constrained portfolio selection (0/1 knapsack) for the Portfolio Matrix.
+
+The priority ranking orders initiatives by a heuristic score. The optimizer
+answers a different question: which initiatives, taken together, give the
+most value within a fixed budget.
+
+- Value is NPV over ``NPV_YEARS`` or annual benefits, from the figures the
+  Impact Estimation page saves. It can be discounted for each risk rated
+  Medium or High.
+- Cost is ``investment_required``.
+- Initiatives without a saved impact analysis are left out.
+
+There are two solvers:
+
+- An exact depth-first branch-and-bound, used up to ``EXACT_LIMIT``
+  candidates. Its bound is the LP relaxation (fill by value density, then
+  a fraction of the next item), read from prefix sums in O(log n). It stops
+  after ``NODE_LIMIT`` nodes with the best selection found, reported as not
+  proven optimal.
+- A greedy fill by value density, for larger portfolios. It keeps the
+  better of the fill and the single most valuable affordable initiative,
+  which is never worse than half the optimum.
+
+Both honour must-include and must-exclude lists.
+"""
+
+import bisect
+
+import numpy as np
+
+from strategy_mapper import portfolio, roi
+from strategy_mapper.store import ENUM_FIELDS
+
+# Initiatives up to which "Automatic" solves exactly
+EXACT_LIMIT = 500
+
+# Branch-and-bound nodes explored before settling for the best selection so far
+NODE_LIMIT = 200_000
+
+# Analysis period of the NPV objective, as offered by the ROI Calculator
+NPV_YEARS = 3
+
+OBJECTIVES = ["NPV", "Annual benefits"]
+METHODS = ["Automatic", "Exact", "Fast (greedy)"]
+
+# Share of value lost for each technical, business or timeline risk at a level
+RISK_DISCOUNTS = {"Low": 0.0, "Medium": 0.1, "High": 0.25}
+RISK_FIELDS = ["technical_risk", "business_risk", "timeline_risk"]
+
+
+def candidates(store, objective="NPV", risk_adjusted=False):
+    """Name, cost and value of every initiative with a saved impact analysis, indexed by ID."""
+    import pandas as pd
+
+    investment = store.column("investment_required")
+    assessed = ~np.isnan(investment)
+    benefits = store.column("total_benefits", fill=0)
+    if objective == "NPV":
+        months = portfolio.timeline_months(store.codes("timeline"))
+        value = roi.evaluate(np.nan_to_num(investment), 0.0, months, benefits, NPV_YEARS)["npv"]
+    else:
+        value = benefits
+    if risk_adjusted:
+        # Unrated risks (MISSING) are not discounted
+        for field in RISK_FIELDS:
+            discounts = np.array([*(RISK_DISCOUNTS[level] for level in ENUM_FIELDS[field]), 0.0])
+            value = value * (1 - discounts[store.codes(field)])
+    return pd.DataFrame({
+        "name": store.column("name")[assessed],
+        "investment": investment[assessed],
+        "value": value[assessed],
+    }, index=pd.Index(store.ids()[assessed], name="id"))
+
+
+def _constrained(items, budget, include, exclude):
+    """Split ``items`` into must-include positions, remaining budget and open positions."""
+    index = items.index
+    forced = np.flatnonzero(index.isin(list(include)))
+    open_mask = ~index.isin(list(include) + list(exclude))
+    room = budget - float(items["investment"].to_numpy()[forced].sum())
+    if room < 0:
+        raise ValueError(f"The initiatives that must be included cost ${budget - room:,.0f}, "
+                         f"more than the budget of ${budget:,.0f}.")
+    return forced, room, np.flatnonzero(open_mask)
+
+
+def _result(items, positions, method, optimal):
+    chosen = items.iloc[np.sort(positions)]
+    return {
+        "selected": chosen.index.tolist(),
+        "value": float(chosen["value"].sum()),
+        "investment": float(chosen["investment"].sum()),
+        "method": method,
+        "optimal": optimal,
+    }
+
+
+def _by_density(values, costs):
+    # Free initiatives come first; NaN never arises since values are positive
+    with np.errstate(divide="ignore"):
+        density = np.where(costs > 0, values / np.where(costs > 0, costs, 1), np.inf)
+    return np.argsort(-density, kind="stable")
+
+
+def _greedy(values, costs, budget):
+    """Density-ordered fill, or the best single item if that is worth more."""
+    order = _by_density(values, costs)
+    taken = []
+    total = 0.0
+    room = budget
+    for position, cost in zip(order.tolist(), costs[order].tolist()):
+        if cost <= room:
+            room -= cost
+            total += values[position]
+            taken.append(position)
+    affordable = np.flatnonzero(costs <= budget)
+    if len(affordable):
+        best = affordable[np.argmax(values[affordable])]
+        if values[best] > total:
+            return [best]
+    return taken
+
+
+def _branch_and_bound(values, costs, room, node_limit):
+    """Exact 0/1 knapsack by depth-first search; returns the chosen positions and whether the search finished."""
+    order = _by_density(values, costs)
+    values = values[order].tolist()
+    costs = costs[order].tolist()
+    count = len(values)
+    # cumulative[i] is the total of items before i, in density order
+    cumulative_costs = [0.0]
+    cumulative_values = [0.0]
+    for value, cost in zip(values, costs):
+        cumulative_costs.append(cumulative_costs[-1] + cost)
+        cumulative_values.append(cumulative_values[-1] + value)
+
+    def bound(start, value, room):
+        # Whole items from ``start`` while they fit, then a fraction of the next
+        end = bisect.bisect_right(cumulative_costs, cumulative_costs[start] + room, lo=start) - 1
+        value += cumulative_values[end] - cumulative_values[start]
+        if end < count:
+            value += values[end] * (room - (cumulative_costs[end] - cumulative_costs[start])) / costs[end]
+        return value
+
+    best_value = 0.0
+    best_chosen = None
+    nodes = 0
+    finished = True
+    # Each entry is (next item, value, remaining budget, chosen items as a linked list)
+    stack = [(0, 0.0, room, None)]
+    while stack:
+        start, value, room, chosen = stack.pop()
+        if value > best_value:
+            best_value, best_chosen = value, chosen
+        if start == count or bound(start, value, room) <= best_value * (1 + 1e-12):
+            continue
+        nodes += 1
+        if nodes > node_limit:
+            finished = False
+            break
+        # Leaving the item out is explored after taking it
+        stack.append((start + 1, value, room, chosen))
+        if costs[start] <= room:
+            stack.append((start + 1, value + values[start], room - costs[start], (start, chosen)))
+
+    taken = []
+    while best_chosen is not None:
+        taken.append(int(order[best_chosen[0]]))
+        best_chosen = best_chosen[1]
+    return taken, finished
+
+
+def optimize(items, budget, method="Automatic", include=(), exclude=()):
+    """The selection of ``candidates`` rows worth the most within ``budget``.
+
+    ``include`` and ``exclude`` are IDs that must or must not be selected.
+    Returns a dict of the selected IDs (in ``items`` order), their total
+    value and investment, the method used and whether the selection is
+    proven optimal. Raises ValueError if the must-include initiatives alone
+    exceed the budget.
+    """
+    forced, room, open_positions = _constrained(items, budget, include, exclude)
+    values = items["value"].to_numpy()[open_positions]
+    costs = items["investment"].to_numpy()[open_positions]
+    # Initiatives that add no value are never worth selecting
+    useful = values > 0
+    open_positions, values, costs = open_positions[useful], values[useful], costs[useful]
+
+    if method == "Exact" or (method == "Automatic" and len(open_positions) <= EXACT_LIMIT):
+        taken, optimal = _branch_and_bound(values, costs, room, NODE_LIMIT)
+        method = "Exact"
+    else:
+        taken, optimal = _greedy(values, costs, room), False
+        method = "Fast (greedy)"
+    return _result(items, np.concatenate([forced, open_positions[taken]]).astype(np.int64), method, optimal)
+
+
+def ranked_selection(items, order, budget, include=(), exclude=()):
+    """The heuristic's answer: initiatives taken in priority ``order`` while they fit the budget.
+
+    Must-include initiatives are taken first, as in ``optimize``; anything
+    that no longer fits is skipped.
+    """
+    forced, room, open_positions = _constrained(items, budget, include, exclude)
+    open_mask = np.zeros(len(items), dtype=bool)
+    open_mask[open_positions] = True
+    # Initiatives without a saved impact analysis are not in ``items``
+    rows = items.index.get_indexer(order)
+    rows = rows[rows >= 0]
+    rows = rows[open_mask[rows]]
+    taken = []
+    costs = items["investment"].to_numpy()
+    for position, cost in zip(rows.tolist(), costs[rows].tolist()):
+        if cost <= room:
+            room -= cost
+            taken.append(position)
+    return _result(items, np.concatenate([forced, np.array(taken, dtype=np.int64)]).astype(np.int64),
+                   "Priority ranking", False)
@@ -0,0 +1,28 @@
+"""Page registry.
+
+Each page lives in its own module and is imported the first time it is
+shown, so a session only pays for the libraries of the pages it visits.
+"""
+
+import importlib
+
+# Page title -> module in this package, in step order
+PAGE_MODULES = {
+    "Strategic Overview": "strategic_overview",
+    "1. Goal Decomposition": "goal_decomposition",
+    "2. Capability Assessment": "capability_assessment",
+    "3. Initiative Definition": "initiative_definition",
+    "4. Impact Estimation": "impact_estimation",
+    "Portfolio Matrix": "portfolio_matrix",
+    "Stakeholder Alignment": "stakeholder_alignment",
+    "ROI Calculator": "roi_calculator",
+    "Action Plan": "action_plan",
+}
+
+PAGE_ORDER = list(PAGE_MODULES)
+
+
+def render(page):
+    """Import (on first use) and render the module for ``page``."""
+    module = importlib.import_module(f"{__name__}.{PAGE_MODULES[page]}")
+    module.render()
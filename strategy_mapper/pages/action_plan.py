@@ -0,0 +1,300 @@
+"""Action Plan page: prioritized roadmap, quarterly actions and export."""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import streamlit as st
+
+from strategy_mapper import export, figures, portfolio, scheduling, session, timing
+from strategy_mapper.layout import show_navigation_buttons
+
+# How long a rerun waits for a small export before showing it as in progress
+EXPORT_WAIT_SECONDS = 0.2
+EXPORT_POLL_SECONDS = 1
+
+# Default and largest number of initiatives on the roadmap timeline
+ROADMAP_SIZE = 5
+MAX_ROADMAP_SIZE = 20
+
+# Quarters of the schedule shown under Quarterly Action Items, and the
+# initiatives listed for each beyond the primary one
+ACTION_QUARTERS = 4
+QUARTER_LIST_SIZE = 5
+
+# Default concurrent initiatives per owner on the scheduled roadmap
+OWNER_LIMIT = 1
+
+
+def _export_job():
+    return st.session_state.get("export_job")
+
+
+def _start_export(derived_data):
+    key = (derived_data.version("initiatives"), derived_data.version("stakeholders"))
+    job = _export_job()
+    if job is not None and job.key == key:
+        return
+    records = export.report_records(
+        dict(derived_data["portfolio_summary"]),
+        st.session_state.initiatives.frame(),
+        derived_data["priority_index"].ordered(),
+        list(st.session_state.stakeholders),
+    )
+    st.session_state.export_job = export.ExportJob(key, records)
+
+
+def _schedule(derived_data, budget_cap, owner_limit):
+    """The whole portfolio scheduled under the roadmap's limits, kept until the data or limits change."""
+    key = (derived_data.version("initiatives"), st.session_state.roadmap_tie_break, budget_cap, owner_limit)
+    cached = st.session_state.get("roadmap_schedule")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with timing.section("schedule"):
+        scheduled = scheduling.schedule(st.session_state.initiatives, derived_data["priority_index"].ordered(),
+                                        budget_cap, owner_limit)
+    st.session_state.roadmap_schedule = (key, scheduled)
+    return scheduled
+
+
+def _quarter_label(start, quarter):
+    """Calendar quarter, e.g. "Q3 2025", of schedule quarter ``quarter`` counted from ``start``."""
+    month = start + timedelta(days=quarter * scheduling.MONTHS_PER_QUARTER * 30)
+    return f"Q{(month.month - 1) // 3 + 1} {month.year}"
+
+
+def quarterly_actions(scheduled, start):
+    """Focus areas for the first quarters in which scheduled initiatives start."""
+    quarters = scheduled["quarter"].to_numpy()
+    start_months = scheduled["start_month"].to_numpy()
+    end_months = scheduled["end_month"].to_numpy()
+    for quarter in np.unique(quarters)[:ACTION_QUARTERS].tolist():
+        # ``scheduled`` is in priority order, so the first to start leads the quarter
+        starting = scheduled.index[quarters == quarter]
+        first_month = quarter * scheduling.MONTHS_PER_QUARTER
+        in_progress = int(((start_months < first_month) & (end_months > first_month)).sum())
+        with st.expander(f"{_quarter_label(start, quarter)} - Focus Areas"):
+            initiative = st.session_state.initiatives.get(int(starting[0]))
+            st.write(f"**Primary Initiative:** {initiative['name']}")
+            st.write(f"**Business Problem:** {initiative.get('business_problem', 'N/A')}")
+            st.write(f"**Owner:** {initiative.get('owner', 'TBD')}")
+
+            # Phase breakdown
+            if initiative.get('phase1'):
+                st.write(f"**Phase 1:** {initiative['phase1']}")
+            if initiative.get('phase2'):
+                st.write(f"**Phase 2:** {initiative['phase2']}")
+
+            if len(starting) > 1:
+                others = scheduled.loc[starting[1:QUARTER_LIST_SIZE + 1], "name"].tolist()
+                more = len(starting) - 1 - len(others)
+                st.write(f"**Also starting:** {', '.join(others)}" + (f" and {more:,} more" if more else ""))
+
+            # Key actions
+            st.write("**Key Actions:**")
+            if quarter == 0:
+                st.write("• Finalize data requirements and access")
+                st.write("• Assemble project team")
+                st.write("• Set up development environment")
+            else:
+                st.write("• Begin requirements gathering")
+                st.write("• Identify data sources")
+                st.write("• Plan resource allocation")
+            if in_progress:
+                st.write(f"• Complete pilots and gather stakeholder feedback on the {in_progress:,} "
+                         "initiatives already under way")
+
+
+def export_panel():
+    job = _export_job()
+    if job.error is not None:
+        st.error(f"Could not prepare the export: {job.error}")
+    elif not job.done():
+        st.button(f"Preparing export... ({job.rows:,} records)", disabled=True)
+    else:
+        st.download_button(
+            label="Download Action Plan (NDJSON)",
+            data=job.read,
+            file_name=f"ai_strategy_action_plan_{datetime.now().strftime('%Y%m%d')}.ndjson",
+            mime="application/x-ndjson"
+        )
+        st.caption(f"{job.rows:,} records: a summary header, then one line per initiative and stakeholder.")
+        if st.session_state.get("export_polling"):
+            # Stop polling now the file is ready
+            st.session_state.export_polling = False
+            st.rerun()
+        return
+    st.session_state.export_polling = True
+
+
+def _snapshot_directory():
+    from strategy_mapper import snapshot
+
+    # Each workspace sees only its own snapshots
+    return snapshot.default_directory(st.session_state.workspace.workspace_id)
+
+
+def _save_snapshot():
+    from strategy_mapper import snapshot
+
+    name = st.session_state.snapshot_name.strip()
+    if not name:
+        return
+    snapshot.save(
+        snapshot.snapshot_path(_snapshot_directory(), name),
+        st.session_state.initiatives,
+        st.session_state.stakeholders,
+        st.session_state.goals,
+        st.session_state.get("capability_assessment"),
+        st.session_state.get("business_objective"),
+        st.session_state.unit_assessments,
+    )
+    st.session_state.snapshot_message = f"Snapshot '{name}' saved."
+
+
+def _open_snapshot():
+    from strategy_mapper import snapshot
+
+    name = st.session_state.snapshot_choice
+    data = snapshot.load(snapshot.snapshot_path(_snapshot_directory(), name))
+    stakeholder_frame = data.pop("stakeholder_frame")
+    for key, value in data.items():
+        st.session_state[key] = value
+    session.derived_data().prime("stakeholder_frame", stakeholder_frame)
+    st.session_state.snapshot_message = f"Snapshot '{name}' opened."
+
+
+def snapshot_panel():
+    # pyarrow is only imported once the Action Plan page is opened
+    from strategy_mapper import snapshot
+
+    with st.expander("Workspace Snapshots"):
+        st.markdown("Save the whole workspace as a binary snapshot, or reopen a saved one. "
+                    "Snapshots reopen in milliseconds even for very large portfolios.")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.text_input("Snapshot name", key="snapshot_name", placeholder="e.g., Q3 planning")
+            st.button("Save Snapshot", on_click=_save_snapshot)
+        with col2:
+            names = snapshot.list_snapshots(_snapshot_directory())
+            # Drop a remembered choice that is no longer offered, e.g. none
+            # before the first snapshot was saved
+            if st.session_state.get("snapshot_choice") not in names:
+                st.session_state.pop("snapshot_choice", None)
+            st.selectbox("Saved snapshots", names, key="snapshot_choice")
+            st.button("Open Snapshot", on_click=_open_snapshot, disabled=not names)
+
+        message = st.session_state.pop("snapshot_message", None)
+        if message:
+            st.success(message)
+
+
+def render():
+    derived_data = session.derived_data()
+    figure_cache = session.figure_cache()
+
+    st.header("AI Strategy Action Plan")
+    st.markdown("Generate a comprehensive action plan based on your strategic mapping.")
+
+    if not st.session_state.initiatives:
+        st.warning("Please complete the strategic mapping process first.")
+        snapshot_panel()
+    else:
+        # Summary of current state
+        st.subheader("Executive Summary")
+
+        summary = derived_data["portfolio_summary"]
+        total_initiatives = summary["total_initiatives"]
+        high_impact_initiatives = summary["high_impact"]
+        total_investment = summary["total_investment"]
+        avg_roi = summary["average_roi"]
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Initiatives", total_initiatives)
+        with col2:
+            st.metric("High Impact Initiatives", high_impact_initiatives)
+        with col3:
+            st.metric("Total Investment", f"${total_investment:,.0f}")
+        with col4:
+            st.metric("Average Expected ROI", f"{avg_roi:.1f}%")
+
+        # Prioritized roadmap
+        st.subheader("Prioritized Implementation Roadmap")
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            roadmap_size = st.number_input("Initiatives on the roadmap", min_value=1, max_value=MAX_ROADMAP_SIZE,
+                                           value=ROADMAP_SIZE, key="roadmap_size")
+        with col2:
+            st.selectbox("Order equal priorities by", list(portfolio.TIE_BREAKS), key="roadmap_tie_break")
+        with col3:
+            budget_cap = st.number_input("Budget per quarter ($, 0 for no cap)", min_value=0, value=0, step=100000,
+                                         key="roadmap_budget_cap")
+        with col4:
+            owner_limit = st.number_input("Initiatives per owner at once (0 for no limit)", min_value=0,
+                                          value=OWNER_LIMIT, key="roadmap_owner_limit")
+
+        # Every initiative is placed, in priority order, under the quarterly
+        # budget and the owners' limits; the chart shows the top of the list
+        scheduled = _schedule(derived_data, budget_cap or None, owner_limit or None)
+
+        # Timeline visualization
+        # Anchor to today so the chart (and its cache entry) is stable across reruns
+        current_date = datetime.combine(date.today(), datetime.min.time())
+        timeline_df = scheduling.gantt_rows(scheduled, current_date, roadmap_size)
+
+        fig = figure_cache.figure(figures.roadmap_timeline, timeline_df,
+                                  f"Implementation Timeline (Top {roadmap_size} Priorities)")
+        timing.plotly_chart("roadmap_timeline", fig, use_container_width=True)
+
+        st.caption(f"All {len(scheduled):,} initiatives scheduled across "
+                   f"{int(scheduled['quarter'].max()) + 1:,} quarters; the last finishes after "
+                   f"{int(scheduled['end_month'].max()):,} months.")
+        over_budget = int(scheduled["over_budget"].sum())
+        if over_budget:
+            st.warning(f"{over_budget:,} initiatives cost more than the quarterly budget; "
+                       "each starts in a quarter of its own.")
+
+        with st.expander("Full Schedule"):
+            full_df = scheduling.gantt_rows(scheduled, current_date)
+            full_df["Quarter"] = scheduled["quarter"].to_numpy() + 1
+            st.dataframe(full_df, hide_index=True, use_container_width=True)
+
+        # Next steps by quarter
+        st.subheader("Quarterly Action Items")
+
+        # The first quarters of the schedule, each led by its highest-priority start
+        quarterly_actions(scheduled, current_date)
+
+        # Success metrics and KPIs
+        st.subheader("Success Metrics and KPIs")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("**Portfolio-Level Metrics:**")
+            st.write("• Number of initiatives in production")
+            st.write("• Cumulative ROI across all initiatives")
+            st.write("• Time to market for new initiatives")
+            st.write("• Stakeholder satisfaction scores")
+            st.write("• AI capability maturity score")
+
+        with col2:
+            st.write("**Initiative-Level Metrics:**")
+            all_metrics = st.session_state.initiatives.column('primary_metric', fill='')
+
+            for metric in set(all_metrics) - {''}:
+                st.write(f"• {metric}")
+
+        # Export action plan; prepared in the background whenever the data changes
+        _start_export(derived_data)
+        poll = None if _export_job().wait(EXPORT_WAIT_SECONDS) else EXPORT_POLL_SECONDS
+        st.fragment(timing.timed("export_panel")(export_panel), run_every=poll)()
+
+        snapshot_panel()
+
+        st.markdown("---")
+        st.markdown("### Congratulations!")
+        st.markdown("You've completed the AI Strategy Mapping process. Use the insights and action plan to guide your AI transformation journey.")
+        show_navigation_buttons()
@@ -0,0 +1,45 @@
+"""Admin panel: the shared figure cache and the memory held by each live session.
+
+Shown in the sidebar only when the URL carries the admin token; see
+``session.is_admin``.
+"""
+
+import time
+
+import streamlit as st
+
+from strategy_mapper import memory, session
+
+
+def _mib(size):
+    return f"{size / 2**20:,.1f}"
+
+
+def panel():
+    st.markdown("### Server Memory")
+
+    stats = session.figure_cache().stats()
+    budget = f" of {_mib(stats['max_bytes'])}" if stats["max_bytes"] is not None else ""
+    st.markdown(
+        f"**Figure cache:** {stats['entries']:,} figures, {_mib(stats['bytes'])}{budget} MiB  \n"
+        f"{stats['hits']:,} hits, {stats['misses']:,} misses, {stats['evictions']:,} evictions"
+    )
+
+    st.button("Measure this session now", key="admin_measure", on_click=session.account_memory, args=(True,))
+
+    accounts = memory.sessions()
+    st.markdown(f"**Sessions:** {len(accounts):,} live, "
+                f"{_mib(sum(account.total for account in accounts))} MiB measured")
+    now = time.monotonic()
+    rows = [
+        {
+            "Session": account.label,
+            "MiB": round(account.total / 2**20, 1),
+            "Largest": ", ".join(f"{key} ({_mib(size)})" for key, size in list(account.sizes.items())[:3]),
+            "Measured (s ago)": round(now - account.measured_at),
+        }
+        for account in accounts
+        if account.measured_at is not None
+    ]
+    if rows:
+        st.dataframe(rows, use_container_width=True, hide_index=True)
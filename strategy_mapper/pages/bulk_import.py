@@ -0,0 +1,68 @@
+"""Bulk import panel shared by the Capability Assessment, Initiative Definition and Stakeholder Alignment pages."""
+
+import streamlit as st
+
+from strategy_mapper import capability, importer, session
+
+COLUMNS = {
+    "initiatives": (
+        "Required columns: `name`, `business_problem`. Optional: `ai_solution`, `owner`, "
+        "`timeline`, `complexity`, `business_impact`, the phase and metric fields, and the "
+        "Impact Estimation figures."
+    ),
+    "stakeholders": (
+        "Required columns: `name`, `role`. Optional: `influence`, `interest`, `sentiment`, `concerns`."
+    ),
+    "assessments": (
+        "Required column: `name` (the business unit). One column per dimension, using the answers "
+        "offered above: " + ", ".join(f"`{dimension}`" for dimension in capability.DIMENSIONS) + "."
+    ),
+}
+
+
+def _run_import(kind):
+    uploaded = st.session_state.get(f"{kind}_import_file")
+    if uploaded is None:
+        return
+    try:
+        fmt = importer.file_format(uploaded.name)
+    except ValueError as exc:
+        st.session_state[f"{kind}_import_result"] = {"failed": str(exc)}
+        return
+
+    uploaded.seek(0)
+    rows = importer.iter_rows(uploaded, fmt, kind)
+    if kind == "initiatives":
+        result = importer.import_initiatives(st.session_state.initiatives, rows)
+    elif kind == "assessments":
+        result = importer.import_assessments(st.session_state.unit_assessments, rows)
+        session.derived_data().invalidate("unit_assessments")
+    else:
+        result = importer.import_stakeholders(st.session_state.stakeholders, rows)
+        session.derived_data().invalidate("stakeholders")
+    st.session_state[f"{kind}_import_result"] = result
+
+
+def panel(kind):
+    """File upload and import button for ``kind`` ("initiatives", "stakeholders" or "assessments")."""
+    with st.expander(f"Bulk Import {kind.title()}"):
+        st.markdown(f"Upload a CSV, JSON or NDJSON file with one {kind[:-1]} per row. {COLUMNS[kind]}")
+        st.file_uploader("Import file", type=list(importer.FORMATS), key=f"{kind}_import_file")
+        # Runs as a callback so the sidebar and lists below already include the new rows
+        st.button("Import", key=f"{kind}_import", on_click=_run_import, args=(kind,))
+
+        result = st.session_state.pop(f"{kind}_import_result", None)
+        if result is None:
+            return
+        if "failed" in result:
+            st.error(result["failed"])
+            return
+
+        st.success(f"Imported {result['added']:,} of {result['rows']:,} rows.")
+        if result["error_count"]:
+            skipped = result["error_count"]
+            st.warning(f"{skipped:,} row{' was' if skipped == 1 else 's were'} skipped.")
+            rows, messages = zip(*result["errors"])
+            st.dataframe({"Row": rows, "Error": messages}, use_container_width=True, hide_index=True)
+            if result["error_count"] > len(result["errors"]):
+                st.caption(f"Showing the first {len(result['errors']):,} errors.")
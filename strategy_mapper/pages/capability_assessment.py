@@ -0,0 +1,145 @@
+"""Step 2: score organisational readiness across nine dimensions."""
+
+import streamlit as st
+
+from strategy_mapper import capability, figures, session, timing
+from strategy_mapper.layout import show_navigation_buttons
+from strategy_mapper.pages import bulk_import
+
+# Business units overlaid on the comparison radar by default, and at most
+RADAR_UNITS = 5
+MAX_RADAR_UNITS = 10
+
+
+# Answer changes rerun only this fragment, not the business-unit charts below
+@st.fragment
+@timing.timed("assessment_form")
+def assessment_form():
+    figure_cache = session.figure_cache()
+
+    st.subheader("Assessment Dimensions")
+
+    # Data Readiness
+    with st.expander("Data Readiness", expanded=True):
+        data_quality = st.selectbox("Data Quality", capability.OPTIONS["data_quality"])
+        data_availability = st.selectbox("Data Availability", capability.OPTIONS["data_availability"])
+        data_governance = st.selectbox("Data Governance", capability.OPTIONS["data_governance"])
+
+    # Technical Capabilities
+    with st.expander("Technical Capabilities"):
+        ai_expertise = st.selectbox("AI/ML Expertise", capability.OPTIONS["ai_expertise"])
+        infrastructure = st.selectbox("Technical Infrastructure", capability.OPTIONS["infrastructure"])
+        dev_ops = st.selectbox("MLOps Maturity", capability.OPTIONS["dev_ops"])
+
+    # Organizational Readiness
+    with st.expander("Organizational Readiness"):
+        leadership_support = st.selectbox("Leadership Support", capability.OPTIONS["leadership_support"])
+        change_readiness = st.selectbox("Change Management", capability.OPTIONS["change_readiness"])
+        budget_availability = st.selectbox("Budget Availability", capability.OPTIONS["budget_availability"])
+
+    # Calculate overall readiness score
+    levels = {
+        "data_quality": data_quality,
+        "data_availability": data_availability,
+        "data_governance": data_governance,
+        "ai_expertise": ai_expertise,
+        "infrastructure": infrastructure,
+        "dev_ops": dev_ops,
+        "leadership_support": leadership_support,
+        "change_readiness": change_readiness,
+        "budget_availability": budget_availability
+    }
+    readiness_percentage = capability.readiness(levels)
+
+    # Display readiness score
+    st.subheader("Overall Readiness Score")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Readiness Score", f"{readiness_percentage:.0f}%")
+        if readiness_percentage >= 75:
+            st.success("High readiness - Ready for complex AI initiatives")
+        elif readiness_percentage >= 50:
+            st.warning("Medium readiness - Start with focused pilots")
+        else:
+            st.error("Low readiness - Foundation building needed")
+
+    with col2:
+        # Readiness radar chart
+        categories = list(capability.DIMENSIONS.values())
+        values = capability.points(levels)
+
+        fig = figure_cache.figure(figures.readiness_radar, categories, values)
+        timing.plotly_chart("readiness_radar", fig, use_container_width=True)
+
+    if st.button("Save Capability Assessment"):
+        st.session_state.capability_assessment = {
+            "readiness_score": readiness_percentage,
+            "scores": levels
+        }
+        st.success("Assessment saved! Proceed to Initiative Definition.")
+        # Fragment reruns skip the autosave at the end of the app script
+        session.autosave()
+
+
+def _clear_units():
+    st.session_state.unit_assessments = []
+    session.derived_data().invalidate("unit_assessments")
+
+
+def business_units():
+    """Readiness of many business units, imported from a file and ranked."""
+    derived_data = session.derived_data()
+    figure_cache = session.figure_cache()
+
+    st.subheader("Business Unit Assessments")
+    st.markdown("Import assessments for several business units to rank and compare their readiness.")
+    bulk_import.panel("assessments")
+
+    if not st.session_state.unit_assessments:
+        return
+
+    # Scored once per import, not on every widget change
+    ranked = derived_data["unit_readiness"]
+    dimensions = list(capability.DIMENSIONS)
+    categories = list(capability.DIMENSIONS.values())
+
+    st.dataframe(
+        ranked[["rank", "name", "readiness"] + dimensions].rename(
+            columns={"rank": "Rank", "name": "Business unit", "readiness": "Readiness (%)", **capability.DIMENSIONS}
+        ),
+        use_container_width=True, hide_index=True,
+        column_config={"Readiness (%)": st.column_config.NumberColumn(format="%.0f")}
+    )
+    st.button("Clear business units", key="clear_units", on_click=_clear_units)
+
+    units = ranked["name"].tolist()
+    if "radar_units" not in st.session_state:
+        st.session_state.radar_units = units[:RADAR_UNITS]
+    else:
+        # Keep the selection valid after units are cleared or re-imported
+        known = set(units)
+        st.session_state.radar_units = [unit for unit in st.session_state.radar_units if unit in known]
+    compared = st.multiselect(
+        "Business units on the radar", units, max_selections=MAX_RADAR_UNITS, key="radar_units"
+    )
+    if compared:
+        rows = ranked.set_index("name").loc[compared, dimensions]
+        fig = figure_cache.figure(figures.readiness_radar_comparison, categories, compared, rows.to_numpy())
+        timing.plotly_chart("readiness_comparison", fig, use_container_width=True)
+
+    fig = figure_cache.figure(figures.readiness_heatmap, categories, units, ranked[dimensions].to_numpy())
+    timing.plotly_chart("readiness_heatmap", fig, use_container_width=True)
+
+
+def render():
+    st.header("Step 2: Capability Assessment")
+    st.markdown("Evaluate your organization's readiness across key dimensions.")
+
+    assessment_form()
+
+    st.markdown("---")
+    business_units()
+
+    st.markdown("---")
+    show_navigation_buttons()
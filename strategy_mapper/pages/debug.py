@@ -0,0 +1,39 @@
+"""Debug panel: where this session's reruns spend their time.
+
+Shown in the sidebar when timings are switched on and the URL has
+``?debug``; see ``strategy_mapper.timing``.
+"""
+
+import streamlit as st
+
+from strategy_mapper import timing
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
+
+def panel():
+    st.markdown("### Rerun Timings")
+
+    timings = st.session_state.get(timing.STATE_KEY)
+    if timings is None or timings.last_seconds is None:
+        st.caption("No completed run yet.")
+        return
+
+    st.markdown(f"**Last full run:** {_ms(timings.last_seconds):,} ms on {timings.page}")
+    st.caption("Sections of the last run (a fragment rerun replaces the list):")
+    if timings.last_run:
+        st.dataframe(
+            [{"Section": section, "ms": _ms(seconds)} for section, seconds in timings.last_run],
+            use_container_width=True, hide_index=True
+        )
+
+    st.markdown("**Slowest sections this session:**")
+    st.dataframe(
+        [
+            {"Page": page, "Section": section, "Runs": runs, "Mean ms": _ms(mean), "Max ms": _ms(slowest)}
+            for page, section, runs, mean, slowest in timings.slowest()
+        ],
+        use_container_width=True, hide_index=True
+    )
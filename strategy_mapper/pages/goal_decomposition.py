@@ -0,0 +1,84 @@
+"""Step 1: break the business objective into measurable goals."""
+
+import streamlit as st
+
+from strategy_mapper import session, timing
+from strategy_mapper.layout import show_navigation_buttons
+
+
+def _add_goal():
+    new_goal = st.session_state.new_goal
+    if new_goal and new_goal not in st.session_state.goals:
+        st.session_state.goals.append(new_goal)
+        session.derived_data().invalidate("goals")
+
+
+def _remove_goal(goal):
+    st.session_state.goals.remove(goal)
+    session.derived_data().invalidate("goals")
+
+
+def render():
+    st.markdown("## Step 1: Goal Decomposition")
+
+    st.info("Break down broad business objectives into specific, measurable, AI-relevant goals that drive meaningful outcomes.")
+
+    # Business objective input
+    st.markdown("### Primary Business Objective")
+    business_objective = st.text_area(
+        "What is your main business challenge or opportunity?",
+        value=st.session_state.get("business_objective", ""),
+        placeholder="Example: Reduce customer churn by 15% while improving customer satisfaction",
+        help="Be specific about what you want to achieve"
+    )
+
+    # Goals definition
+    st.markdown("### Decomposed Goals")
+    st.markdown("Break down your objective into specific, measurable AI-relevant goals.")
+
+    goal_editor()
+
+    # Save button
+    if st.button("Save Goals", use_container_width=True):
+        st.session_state.business_objective = business_objective
+        st.success("✓ Goals saved successfully!")
+
+        # Auto-advance
+        if st.session_state.goals:
+            st.session_state.current_page = "2. Capability Assessment"
+            st.rerun()
+
+    show_navigation_buttons()
+
+
+# Adding or removing a goal reruns only this fragment
+@st.fragment
+@timing.timed("goal_editor")
+def goal_editor():
+    # Add new goal
+    with st.container():
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.text_input(
+                "Goal Description",
+                key="new_goal",
+                placeholder="Example: Implement predictive analytics to identify at-risk customers",
+                label_visibility="collapsed"
+            )
+
+        with col2:
+            st.button("Add Goal", use_container_width=True, on_click=_add_goal)
+
+    # Display existing goals
+    if st.session_state.goals:
+        st.markdown("### Goal Summary")
+        for i, goal in enumerate(st.session_state.goals):
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.write(f"{i+1}. {goal}")
+            with col2:
+                st.button("Remove", key=f"remove_goal_{i}", on_click=_remove_goal, args=(goal,))
+
+    # Fragment reruns do not reach the autosave at the end of app.py
+    session.autosave()
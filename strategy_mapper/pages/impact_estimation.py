@@ -0,0 +1,92 @@
+"""Step 4: estimate financial and operational impact per initiative."""
+
+import streamlit as st
+
+from strategy_mapper import roi as roi_engine
+
+
+def render():
+    st.header("Step 4: Impact Estimation")
+    st.markdown("Calculate expected business value and resource requirements for each initiative.")
+
+    if not st.session_state.initiatives:
+        st.warning("Please define some initiatives first in Step 3.")
+    else:
+        # Select initiative to analyze
+        initiative_names = st.session_state.initiatives.names()
+        selected_initiative = st.selectbox("Select Initiative to Analyze", initiative_names)
+
+        if selected_initiative:
+            # Find the selected initiative
+            initiative_id = st.session_state.initiatives.id_for(selected_initiative)
+
+            st.subheader(f"Impact Analysis: {selected_initiative}")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.subheader("Financial Impact")
+                cost_savings = st.number_input("Annual Cost Savings ($)", min_value=0.0, step=1000.0)
+                revenue_increase = st.number_input("Annual Revenue Increase ($)", min_value=0.0, step=1000.0)
+                risk_reduction = st.number_input("Risk Reduction Value ($)", min_value=0.0, step=1000.0)
+
+                st.subheader("💸 Investment Required")
+                technology_cost = st.number_input("Technology Costs ($)", min_value=0.0, step=1000.0)
+                personnel_cost = st.number_input("Personnel Costs ($)", min_value=0.0, step=1000.0)
+                infrastructure_cost = st.number_input("Infrastructure Costs ($)", min_value=0.0, step=1000.0)
+
+            with col2:
+                st.subheader("Operational Impact")
+                efficiency_gain = st.slider("Process Efficiency Gain (%)", 0, 100, 10)
+                quality_improvement = st.slider("Quality Improvement (%)", 0, 100, 5)
+                time_savings = st.slider("Time Savings (%)", 0, 100, 15)
+
+                st.subheader("Risk Assessment")
+                technical_risk = st.selectbox("Technical Risk", ["Low", "Medium", "High"])
+                business_risk = st.selectbox("Business Risk", ["Low", "Medium", "High"])
+                timeline_risk = st.selectbox("Timeline Risk", ["Low", "Medium", "High"])
+
+            # Calculate ROI and payback
+            total_benefits = cost_savings + revenue_increase + risk_reduction
+            total_investment = technology_cost + personnel_cost + infrastructure_cost
+
+            roi, payback_period = (float(value) for value in roi_engine.impact_roi(total_benefits, total_investment))
+
+            # Display results
+            st.subheader("Financial Analysis")
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric("Total Benefits", f"${total_benefits:,.0f}")
+            with col2:
+                st.metric("Total Investment", f"${total_investment:,.0f}")
+            with col3:
+                st.metric("Expected ROI", f"{roi:.1f}%")
+            with col4:
+                if payback_period != float('inf'):
+                    st.metric("Payback Period", f"{payback_period:.1f} years")
+                else:
+                    st.metric("Payback Period", "N/A")
+
+            # Save impact data
+            if st.button("Save Impact Analysis"):
+                # Update the initiative with impact data
+                st.session_state.initiatives.update(initiative_id, {
+                    'cost_savings': cost_savings,
+                    'revenue_increase': revenue_increase,
+                    'risk_reduction': risk_reduction,
+                    'technology_cost': technology_cost,
+                    'personnel_cost': personnel_cost,
+                    'infrastructure_cost': infrastructure_cost,
+                    'total_benefits': total_benefits,
+                    'investment_required': total_investment,
+                    'expected_roi': roi,
+                    'payback_period': payback_period,
+                    'efficiency_gain': efficiency_gain,
+                    'quality_improvement': quality_improvement,
+                    'time_savings': time_savings,
+                    'technical_risk': technical_risk,
+                    'business_risk': business_risk,
+                    'timeline_risk': timeline_risk
+                })
+                st.success("Impact analysis saved!")
@@ -0,0 +1,131 @@
+"""Step 3: define AI initiatives with scope, ownership and phases."""
+
+import time
+
+import streamlit as st
+
+from strategy_mapper import timing
+from strategy_mapper.pages import bulk_import
+
+# Initiatives shown per page of the list; every expander costs a few
+# elements on each rerun of the list fragment
+LIST_PAGE_SIZE = 25
+
+# Form widget keys -> initiative fields
+FORM_FIELDS = {
+    "initiative_name": "name",
+    "initiative_business_problem": "business_problem",
+    "initiative_ai_solution": "ai_solution",
+    "initiative_owner": "owner",
+    "initiative_timeline": "timeline",
+    "initiative_complexity": "complexity",
+    "initiative_business_impact": "business_impact",
+    "initiative_phase1": "phase1",
+    "initiative_phase2": "phase2",
+    "initiative_phase3": "phase3",
+    "initiative_primary_metric": "primary_metric",
+    "initiative_secondary_metrics": "secondary_metrics",
+}
+
+
+def _add_initiative():
+    initiative = {field: st.session_state[key] for key, field in FORM_FIELDS.items()}
+    if not (initiative["name"] and initiative["business_problem"]):
+        return
+    if initiative["name"] in st.session_state.initiatives:
+        st.session_state.initiative_form_error = (
+            f"An initiative named '{initiative['name']}' already exists. Please choose a different name."
+        )
+        return
+
+    initiative["created_at"] = time.time()
+    st.session_state.initiatives.add(initiative)
+    st.session_state.initiative_form_error = None
+    st.toast(f"Initiative '{initiative['name']}' added successfully!")
+    # Only the list and the sidebar metrics depend on the new initiative
+    st.rerun(["initiative_list", "portfolio_metrics"])
+
+
+def _remove_initiative(initiative_id):
+    st.session_state.initiatives.remove(initiative_id)
+    st.rerun(["initiative_list", "portfolio_metrics"])
+
+
+def render():
+    st.header("Step 3: Initiative Definition")
+    st.markdown("Define concrete AI initiatives with clear scope, ownership, and phases.")
+
+    with st.form("initiative_form"):
+        st.subheader("New AI Initiative")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.text_input("Initiative Name", key="initiative_name", placeholder="e.g., Customer Churn Prediction")
+            st.text_area("Business Problem", key="initiative_business_problem",
+                placeholder="Describe the specific business problem this will solve")
+            st.text_area("AI Solution", key="initiative_ai_solution",
+                placeholder="Describe the AI approach and technology")
+
+        with col2:
+            st.text_input("Initiative Owner", key="initiative_owner", placeholder="Name and department")
+            st.selectbox("Timeline", ["3-6 months", "6-12 months", "12+ months"], key="initiative_timeline")
+            st.selectbox("Technical Complexity", ["Low", "Medium", "High"], key="initiative_complexity")
+            st.selectbox("Expected Business Impact", ["Low", "Medium", "High"], key="initiative_business_impact")
+
+        # Phases
+        st.subheader("Implementation Phases")
+        st.text_input("Phase 1 (Pilot)", key="initiative_phase1", placeholder="e.g., Train model and test on historical data")
+        st.text_input("Phase 2 (MVP)", key="initiative_phase2", placeholder="e.g., Run controlled pilot with business users")
+        st.text_input("Phase 3 (Scale)", key="initiative_phase3", placeholder="e.g., Roll out to all business units")
+
+        # Success metrics
+        st.subheader("Success Metrics")
+        st.text_input("Primary Metric", key="initiative_primary_metric", placeholder="e.g., Reduce churn rate by 20%")
+        st.text_area("Secondary Metrics", key="initiative_secondary_metrics",
+            placeholder="e.g., Improve customer lifetime value, Reduce support tickets")
+
+        st.form_submit_button("Add Initiative", on_click=_add_initiative)
+
+        if st.session_state.get("initiative_form_error"):
+            st.error(st.session_state.initiative_form_error)
+
+    bulk_import.panel("initiatives")
+
+    initiative_list()
+
+
+# Removing or adding an initiative reruns only this list and the sidebar metrics
+@st.fragment(key="initiative_list")
+@timing.timed("initiative_list")
+def initiative_list():
+    # Display existing initiatives
+    initiatives = st.session_state.initiatives
+    if initiatives:
+        st.subheader("Current Initiatives")
+
+        ids = initiatives.ids()
+        page_count = -(-len(ids) // LIST_PAGE_SIZE)
+        page = 1
+        if page_count > 1:
+            # Removing the last initiative on the last page leaves it empty
+            if st.session_state.get("initiative_list_page", 1) > page_count:
+                st.session_state.initiative_list_page = page_count
+            page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count,
+                                   key="initiative_list_page")
+        start = (page - 1) * LIST_PAGE_SIZE
+
+        for initiative in initiatives.records(ids[start:start + LIST_PAGE_SIZE]):
+            with st.expander(f"{initiative['name']} - {initiative['business_impact']} Impact"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**Problem:** {initiative['business_problem']}")
+                    st.write(f"**Solution:** {initiative.get('ai_solution', '')}")
+                    st.write(f"**Owner:** {initiative.get('owner', '')}")
+                with col2:
+                    st.write(f"**Timeline:** {initiative['timeline']}")
+                    st.write(f"**Complexity:** {initiative['complexity']}")
+                    st.write(f"**Primary Metric:** {initiative.get('primary_metric', '')}")
+
+                st.button("Remove", key=f"remove_{initiative['id']}",
+                          on_click=_remove_initiative, args=(initiative['id'],))
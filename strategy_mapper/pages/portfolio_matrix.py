@@ -0,0 +1,227 @@
+"""Portfolio Matrix page: initiatives by complexity vs. business impact."""
+
+import streamlit as st
+
+from strategy_mapper import figures, optimizer, portfolio, session, timing
+from strategy_mapper.layout import item_list
+
+# Quadrant, heading, description and empty-state message, in display order
+RECOMMENDATIONS = [
+    ("Quick Wins", "Priority 1: Quick Wins", None, "No quick wins identified"),
+    ("Strategic Bets", "Priority 2: Strategic Bets", None, "No strategic bets identified"),
+    ("Question Marks", "❓ Review Needed", "High complexity, low impact initiatives:", "No initiatives need review"),
+    ("Fill-ins", "Fill-ins", "Low complexity, low impact initiatives:", "No fill-ins identified"),
+]
+
+# Default and largest portfolio plotted point by point; above it the chart
+# shows one bubble per cell
+POINT_LIMIT = 5_000
+MAX_POINT_LIMIT = 50_000
+
+# Rows listed when drilling into a cell, highest ROI first
+DRILL_DOWN_ROWS = 1_000
+
+# Initiatives offered as must-include/exclude choices, highest priority first
+CONSTRAINT_OPTIONS = 1_000
+
+LEVEL_NAMES = {score: level for level, score in portfolio.LEVEL_SCORES.items()}
+
+
+def _cell_label(cell):
+    complexity, impact = cell
+    return f"{LEVEL_NAMES[complexity]} complexity, {LEVEL_NAMES[impact]} impact"
+
+
+def _select_cell():
+    # A clicked bubble picks the cell shown in the drill-down
+    points = st.session_state.matrix_cells_chart.selection.points
+    if points:
+        st.session_state.matrix_cell = (round(points[0]["x"]), round(points[0]["y"]))
+
+
+def cell_drill_down(df, cells):
+    """The initiatives in one matrix cell, chosen from the list or by clicking its bubble."""
+    options = list(zip(cells['complexity'].tolist(), cells['impact'].tolist()))
+    counts = dict(zip(options, cells['count'].tolist()))
+    if st.session_state.get("matrix_cell") not in options:
+        st.session_state.pop("matrix_cell", None)
+    cell = st.selectbox("Drill down into cell", options, key="matrix_cell",
+                        format_func=lambda cell: f"{_cell_label(cell)} ({counts[cell]:,} initiatives)")
+    complexity, impact = cell
+    members = df[(df['complexity'] == complexity) & (df['impact'] == impact)]
+    shown = members.nlargest(DRILL_DOWN_ROWS, 'roi')
+    st.dataframe(
+        shown[['name', 'quadrant', 'investment', 'roi']].rename(columns={
+            'name': 'Initiative', 'quadrant': 'Quadrant', 'investment': 'Investment', 'roi': 'Expected ROI (%)'
+        }),
+        use_container_width=True, hide_index=True
+    )
+    if len(members) > len(shown):
+        st.caption(f"Showing the {len(shown):,} highest-ROI of {len(members):,} initiatives in this cell.")
+
+
+def _optimize(derived_data, items, budget, method, include, exclude):
+    """The optimizer's and the ranking's selections, kept until the data or settings change."""
+    key = (derived_data.version("initiatives"), st.session_state.get("roadmap_tie_break"),
+           st.session_state.optimizer_objective, st.session_state.optimizer_risk_adjusted,
+           budget, method, tuple(include), tuple(exclude))
+    cached = st.session_state.get("portfolio_optimization")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with timing.section("optimize"):
+        results = (
+            optimizer.optimize(items, budget, method, include, exclude),
+            optimizer.ranked_selection(items, derived_data["priority_index"].ordered(), budget, include, exclude),
+        )
+    st.session_state.portfolio_optimization = (key, results)
+    return results
+
+
+def optimizer_panel():
+    """Budget optimizer: the initiatives worth the most within a budget, against the priority ranking."""
+    derived_data = session.derived_data()
+
+    st.subheader("Budget Optimizer")
+    st.markdown("The recommendations above follow the priority ranking. The optimizer instead picks the "
+                "set of initiatives worth the most in total within a fixed budget.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        objective = st.selectbox("Maximize", optimizer.OBJECTIVES, key="optimizer_objective",
+                                 format_func=lambda name: f"NPV ({optimizer.NPV_YEARS} years)"
+                                 if name == "NPV" else name)
+    with col2:
+        risk_adjusted = st.checkbox("Discount value for Medium and High risks", key="optimizer_risk_adjusted",
+                                    help="Each Medium risk takes 10% off the value, each High risk 25%.")
+
+    items = optimizer.candidates(st.session_state.initiatives, objective, risk_adjusted)
+    if items.empty:
+        st.info("Save an impact analysis for some initiatives to optimize the portfolio.")
+        return
+    if "optimizer_budget" not in st.session_state:
+        st.session_state.optimizer_budget = round(float(items["investment"].sum()) / 2, -3)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        budget = st.number_input("Budget ($)", min_value=0.0, step=100000.0, key="optimizer_budget")
+    with col2:
+        method = st.selectbox("Method", optimizer.METHODS, key="optimizer_method",
+                              help=f"Automatic solves exactly up to {optimizer.EXACT_LIMIT:,} initiatives "
+                                   "and uses the fast greedy fill above that.")
+
+    # Constraint choices: the highest priorities, plus anything already chosen
+    names = dict(zip(items.index.tolist(), items["name"].tolist()))
+    options = [initiative_id for initiative_id in derived_data["priority_index"].top(CONSTRAINT_OPTIONS)
+               if initiative_id in names]
+    chosen = set(st.session_state.get("optimizer_include", [])) | set(st.session_state.get("optimizer_exclude", []))
+    options += sorted(chosen.difference(options).intersection(names))
+    col1, col2 = st.columns(2)
+    with col1:
+        include = st.multiselect("Must include", options, key="optimizer_include", format_func=names.get)
+    with col2:
+        exclude = st.multiselect("Must exclude", options, key="optimizer_exclude", format_func=names.get)
+    if len(items) > CONSTRAINT_OPTIONS:
+        st.caption(f"Constraints can be set on the {CONSTRAINT_OPTIONS:,} highest-priority initiatives.")
+    if set(include) & set(exclude):
+        st.error("An initiative cannot be both included and excluded.")
+        return
+
+    try:
+        best, ranked = _optimize(derived_data, items, budget, method, include, exclude)
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Optimized Value", f"${best['value']:,.0f}",
+                  delta=f"${best['value'] - ranked['value']:,.0f} vs. ranking")
+    with col2:
+        st.metric("Ranking Value", f"${ranked['value']:,.0f}")
+    with col3:
+        st.metric("Initiatives Selected", f"{len(best['selected']):,}",
+                  delta=f"{len(best['selected']) - len(ranked['selected']):,} vs. ranking", delta_color="off")
+    note = "proven optimal" if best["optimal"] else (
+        "best found before the search limit" if best["method"] == "Exact" else "approximate")
+    st.caption(f"{best['method']}, {note}: ${best['investment']:,.0f} of ${budget:,.0f} committed. "
+               f"The ranking takes initiatives in priority order while they fit and commits "
+               f"${ranked['investment']:,.0f}.")
+
+    selected = items.loc[best["selected"]]
+    in_ranking = selected.index.isin(ranked["selected"])
+    st.dataframe(
+        selected.assign(in_ranking=in_ranking).nlargest(DRILL_DOWN_ROWS, "value")[
+            ["name", "investment", "value", "in_ranking"]
+        ].rename(columns={
+            "name": "Initiative", "investment": "Investment", "value": "Value", "in_ranking": "Also Ranked"
+        }),
+        use_container_width=True, hide_index=True
+    )
+    if len(selected) > DRILL_DOWN_ROWS:
+        st.caption(f"Showing the {DRILL_DOWN_ROWS:,} most valuable of {len(selected):,} selected initiatives.")
+
+    def bullets(initiatives):
+        return "- " + initiatives["name"]
+
+    added = selected[~in_ranking]
+    dropped = items.loc[ranked["selected"]]
+    dropped = dropped[~dropped.index.isin(best["selected"])]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write(f"**Added by the optimizer** ({len(added):,})")
+        item_list(added.nlargest(DRILL_DOWN_ROWS, "value"), bullets, ["name", "investment", "value"])
+    with col2:
+        st.write(f"**Ranked but not selected** ({len(dropped):,})")
+        item_list(dropped.nlargest(DRILL_DOWN_ROWS, "value"), bullets, ["name", "investment", "value"])
+
+
+def render():
+    derived_data = session.derived_data()
+    figure_cache = session.figure_cache()
+
+    st.header("AI Initiative Portfolio Matrix")
+    st.markdown("Visualize your AI initiatives by complexity vs. business impact to guide prioritization.")
+
+    if not st.session_state.initiatives:
+        st.warning("Please define some initiatives first.")
+    else:
+        # Create portfolio matrix
+        df = derived_data["scored_initiatives"]
+
+        point_limit = st.number_input(
+            "Plot individual initiatives up to", min_value=100, max_value=MAX_POINT_LIMIT,
+            value=POINT_LIMIT, step=1_000, key="matrix_point_limit",
+            help="Larger portfolios are shown as one bubble per cell, so the chart stays quick to load."
+        )
+        if len(df) <= point_limit:
+            # Create scatter plot
+            fig = figure_cache.figure(figures.portfolio_matrix, df)
+            timing.plotly_chart("portfolio_matrix", fig, use_container_width=True)
+        else:
+            cells = portfolio.matrix_cells(df)
+            fig = figure_cache.figure(figures.portfolio_matrix_cells, cells)
+            timing.plotly_chart("portfolio_matrix_cells", fig, use_container_width=True, key="matrix_cells_chart",
+                                on_select=_select_cell, selection_mode="points")
+            cell_drill_down(df, cells)
+
+        # Recommendations
+        st.subheader("Portfolio Recommendations")
+
+        quadrant = df['quadrant']
+
+        def names(initiatives):
+            return "- " + initiatives['name']
+
+        columns = st.columns(4)
+        for column, (label, heading, description, empty) in zip(columns, RECOMMENDATIONS):
+            with column:
+                st.subheader(heading)
+                initiatives = df[quadrant == label]
+                if not initiatives.empty:
+                    if description:
+                        st.write(description)
+                    item_list(initiatives, names, ['name'])
+                else:
+                    st.write(empty)
+
+        st.fragment(timing.timed("optimizer_panel")(optimizer_panel))()
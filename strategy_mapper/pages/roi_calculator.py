@@ -0,0 +1,180 @@
+"""ROI Calculator page: scenarios, sensitivity and Monte Carlo simulation."""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from strategy_mapper import figures, montecarlo, sensitivity, session, timing
+from strategy_mapper import roi as roi_engine
+from strategy_mapper.layout import show_navigation_buttons
+
+# Input sets kept by the process-wide surface and simulation caches, and for
+# how long. A surface is about 16 KB and a simulation summary about 1.3 KB,
+# so together they stay under 20 MB however many sessions are open
+CACHE_ENTRIES = 1_000
+CACHE_TTL_SECONDS = 3600
+
+
+def render():
+    figure_cache = session.figure_cache()
+
+    st.header("AI Initiative ROI Calculator")
+    st.markdown("Calculate detailed return on investment for AI initiatives using multiple scenarios.")
+
+    # Scenario-based calculator
+    st.subheader("Scenario Analysis")
+
+    # Base inputs
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Investment Costs")
+        initial_investment = st.number_input("Initial Investment ($)", min_value=0.0, step=10000.0, value=100000.0)
+        annual_operating = st.number_input("Annual Operating Costs ($)", min_value=0.0, step=5000.0, value=25000.0)
+        implementation_time = st.number_input("Implementation Time (months)", min_value=1, max_value=36, value=6)
+        discount_rate = st.number_input("Discount Rate (%)", min_value=0.0, max_value=50.0, step=0.5,
+                                        value=roi_engine.DISCOUNT_RATE * 100) / 100
+
+    with col2:
+        st.subheader("Benefit Categories")
+        cost_reduction = st.number_input("Annual Cost Reduction ($)", min_value=0.0, step=10000.0, value=150000.0)
+        revenue_increase = st.number_input("Annual Revenue Increase ($)", min_value=0.0, step=10000.0, value=75000.0)
+        productivity_gain = st.number_input("Annual Productivity Value ($)", min_value=0.0, step=5000.0, value=50000.0)
+
+    # Scenario modeling
+    st.subheader("Scenario Modeling")
+    conservative_factor = st.slider("Conservative Scenario (%)", 50, 90, 70) / 100
+    optimistic_factor = st.slider("Optimistic Scenario (%)", 110, 200, 130) / 100
+
+    # Calculate scenarios
+    annual_benefits = cost_reduction + revenue_increase + productivity_gain
+    factors = roi_engine.scenario_factors(conservative_factor, optimistic_factor)
+    scenario_benefits = annual_benefits * factors
+
+    # Multi-year analysis
+    years = st.selectbox("Analysis Period (years)", sensitivity.ANALYSIS_PERIODS, index=2)
+
+    # NPV over every slider position and analysis period is precomputed once per
+    # set of base inputs, so scenario slider moves are array lookups
+    base_inputs = {
+        "initial_investment": initial_investment,
+        "annual_operating": annual_operating,
+        "implementation_time": implementation_time,
+        "cost_reduction": cost_reduction,
+        "revenue_increase": revenue_increase,
+        "productivity_gain": productivity_gain,
+        "discount_rate": discount_rate
+    }
+    build_surface = st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES,
+                                  ttl=CACHE_TTL_SECONDS)(sensitivity.NPVSurface)
+    surface = build_surface(base_inputs)
+    results = surface.lookup(factors, years)
+
+    results_df = pd.DataFrame({
+        "Scenario": roi_engine.SCENARIO_NAMES,
+        "Annual Benefits": scenario_benefits,
+        "NPV": results["npv"],
+        "ROI": results["roi"],
+        "Payback (years)": results["payback"]
+    })
+
+    # Display results
+    st.subheader("Financial Analysis Results")
+    st.dataframe(
+        results_df.style.format({
+            "Annual Benefits": "${:,.0f}",
+            "NPV": "${:,.0f}",
+            "ROI": "{:.1f}%",
+            "Payback (years)": lambda v: f"{v:.1f}" if np.isfinite(v) else "N/A"
+        }, na_rep="N/A"),
+        use_container_width=True
+    )
+
+    # Visualization
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # NPV comparison
+        fig_npv = figure_cache.figure(figures.scenario_bar, results_df, "NPV",
+                                      "Net Present Value by Scenario", "NPV ($)")
+        timing.plotly_chart("npv_by_scenario", fig_npv, use_container_width=True)
+
+    with col2:
+        # ROI comparison
+        fig_roi = figure_cache.figure(figures.scenario_bar, results_df, "ROI",
+                                      "Return on Investment by Scenario", "ROI (%)")
+        timing.plotly_chart("roi_by_scenario", fig_roi, use_container_width=True)
+
+    # Sensitivity analysis
+    st.subheader("Sensitivity Analysis")
+    swing = st.slider("Sensitivity Range (±%)", 5, 50, 20) / 100
+    base_npv, tornado_df = sensitivity.tornado(base_inputs, years, swing)
+
+    fig_tornado = figure_cache.figure(figures.tornado, base_npv, tornado_df, swing)
+    timing.plotly_chart("tornado", fig_tornado, use_container_width=True)
+
+    with st.expander("NPV Surface by Benefit Scenario and Analysis Period"):
+        fig_surface = figure_cache.figure(figures.npv_surface, surface.npv, surface.factors, surface.periods)
+        timing.plotly_chart("npv_surface", fig_surface, use_container_width=True)
+
+    # Monte Carlo simulation
+    st.subheader("Monte Carlo Simulation")
+    if st.checkbox("Simulate uncertainty in benefits, operating costs and implementation time"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            draws = st.selectbox("Simulation Draws", [100_000, 250_000, 500_000, 1_000_000], index=1,
+                                 format_func=lambda n: f"{n:,}")
+        with col2:
+            operating_spread = st.slider("Operating Cost Uncertainty (±%)", 0, 50, 20) / 100
+        with col3:
+            schedule_overrun = st.slider("Maximum Implementation Overrun (%)", 0, 200, 50) / 100
+
+        # Cached so reruns with unchanged inputs reuse the previous simulation
+        run_simulation = st.cache_data(show_spinner="Running simulation...", max_entries=CACHE_ENTRIES,
+                                      ttl=CACHE_TTL_SECONDS)(montecarlo.simulate)
+        simulation = run_simulation(
+            initial_investment, annual_operating, implementation_time, annual_benefits, years,
+            discount_rate,
+            benefit_range=(conservative_factor, optimistic_factor),
+            operating_spread=operating_spread,
+            schedule_overrun=schedule_overrun,
+            draws=draws,
+            seed=42
+        )
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("P10 NPV", f"${simulation['p10']:,.0f}")
+        with col2:
+            st.metric("P50 NPV", f"${simulation['p50']:,.0f}")
+        with col3:
+            st.metric("P90 NPV", f"${simulation['p90']:,.0f}")
+        with col4:
+            st.metric("Probability of Loss", f"{simulation['prob_loss']:.1%}")
+
+        fig_sim = figure_cache.figure(figures.npv_histogram, simulation["histogram_counts"],
+                                      simulation["histogram_edges"], simulation["draws"])
+        timing.plotly_chart("npv_histogram", fig_sim, use_container_width=True)
+
+    # Risk assessment
+    st.subheader("Risk Factors")
+    risk_factors = st.multiselect(
+        "Select applicable risk factors:",
+        [
+            "Data quality issues",
+            "Technical complexity",
+            "User adoption resistance", 
+            "Regulatory changes",
+            "Competition",
+            "Technology obsolescence",
+            "Integration challenges",
+            "Skill shortage"
+        ]
+    )
+
+    if risk_factors:
+        risk_impact = len(risk_factors) * 5  # 5% impact per risk factor
+        st.warning(f"Identified {len(risk_factors)} risk factors. Consider reducing expected benefits by {risk_impact}% to account for risks.")
+
+    st.markdown("---")
+    show_navigation_buttons()
@@ -0,0 +1,146 @@
+"""Stakeholder Alignment page: influence-interest mapping and engagement."""
+
+import time
+
+import streamlit as st
+
+from strategy_mapper import figures, session, stakeholders, timing
+from strategy_mapper.layout import item_list, show_navigation_buttons
+from strategy_mapper.pages import bulk_import
+
+# Quadrant, heading and description, in display order
+ENGAGEMENT_STRATEGIES = [
+    ("Manage Closely", "Manage Closely", "High influence, high interest - Key decision makers"),
+    ("Keep Satisfied", "📢 Keep Satisfied", "High influence, low interest - Need regular updates"),
+    ("Keep Informed", "Keep Informed", "Low influence, high interest - Share progress and gather feedback"),
+    ("Monitor", "Monitor", "Low influence, low interest - Light-touch updates"),
+]
+
+# Stakeholders listed when drilling into a matrix cell
+DRILL_DOWN_ROWS = 1_000
+
+LEVEL_NAMES = {score: level for level, score in stakeholders.ENGAGEMENT_SCORES.items()}
+
+
+def _select_cell():
+    # A clicked bubble picks the cell shown in the drill-down
+    points = st.session_state.stakeholder_matrix_chart.selection.points
+    if points:
+        st.session_state.stakeholder_cell = (round(points[0]["x"]), round(points[0]["y"]))
+
+
+def _valid_choice(key, options):
+    # Drop a remembered choice that is no longer offered, e.g. after stakeholders change
+    if st.session_state.get(key) not in options:
+        st.session_state.pop(key, None)
+
+
+def cell_drill_down(df, cells):
+    """Stakeholders in one matrix cell, listed only once a cell is chosen.
+
+    Concerns are read from the stakeholder records when one is picked.
+    """
+    totals = cells.groupby(["interest", "influence"])["count"].sum()
+    options = [(int(interest), int(influence)) for interest, influence in totals.index]
+    counts = dict(zip(options, totals.tolist()))
+    _valid_choice("stakeholder_cell", options)
+    cell = st.selectbox(
+        "Drill down into cell", options, index=None, key="stakeholder_cell", placeholder="Choose a cell",
+        format_func=lambda cell: (
+            f"{LEVEL_NAMES[cell[0]]} interest, {LEVEL_NAMES[cell[1]]} influence ({counts[cell]:,} stakeholders)"
+        ),
+    )
+    if cell is None:
+        return
+
+    interest, influence = cell
+    members = df[(df['interest'] == interest) & (df['influence'] == influence)]
+    shown = members.iloc[:DRILL_DOWN_ROWS]
+    st.dataframe(shown[['name', 'role', 'sentiment']].rename(columns=str.title),
+                 use_container_width=True, hide_index=True)
+    if len(members) > len(shown):
+        st.caption(f"Showing the first {len(shown):,} of {len(members):,} stakeholders in this cell.")
+
+    positions = shown.index.tolist()
+    _valid_choice("stakeholder_concerns", positions)
+    position = st.selectbox(
+        "Show concerns for", positions, index=None, key="stakeholder_concerns", placeholder="Choose a stakeholder",
+        format_func=lambda position: f"{df.at[position, 'name']} ({df.at[position, 'role']})",
+    )
+    if position is not None:
+        concerns = st.session_state.stakeholders[position].concerns
+        st.info(concerns or "No concerns recorded.")
+
+
+def render():
+    derived_data = session.derived_data()
+    figure_cache = session.figure_cache()
+
+    st.header("Stakeholder Alignment Management")
+    st.markdown("Map and manage stakeholder engagement for your AI initiatives.")
+
+    # Add new stakeholder
+    with st.form("stakeholder_form"):
+        st.subheader("Add Stakeholder")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            stakeholder_name = st.text_input("Name")
+            role = st.text_input("Role/Department")
+            influence = st.selectbox("Influence Level", stakeholders.ENGAGEMENT_LEVELS)
+
+        with col2:
+            interest = st.selectbox("Interest Level", stakeholders.ENGAGEMENT_LEVELS)
+            sentiment = st.selectbox("Current Sentiment", stakeholders.SENTIMENTS)
+            concerns = st.text_area("Key Concerns")
+
+        if st.form_submit_button("Add Stakeholder"):
+            if stakeholder_name and role:
+                stakeholder = stakeholders.Stakeholder(
+                    name=stakeholder_name,
+                    role=role,
+                    influence=stakeholders.ENGAGEMENT_SCORES[influence],
+                    interest=stakeholders.ENGAGEMENT_SCORES[interest],
+                    sentiment=stakeholders.SENTIMENTS.index(sentiment),
+                    concerns=concerns,
+                    added_at=time.time()
+                )
+                st.session_state.stakeholders.append(stakeholder)
+                derived_data.invalidate("stakeholders")
+                st.success(f"Stakeholder '{stakeholder_name}' added!")
+                st.rerun()
+
+    bulk_import.panel("stakeholders")
+
+    # Display stakeholder matrix
+    if st.session_state.stakeholders:
+        st.subheader("Stakeholder Influence-Interest Matrix")
+
+        # Prepare data for plotting
+        df_stakeholders = derived_data["stakeholder_frame"]
+
+        cells = stakeholders.matrix_cells(df_stakeholders)
+        fig = figure_cache.figure(figures.stakeholder_matrix, cells)
+        timing.plotly_chart("stakeholder_matrix", fig, use_container_width=True, key="stakeholder_matrix_chart",
+                            on_select=_select_cell, selection_mode="points")
+        cell_drill_down(df_stakeholders, cells)
+
+        # Engagement strategies
+        st.subheader("Engagement Strategies")
+        quadrant = df_stakeholders['quadrant']
+
+        def entries(rows):
+            return (
+                "- **" + rows['name'] + "** (" + rows['role'].fillna("") + ") - "
+                + rows['sentiment'].astype(object).fillna("")
+            )
+
+        for row in (ENGAGEMENT_STRATEGIES[:2], ENGAGEMENT_STRATEGIES[2:]):
+            for column, (label, heading, description) in zip(st.columns(2), row):
+                with column:
+                    st.subheader(heading)
+                    st.write(description)
+                    item_list(df_stakeholders[quadrant == label], entries, ['name', 'role', 'sentiment'])
+
+    st.markdown("---")
+    show_navigation_buttons()
@@ -0,0 +1,82 @@
+"""Strategic Overview page: the 4-step process and current portfolio headline metrics."""
+
+import streamlit as st
+
+from strategy_mapper import session
+from strategy_mapper.layout import show_navigation_buttons
+
+
+def render():
+    derived_data = session.derived_data()
+
+    st.markdown("## Strategic AI Mapping Process")
+
+    # Process overview cards
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### The 4-Step Process")
+        st.markdown("""
+        **1. Goal Decomposition**  
+        Break broad business objectives into specific, measurable AI-relevant goals
+
+        **2. Capability Assessment**  
+        Evaluate your organization's readiness (data, skills, infrastructure)
+
+        **3. Initiative Definition**  
+        Define concrete AI projects with clear ownership and phases
+
+        **4. Impact Estimation**  
+        Calculate expected business value and resource requirements
+        """)
+
+    with col2:
+        st.markdown("### Key Principles")
+        st.markdown("""
+        **Business-First**  
+        Start with problems, not technology
+
+        **Value-Driven**  
+        Every initiative must have measurable business impact
+
+        **Stakeholder-Centric**  
+        Involve all affected parties early
+
+        **Risk-Aware**  
+        Balance innovation with operational stability
+        """)
+
+    # Portfolio overview (if initiatives exist)
+    if st.session_state.initiatives:
+        st.markdown("## Current Portfolio Overview")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        summary = derived_data["portfolio_summary"]
+        total_initiatives = summary["total_initiatives"]
+        high_impact = summary["high_impact"]
+        total_investment = summary["total_investment"]
+        avg_roi = summary["average_roi"]
+
+        with col1:
+            st.metric("Total Initiatives", total_initiatives)
+
+        with col2:
+            st.metric("High Impact", high_impact)
+
+        with col3:
+            st.metric("Total Investment", f"${total_investment:,.0f}")
+
+        with col4:
+            st.metric("Avg. Expected ROI", f"{avg_roi:.1f}%")
+    else:
+        st.markdown("### Ready to Get Started?")
+        st.info("""
+        Begin your AI strategy journey by defining your business objectives and goals. 
+        This tool will guide you through a proven 4-step process used by leading organizations 
+        to align AI initiatives with business value.
+
+        **Time investment:** 30-45 minutes for a comprehensive strategy mapping
+        """)
+
+    show_navigation_buttons()
@@ -0,0 +1,297 @@
+"""Portfolio scoring shared by the Portfolio Matrix and Action Plan pages."""
+
+import bisect
+import heapq
+from datetime import timedelta
+
+import numpy as np
+
+from strategy_mapper.store import ENUM_FIELDS
+
+LEVEL_SCORES = {"Low": 1, "Medium": 2, "High": 3}
+
+# Level code of "High" in the store's complexity and impact columns
+HIGH = ENUM_FIELDS["business_impact"].index("High")
+
+# Portfolio Matrix quadrants: high impact (low, then high complexity), then low impact
+QUADRANTS = ["Quick Wins", "Strategic Bets", "Fill-ins", "Question Marks"]
+
+# How initiatives with equal priority are ordered: the field compared
+# (ascending) and its value when missing
+TIE_BREAKS = {
+    "Earliest added": ("id", None),
+    "Name": ("name", ""),
+    "Lowest investment": ("investment_required", 0.0),
+}
+DEFAULT_TIE_BREAK = "Earliest added"
+
+# Roadmap duration in months for each timeline option
+TIMELINE_MONTHS = {"3-6 months": 4, "6-12 months": 9, "12+ months": 18}
+
+# Changes in one batch beyond which the full order is re-sorted when next
+# read rather than patched entry by entry
+RESORT_CHANGES = 1_000
+
+
+def level_scores(values, default=2):
+    """Map Low/Medium/High labels to 1/2/3 (``default`` for anything else)."""
+    values = np.asarray(values, dtype=object)
+    scores = np.full(values.shape, default, dtype=np.int64)
+    for label, score in LEVEL_SCORES.items():
+        scores[values == label] = score
+    return scores
+
+
+def code_scores(codes, default=2):
+    """``level_scores`` for level codes from ``InitiativeStore.codes``, by array indexing."""
+    # Complexity and impact share their levels; MISSING (-1) picks the default
+    return np.array([*(LEVEL_SCORES[level] for level in ENUM_FIELDS["complexity"]), default])[codes]
+
+
+def timeline_months(codes):
+    """Duration in months of each timeline code; a missing timeline counts as 6-12 months."""
+    levels = [*ENUM_FIELDS["timeline"], "6-12 months"]
+    return np.array([TIMELINE_MONTHS[level] for level in levels])[codes]
+
+
+def priority_scores(complexity_score, impact_score, roi):
+    """Vectorized roadmap priority: quick wins first, then strategic bets.
+
+    Quick wins (complexity <= 2, impact >= 2) score 100 + ROI, strategic
+    bets (complexity >= 2, impact >= 2) score 50 + ROI, everything else
+    scores its ROI.
+    """
+    complexity_score = np.asarray(complexity_score)
+    impact_score = np.asarray(impact_score)
+    roi = np.asarray(roi, dtype=float)
+    bonus = np.select(
+        [(complexity_score <= 2) & (impact_score >= 2), (complexity_score >= 2) & (impact_score >= 2)],
+        [100.0, 50.0],
+        default=0.0,
+    )
+    return bonus + roi
+
+
+def record_priority(record):
+    """``priority_scores`` for a single initiative record."""
+    return float(priority_scores(
+        LEVEL_SCORES.get(record.get("complexity"), 2),
+        LEVEL_SCORES.get(record.get("business_impact"), 2),
+        record.get("expected_roi", 0),
+    ))
+
+
+def classify_quadrants(x, y, labels, split=2.5):
+    """Quadrant of each point as a Categorical over ``labels``, in one pass.
+
+    ``labels`` name the high-``y`` quadrants (low ``x``, then high ``x``)
+    followed by the low-``y`` ones. Scores at or above ``split`` are high.
+    """
+    import pandas as pd
+
+    codes = (np.asarray(x) >= split).astype(np.int8) + 2 * (np.asarray(y) < split).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+
+def quadrants(complexity_score, impact_score):
+    """Portfolio Matrix quadrant of each initiative, as a Categorical over ``QUADRANTS``.
+
+    Quick wins are low/medium complexity with high impact, strategic bets
+    high complexity with high impact, fill-ins low/medium complexity with
+    low/medium impact, and question marks high complexity with low/medium
+    impact.
+    """
+    return classify_quadrants(complexity_score, impact_score, QUADRANTS)
+
+
+def roadmap(initiatives, start):
+    """Roadmap rows for initiatives in priority order, starting a month apart."""
+    rows = []
+    for i, initiative in enumerate(initiatives):
+        duration = TIMELINE_MONTHS.get(initiative.get('timeline', '6-12 months'), 9)
+
+        start_date = start + timedelta(days=i*30)  # Stagger starts
+        end_date = start_date + timedelta(days=duration*30)
+
+        rows.append({
+            "Initiative": initiative['name'],
+            "Start": start_date,
+            "End": end_date,
+            "Impact": initiative.get('business_impact', 'Medium'),
+            "Investment": initiative.get('investment_required', 0)
+        })
+    return rows
+
+
+def summarize(store):
+    """Headline portfolio metrics shown in the sidebar, overview and action plan."""
+    summary = {
+        "total_initiatives": len(store),
+        "high_impact": int((store.codes("business_impact") == HIGH).sum()),
+        "total_investment": float(store.column("investment_required", fill=0).sum()),
+        "roi_sum": float(store.column("expected_roi", fill=0).sum()),
+    }
+    return _with_average(summary)
+
+
+def apply_summary_changes(summary, changes):
+    """Update a ``summarize`` result in place from store ``(old, new)`` changes."""
+    for old, new in changes:
+        for record, sign in ((old, -1), (new, 1)):
+            if record is None:
+                continue
+            summary["total_initiatives"] += sign
+            summary["high_impact"] += sign * (record.get("business_impact") == "High")
+            summary["total_investment"] += sign * record.get("investment_required", 0)
+            summary["roi_sum"] += sign * record.get("expected_roi", 0)
+    return _with_average(summary)
+
+
+def _with_average(summary):
+    count = summary["total_initiatives"]
+    summary["average_roi"] = summary["roi_sum"] / count if count else 0.0
+    return summary
+
+
+def scored_frame(store):
+    """Name, complexity/impact scores and quadrant, investment and ROI for every initiative."""
+    import pandas as pd
+
+    complexity = code_scores(store.codes("complexity"))
+    impact = code_scores(store.codes("business_impact"))
+    return pd.DataFrame({
+        "name": store.column("name"),
+        "complexity": complexity,
+        "impact": impact,
+        "quadrant": quadrants(complexity, impact),
+        "investment": store.column("investment_required", fill=0),
+        "roi": store.column("expected_roi", fill=0),
+    }, index=pd.Index(store.ids(), name="id"))
+
+
+def matrix_cells(scored):
+    """Initiative count, total investment and mean ROI per complexity x impact cell.
+
+    ``scored`` is a ``scored_frame``; only occupied cells are returned.
+    """
+    cells = scored.groupby(['complexity', 'impact'], sort=True).agg(
+        count=('name', 'size'), investment=('investment', 'sum'), roi=('roi', 'mean')
+    ).reset_index()
+    cells['quadrant'] = quadrants(cells['complexity'], cells['impact'])
+    return cells
+
+
+def priority_order(store):
+    """Initiative IDs sorted by descending priority (ties keep insertion order)."""
+    scores = priority_scores(
+        code_scores(store.codes("complexity")),
+        code_scores(store.codes("business_impact")),
+        store.column("expected_roi", fill=0),
+    )
+    return store.ids()[np.argsort(-scores, kind="stable")]
+
+
+class PriorityIndex:
+    """Initiative IDs in a heap ordered by descending priority score.
+
+    Built once from a store, then kept current by ``apply`` from the store's
+    change feed at O(log n) per added, removed or updated initiative, so
+    ``top(k)`` never re-sorts the portfolio. Entries for removed or rescored
+    initiatives stay in the heap and are skipped when reached; the heap is
+    rebuilt once they outnumber the live ones. ``tie_break`` names an entry
+    of ``TIE_BREAKS`` ordering equal scores; the ID settles remaining ties.
+
+    The full order for ``ordered()`` is sorted once, on first use, and then
+    patched by bisection as entries are added and removed; a batch of more
+    than ``RESORT_CHANGES`` changes drops it to be re-sorted instead.
+    """
+
+    def __init__(self, store, tie_break=None):
+        self.tie_break = tie_break or DEFAULT_TIE_BREAK
+        self._tie_field, self._tie_fill = TIE_BREAKS[self.tie_break]
+        ids = store.ids()
+        scores = priority_scores(
+            code_scores(store.codes("complexity")),
+            code_scores(store.codes("business_impact")),
+            store.column("expected_roi", fill=0),
+        )
+        ties = ids if self._tie_field == "id" else store.column(self._tie_field, fill=self._tie_fill)
+        self._heap = list(zip((-scores).tolist(), ties.tolist(), ids.tolist()))
+        heapq.heapify(self._heap)
+        self._entries = {entry[2]: entry for entry in self._heap}
+        self._stale = 0
+        self._sorted = None
+        self._order = None
+        self._order_shared = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def apply(self, changes):
+        """Update from store ``(old, new)`` changes; returns the index."""
+        if len(changes) > RESORT_CHANGES:
+            self._sorted = self._order = None
+        for old, new in changes:
+            if old is not None:
+                self.discard(old["id"])
+            if new is not None:
+                self.push(new)
+        return self
+
+    def push(self, record):
+        """Add an initiative record, replacing any earlier entry for its ID."""
+        self.discard(record["id"])
+        tie = record["id"] if self._tie_field == "id" else record.get(self._tie_field, self._tie_fill)
+        entry = (-record_priority(record), tie, record["id"])
+        self._entries[record["id"]] = entry
+        heapq.heappush(self._heap, entry)
+        if self._sorted is not None:
+            position = bisect.bisect_right(self._sorted, entry)
+            self._sorted.insert(position, entry)
+            self._own_order().insert(position, entry[2])
+
+    def discard(self, initiative_id):
+        entry = self._entries.pop(initiative_id, None)
+        if entry is None:
+            return
+        if self._sorted is not None:
+            position = bisect.bisect_left(self._sorted, entry)
+            del self._sorted[position]
+            del self._own_order()[position]
+        self._stale += 1
+        if self._stale > len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def top(self, k):
+        """IDs of the ``k`` highest-priority initiatives, best first (O(k log n))."""
+        taken = []
+        while self._heap and len(taken) < k:
+            entry = heapq.heappop(self._heap)
+            if self._entries.get(entry[2]) is entry:
+                taken.append(entry)
+            else:
+                self._stale -= 1
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+        return [entry[2] for entry in taken]
+
+    def _own_order(self):
+        # Lists handed out by ordered() never change; copy before patching
+        if self._order_shared:
+            self._order = list(self._order)
+            self._order_shared = False
+        return self._order
+
+    def ordered(self):
+        """All IDs in priority order.
+
+        Treat the list as read-only; it is shared between callers until the
+        index changes.
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self._entries.values())
+            self._order = [entry[2] for entry in self._sorted]
+        self._order_shared = True
+        return self._order
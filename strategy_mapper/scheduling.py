@@ -0,0 +1,145 @@
+"""Resource-constrained roadmap scheduling for the Action Plan.
+
+The whole portfolio is placed in priority order by serial list scheduling.
+Each initiative starts at the earliest month when both of these hold:
+
+- Its owner has a free slot. An owner runs at most ``owner_limit``
+  initiatives at once; initiatives without an owner are not limited.
+- The quarter it starts in still has room for its ``investment_required``
+  under ``budget_cap``. The investment is committed in full in the start
+  quarter.
+
+An initiative costing more than the cap starts alone, in a quarter with
+nothing else committed.
+
+Each owner's slots are a min-heap of the months they free up. Quarter
+budgets are a max segment tree, so the first quarter with room is found in
+O(log n). Placing n initiatives is O(n log n).
+"""
+
+import heapq
+
+import numpy as np
+
+from strategy_mapper.portfolio import timeline_months
+
+MONTHS_PER_QUARTER = 3
+
+
+class _QuarterBudgets:
+    """Remaining budget per quarter in a max segment tree."""
+
+    def __init__(self, quarters, cap):
+        self.size = 1 << max(quarters - 1, 0).bit_length()
+        self.tree = [cap] * (2 * self.size)
+
+    def first_fit(self, first, amount):
+        """Index of the first quarter from ``first`` on with at least ``amount`` left."""
+        tree = self.tree
+        node = first + self.size
+        if tree[node] >= amount:
+            return first
+        # Climb until a right-hand sibling subtree has room, then descend into it
+        while True:
+            while node & 1:
+                node >>= 1
+                if node == 0:
+                    raise ValueError("No quarter has room; the schedule horizon is too short")
+            node += 1
+            if tree[node] >= amount:
+                break
+        while node < self.size:
+            node = 2 * node if tree[2 * node] >= amount else 2 * node + 1
+        return node - self.size
+
+    def spend(self, quarter, amount):
+        tree = self.tree
+        node = quarter + self.size
+        tree[node] -= amount
+        node >>= 1
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node >>= 1
+
+
+def schedule(store, order, budget_cap=None, owner_limit=None):
+    """Start and end month of every initiative, placed in ``order`` (IDs, highest priority first).
+
+    ``budget_cap`` is the most that may be committed per quarter, and
+    ``owner_limit`` the most initiatives one owner runs at once. None means
+    no limit. Returns a DataFrame indexed by ID in ``order``, with these
+    columns: ``name``, ``owner``, ``business_impact``, ``investment``,
+    ``start_month``, ``end_month``, ``quarter`` and ``over_budget``.
+    ``quarter`` is counted from 0, and ``over_budget`` marks initiatives
+    costing more than the cap.
+    """
+    import pandas as pd
+
+    order = np.asarray(order, dtype=np.int64)
+    rows = pd.Index(store.ids()).get_indexer(order)
+    names = store.column("name")[rows]
+    owners = store.column("owner")[rows]
+    durations = timeline_months(store.codes("timeline")[rows])
+    investment = store.column("investment_required", fill=0)[rows]
+
+    starts = np.zeros(len(order), dtype=np.int64)
+    over_budget = np.zeros(len(order), dtype=bool)
+    budgets = None
+    if budget_cap is not None:
+        # Enough quarters for the worst case: every initiative run one after another
+        horizon = len(order) + int(durations.sum()) // MONTHS_PER_QUARTER + 2
+        budgets = _QuarterBudgets(horizon, float(budget_cap))
+        over_budget = investment > budget_cap
+    slots = {}
+
+    for position, (owner, duration, cost) in enumerate(zip(owners.tolist(), durations.tolist(), investment.tolist())):
+        ready = 0
+        free = None
+        if owner_limit is not None and owner:
+            free = slots.setdefault(owner, [])
+            if len(free) >= owner_limit:
+                ready = free[0]
+        start = ready
+        if budgets is not None:
+            amount = min(cost, budget_cap)
+            quarter = budgets.first_fit(ready // MONTHS_PER_QUARTER, amount)
+            budgets.spend(quarter, amount)
+            start = max(ready, quarter * MONTHS_PER_QUARTER)
+        starts[position] = start
+        if free is not None:
+            if len(free) >= owner_limit:
+                heapq.heapreplace(free, start + duration)
+            else:
+                heapq.heappush(free, start + duration)
+
+    return pd.DataFrame({
+        "name": names,
+        "owner": owners,
+        "business_impact": store.column("business_impact")[rows],
+        "investment": investment,
+        "start_month": starts,
+        "end_month": starts + durations,
+        "quarter": starts // MONTHS_PER_QUARTER,
+        "over_budget": over_budget,
+    }, index=pd.Index(order, name="id"))
+
+
+def gantt_rows(scheduled, start, limit=None):
+    """Roadmap timeline rows, as ``portfolio.roadmap`` returns, for the first ``limit`` scheduled initiatives.
+
+    Months are 30 days from ``start``, as in ``portfolio.roadmap``. Dates
+    are kept to the second, because a tightly constrained portfolio can
+    run past the nanosecond range of pandas timestamps.
+    """
+    import pandas as pd
+
+    shown = scheduled if limit is None else scheduled.iloc[:limit]
+    origin = np.datetime64(start, "s")
+    return pd.DataFrame({
+        "Initiative": shown["name"].to_numpy(),
+        "Start": origin + (shown["start_month"].to_numpy() * 30).astype("timedelta64[D]"),
+        "End": origin + (shown["end_month"].to_numpy() * 30).astype("timedelta64[D]"),
+        "Impact": shown["business_impact"].fillna("Medium").to_numpy(),
+        "Investment": shown["investment"].to_numpy(),
+        "Owner": shown["owner"].fillna("TBD").to_numpy(),
+    })
@@ -0,0 +1,103 @@
+"""Batched sensitivity analysis for the ROI Calculator.
+
+``tornado`` perturbs every input up and down in a single engine call, and
+``NPVSurface`` precomputes NPV over the full scenario slider range and every
+analysis period so slider moves become array lookups.
+"""
+
+import numpy as np
+import pandas as pd
+
+from strategy_mapper import roi
+
+# (input key, display label) in the order they appear on the page
+INPUTS = [
+    ("initial_investment", "Initial Investment"),
+    ("annual_operating", "Annual Operating Costs"),
+    ("implementation_time", "Implementation Time"),
+    ("cost_reduction", "Annual Cost Reduction"),
+    ("revenue_increase", "Annual Revenue Increase"),
+    ("productivity_gain", "Annual Productivity Value"),
+    ("discount_rate", "Discount Rate"),
+]
+
+BENEFIT_INPUTS = ["cost_reduction", "revenue_increase", "productivity_gain"]
+
+ANALYSIS_PERIODS = [1, 2, 3, 5]
+FACTOR_RANGE = (50, 200)  # Percent; spans the conservative and optimistic sliders
+
+
+def _evaluate_inputs(values, years):
+    """Run the NPV engine over rows of ``values`` laid out in ``INPUTS`` order."""
+    column = {key: values[..., i] for i, (key, _) in enumerate(INPUTS)}
+    annual_benefits = sum(column[key] for key in BENEFIT_INPUTS)
+    return roi.evaluate(
+        column["initial_investment"], column["annual_operating"], column["implementation_time"],
+        annual_benefits, years, column["discount_rate"],
+    )
+
+
+def tornado(inputs, years, swing=0.2):
+    """NPV when each input moves by ``±swing`` with all others held at base.
+
+    ``inputs`` maps every key in ``INPUTS`` to its base value. Returns the
+    base NPV and a DataFrame with one row per input, sorted by ascending
+    swing so the widest bar is drawn on top of a horizontal bar chart.
+    """
+    base = np.array([float(inputs[key]) for key, _ in INPUTS])
+    count = len(INPUTS)
+
+    # Row 0 is the base case, then one low and one high row per input
+    batch = np.tile(base, (2 * count + 1, 1))
+    rows = np.arange(count)
+    batch[1 + 2 * rows, rows] *= 1 - swing
+    batch[2 + 2 * rows, rows] *= 1 + swing
+
+    npv = _evaluate_inputs(batch, years)["npv"]
+    low, high = npv[1::2], npv[2::2]
+
+    frame = pd.DataFrame({
+        "Input": [label for _, label in INPUTS],
+        "Low NPV": low,
+        "High NPV": high,
+        "Swing": np.abs(high - low),
+    })
+    return float(npv[0]), frame.sort_values("Swing").reset_index(drop=True)
+
+
+class NPVSurface:
+    """NPV, ROI and payback precomputed over benefit factor × analysis period.
+
+    Factors are whole percentages across ``FACTOR_RANGE`` so every position
+    of the conservative and optimistic sliders (and the 100% base case) maps
+    to a grid row.
+    """
+
+    def __init__(self, inputs, periods=ANALYSIS_PERIODS, factor_range=FACTOR_RANGE):
+        self.factors = np.arange(factor_range[0], factor_range[1] + 1) / 100
+        self.periods = np.asarray(periods)
+
+        base = np.array([float(inputs[key]) for key, _ in INPUTS])
+        batch = np.tile(base, (len(self.factors), 1))
+        for key in BENEFIT_INPUTS:
+            position = [k for k, _ in INPUTS].index(key)
+            batch[:, position] *= self.factors
+
+        results = _evaluate_inputs(batch[:, None, :], self.periods[None, :])
+        self.npv = results["npv"]
+        self.roi = results["roi"]
+        self.payback = results["payback"]
+
+    def lookup(self, factors, years):
+        """Grid values for benefit ``factors`` (fractions) at period ``years``."""
+        factors = np.asarray(factors, dtype=float)
+        row = np.rint((factors - self.factors[0]) * 100).astype(int)
+        row = np.clip(row, 0, len(self.factors) - 1)
+        column = int(np.searchsorted(self.periods, years))
+        if column >= len(self.periods) or self.periods[column] != years:
+            raise ValueError(f"Analysis period {years} is not part of the surface")
+        return {
+            "npv": self.npv[row, column],
+            "roi": self.roi[row, column],
+            "payback": self.payback[row, column],
+        }
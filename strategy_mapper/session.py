@@ -0,0 +1,82 @@
+"""Per-session state shared by the app shell and the page modules."""
+
+import hmac
+import os
+import uuid
+
+import streamlit as st
+
+from strategy_mapper import derived, memory, workspace
+from strategy_mapper.stakeholders import Stakeholder
+from strategy_mapper.store import InitiativeStore
+
+
+def _open_workspace():
+    # The workspace ID lives in the URL, so a refresh or a server restart
+    # reopens the same workspace
+    workspace_id = st.query_params.get("workspace") or uuid.uuid4().hex
+    st.query_params["workspace"] = workspace_id
+
+    saved = workspace.Workspace(workspace.default_path(), workspace_id)
+    state = saved.load()
+    st.session_state.initiatives = InitiativeStore(state.pop(workspace.INITIATIVES))
+    st.session_state.stakeholders = [Stakeholder.from_dict(record) for record in state.pop("stakeholders")]
+    for key, value in state.items():
+        st.session_state[key] = value
+    st.session_state.workspace = saved
+
+
+def init():
+    """Create the session's data containers on its first run.
+
+    The first run of a session restores its saved workspace.
+    """
+    if 'workspace' not in st.session_state:
+        _open_workspace()
+    if 'initiatives' not in st.session_state:
+        st.session_state.initiatives = InitiativeStore()
+    if 'stakeholders' not in st.session_state:
+        st.session_state.stakeholders = []
+    if 'goals' not in st.session_state:
+        st.session_state.goals = []
+    if 'unit_assessments' not in st.session_state:
+        st.session_state.unit_assessments = []
+    if 'current_page' not in st.session_state:
+        st.session_state.current_page = "Strategic Overview"
+    if 'derived' not in st.session_state:
+        st.session_state.derived = derived.session_data(st.session_state.get)
+
+
+def derived_data():
+    """Derived values, recomputed only when the data they depend on changes."""
+    return st.session_state.derived
+
+
+def figure_cache():
+    """The process-wide figure cache; charts are rebuilt only when their data changes."""
+    from strategy_mapper import figures
+
+    return figures.shared_cache()
+
+
+def account_memory(force=False):
+    """Measure this session's state (at most once a minute unless ``force``) for the admin view and log."""
+    if 'memory_account' not in st.session_state:
+        st.session_state.memory_account = memory.register(st.session_state.workspace.workspace_id[:8])
+    st.session_state.memory_account.measure(st.session_state, force=force)
+    return st.session_state.memory_account
+
+
+def is_admin():
+    """Whether the URL carries the admin token (``?admin=<STRATEGY_MAPPER_ADMIN_TOKEN>``)."""
+    token = os.environ.get("STRATEGY_MAPPER_ADMIN_TOKEN")
+    return bool(token) and hmac.compare_digest(st.query_params.get("admin", ""), token)
+
+
+def autosave():
+    """Queue the changes made during this run; they are written once the session goes idle.
+
+    Goals, stakeholders and unit assessments are only compared with what was
+    saved after they have been announced as changed with ``invalidate``.
+    """
+    st.session_state.workspace.track(st.session_state, derived_data().version)
@@ -0,0 +1,246 @@
+"""Binary workspace snapshots as Arrow IPC files.
+
+A snapshot is a directory with one uncompressed Arrow IPC file per table:
+initiatives, stakeholders, goals, the capability assessment scores and the
+business-unit assessments. Each workspace keeps its snapshots in its own
+subdirectory, so sessions only see their own workspace's snapshots.
+Ordinal and categorical fields are stored dictionary-encoded with the
+records' int8 codes as indices, and timestamps as float seconds. Reloading
+memory-maps the files and copies each numeric, code and timestamp column out
+of the mapping in one vectorized pass, since the store edits its columns in
+place; initiative text columns are decoded only when a page first reads them.
+"""
+
+import json
+import math
+import os
+import re
+
+import numpy as np
+import pyarrow as pa
+
+from strategy_mapper.capability import OPTIONS as ASSESSMENT_OPTIONS
+from strategy_mapper.capability import encode as encode_assessments
+from strategy_mapper.stakeholders import ENGAGEMENT_LEVELS, SENTIMENTS, Stakeholder, encoded_frame
+from strategy_mapper.store import (
+    ENUM_FIELDS, MISSING, NUMERIC_FIELDS, TEXT_FIELDS, TIMESTAMP_FIELDS, InitiativeStore, timestamp,
+)
+
+DEFAULT_DIRECTORY = "snapshots"
+
+SUFFIX = ".snapshot"
+
+STAKEHOLDER_TEXT_FIELDS = ["name", "role", "concerns"]
+
+
+def _safe_name(name):
+    return re.sub(r"[^\w.-]+", "_", name).strip("._")
+
+
+def default_directory(workspace_id):
+    """Snapshot directory of a workspace, under ``STRATEGY_MAPPER_SNAPSHOTS`` if set."""
+    root = os.environ.get("STRATEGY_MAPPER_SNAPSHOTS", DEFAULT_DIRECTORY)
+    # Never the shared root itself, whatever the ID in the URL
+    return os.path.join(root, _safe_name(workspace_id) or "_")
+
+
+def snapshot_path(directory, name):
+    """Path of the snapshot called ``name``; unsafe characters become ``_``."""
+    return os.path.join(directory, _safe_name(name) + SUFFIX)
+
+
+def list_snapshots(directory):
+    """Names of the snapshots in ``directory``, newest first."""
+    if not os.path.isdir(directory):
+        return []
+    paths = [entry for entry in os.scandir(directory) if entry.is_dir() and entry.name.endswith(SUFFIX)]
+    paths.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    return [entry.name[:-len(SUFFIX)] for entry in paths]
+
+
+def _dictionary(codes, levels):
+    """Dictionary array over ``levels`` with ``codes`` as int8 indices; ``MISSING`` is null."""
+    codes = np.asarray(codes, dtype=np.int8)
+    return pa.DictionaryArray.from_arrays(
+        pa.array(codes, mask=codes == MISSING), pa.array(levels, type=pa.string()), ordered=True
+    )
+
+
+def _codes(column):
+    """Writable int8 codes of a dictionary column, ``MISSING`` where null."""
+    column = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+    return column.indices.fill_null(MISSING).to_numpy().astype(np.int8)
+
+
+def _timestamps(column):
+    """Writable float seconds of a timestamp column, NaN where null.
+
+    Snapshots from older versions stored timestamps as text.
+    """
+    if pa.types.is_string(column.type):
+        return np.array([timestamp(value) for value in column.to_pylist()], dtype=float)
+    return column.to_numpy().astype(float)
+
+
+def _write(path, table, metadata=None):
+    if metadata:
+        table = table.replace_schema_metadata({key: json.dumps(value) for key, value in metadata.items()})
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _read(path):
+    # The table's buffers point into the mapping, which stays open while
+    # they are referenced
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    metadata = {key.decode(): json.loads(value) for key, value in (table.schema.metadata or {}).items()}
+    return table, metadata
+
+
+def initiatives_table(store):
+    columns = {"id": pa.array(store.ids(), type=pa.int64())}
+    for field in TEXT_FIELDS:
+        columns[field] = pa.array(store.column(field), type=pa.string(), from_pandas=True)
+    for field, levels in ENUM_FIELDS.items():
+        columns[field] = _dictionary(store.codes(field), levels)
+    for field in NUMERIC_FIELDS + TIMESTAMP_FIELDS:
+        columns[field] = pa.array(store.column(field), type=pa.float64())
+    return pa.table(columns)
+
+
+def stakeholders_table(stakeholders):
+    def values(field):
+        return [getattr(stakeholder, field) for stakeholder in stakeholders]
+
+    columns = {field: pa.array(values(field), type=pa.string()) for field in STAKEHOLDER_TEXT_FIELDS}
+    # Engagement scores are 1-4, or 0 if not set, so the level code is the score - 1
+    columns["influence"] = _dictionary(np.array(values("influence")) - 1, ENGAGEMENT_LEVELS)
+    columns["interest"] = _dictionary(np.array(values("interest")) - 1, ENGAGEMENT_LEVELS)
+    columns["sentiment"] = _dictionary(values("sentiment"), SENTIMENTS)
+    columns["added_at"] = pa.array(values("added_at"), type=pa.float64())
+    return pa.table(columns)
+
+
+def assessments_table(assessments):
+    codes = encode_assessments(assessments)
+    columns = {"name": pa.array([assessment["name"] for assessment in assessments], type=pa.string())}
+    for column, (dimension, options) in enumerate(ASSESSMENT_OPTIONS.items()):
+        columns[dimension] = _dictionary(codes[:, column], options)
+    columns["assessed_at"] = pa.array([assessment.get("assessed_at") for assessment in assessments],
+                                      type=pa.float64())
+    return pa.table(columns)
+
+
+def save(path, store, stakeholders=(), goals=(), capability_assessment=None, business_objective=None,
+         unit_assessments=()):
+    """Write a snapshot directory at ``path``, replacing any existing files."""
+    os.makedirs(path, exist_ok=True)
+    _write(os.path.join(path, "initiatives.arrow"), initiatives_table(store))
+    _write(os.path.join(path, "stakeholders.arrow"), stakeholders_table(list(stakeholders)))
+    _write(
+        os.path.join(path, "goals.arrow"),
+        pa.table({"goal": pa.array(list(goals), type=pa.string())}),
+        {"business_objective": business_objective},
+    )
+    assessment = capability_assessment or {}
+    scores = assessment.get("scores", {})
+    _write(
+        os.path.join(path, "capability.arrow"),
+        pa.table({
+            "dimension": pa.array(list(scores), type=pa.string()),
+            "level": pa.array(list(scores.values()), type=pa.string()).dictionary_encode(),
+        }),
+        {"readiness_score": assessment.get("readiness_score"), "saved": bool(assessment)},
+    )
+    _write(os.path.join(path, "unit_assessments.arrow"), assessments_table(list(unit_assessments)))
+
+
+def load_initiatives(path):
+    """InitiativeStore over the memory-mapped initiatives table."""
+    table, _ = _read(os.path.join(path, "initiatives.arrow"))
+    columns = {}
+    for field in TEXT_FIELDS:
+        # Decoding strings to Python objects is the slow part; defer it
+        columns[field] = lambda column=table[field]: column.to_numpy()
+    for field in ENUM_FIELDS:
+        columns[field] = _codes(table[field])
+    for field in NUMERIC_FIELDS:
+        # Copied out of the mapping, since the store edits columns in place
+        columns[field] = table[field].to_numpy().copy()
+    for field in TIMESTAMP_FIELDS:
+        columns[field] = _timestamps(table[field])
+    # Names are needed up front for the name index
+    columns["name"] = columns["name"]()
+    return InitiativeStore.from_columns(table["id"].to_numpy(), columns)
+
+
+def load_stakeholders(path):
+    """``Stakeholder`` records and the encoded frame used by the Stakeholder Alignment page."""
+    import pandas as pd
+
+    table, _ = _read(os.path.join(path, "stakeholders.arrow"))
+    # Engagement levels are stored lowest first, so the score is the code + 1
+    influence = _codes(table["influence"]) + 1
+    interest = _codes(table["interest"]) + 1
+    sentiment = _codes(table["sentiment"])
+    frame = encoded_frame(
+        table["name"].to_pandas(),
+        table["role"].to_pandas(),
+        # Unset levels count as Medium, as in stakeholders.stakeholder_frame
+        np.where(influence == 0, 2, influence),
+        np.where(interest == 0, 2, interest),
+        pd.Categorical.from_codes(sentiment, categories=SENTIMENTS),
+    )
+    text = {field: table[field].to_pylist() for field in STAKEHOLDER_TEXT_FIELDS}
+    added_at = _timestamps(table["added_at"]).tolist()
+    columns = zip(
+        text["name"], text["role"], influence.tolist(), interest.tolist(), sentiment.tolist(), text["concerns"],
+        added_at,
+    )
+    records = [
+        Stakeholder(name, role, influence_score, interest_score, sentiment_code, concerns,
+                    None if math.isnan(added) else added)
+        for name, role, influence_score, interest_score, sentiment_code, concerns, added in columns
+    ]
+    return records, frame
+
+
+def load_assessments(path):
+    """Business-unit assessment records; unanswered dimensions are left out, as on import."""
+    file = os.path.join(path, "unit_assessments.arrow")
+    if not os.path.exists(file):
+        # Snapshots from older versions had no business-unit assessments
+        return []
+    table, _ = _read(file)
+    columns = {field: table[field].to_pylist() for field in ["name", *ASSESSMENT_OPTIONS, "assessed_at"]}
+    records = []
+    for row in zip(*columns.values()):
+        record = {field: value for field, value in zip(columns, row) if value is not None}
+        records.append(record)
+    return records
+
+
+def load(path):
+    """Everything in the snapshot at ``path`` as session-state values.
+
+    ``stakeholder_frame`` is the ready-made frame for the Stakeholder
+    Alignment page, matching ``stakeholders.stakeholder_frame``.
+    """
+    stakeholders, stakeholder_frame = load_stakeholders(path)
+    goals, goal_metadata = _read(os.path.join(path, "goals.arrow"))
+    capability, capability_metadata = _read(os.path.join(path, "capability.arrow"))
+    assessment = None
+    if capability_metadata.get("saved"):
+        assessment = {
+            "readiness_score": capability_metadata.get("readiness_score"),
+            "scores": dict(zip(capability["dimension"].to_pylist(), capability["level"].to_pylist())),
+        }
+    return {
+        "initiatives": load_initiatives(path),
+        "stakeholders": stakeholders,
+        "stakeholder_frame": stakeholder_frame,
+        "goals": goals["goal"].to_pylist(),
+        "business_objective": goal_metadata.get("business_objective"),
+        "capability_assessment": assessment,
+        "unit_assessments": load_assessments(path),
+    }
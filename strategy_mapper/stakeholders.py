@@ -0,0 +1,134 @@
+"""Stakeholder records and tables for the Stakeholder Alignment page."""
+
+import numpy as np
+
+from strategy_mapper.portfolio import classify_quadrants
+from strategy_mapper.store import MISSING, timestamp
+
+ENGAGEMENT_SCORES = {"Low": 1, "Medium": 2, "High": 3, "Very High": 4}
+
+SENTIMENT_COLORS = {
+    "Skeptical": "red",
+    "Neutral": "yellow",
+    "Supportive": "lightgreen",
+    "Champion": "green",
+}
+
+ENGAGEMENT_LEVELS = list(ENGAGEMENT_SCORES)
+SENTIMENTS = list(SENTIMENT_COLORS)
+
+_SENTIMENT_CODES = {sentiment: code for code, sentiment in enumerate(SENTIMENTS)}
+
+# Influence-interest quadrants: high influence (low, then high interest), then low influence
+ENGAGEMENT_QUADRANTS = ["Keep Satisfied", "Manage Closely", "Monitor", "Keep Informed"]
+
+
+def engagement_quadrants(influence, interest):
+    """Engagement quadrant of each stakeholder, as a Categorical over ``ENGAGEMENT_QUADRANTS``."""
+    return classify_quadrants(interest, influence, ENGAGEMENT_QUADRANTS)
+
+
+class Stakeholder:
+    """One stakeholder, with its levels stored as small ints.
+
+    ``influence`` and ``interest`` are ``ENGAGEMENT_SCORES`` (0 if not set),
+    ``sentiment`` is an index into ``SENTIMENTS`` (``MISSING`` if not set)
+    and ``added_at`` is seconds since the epoch. ``to_dict`` gives the
+    labelled record that is saved and exported.
+    """
+
+    __slots__ = ("name", "role", "influence", "interest", "sentiment", "concerns", "added_at")
+
+    def __init__(self, name, role, influence=0, interest=0, sentiment=MISSING, concerns=None, added_at=None):
+        self.name = name
+        self.role = role
+        self.influence = influence
+        self.interest = interest
+        self.sentiment = sentiment
+        self.concerns = concerns
+        self.added_at = added_at
+
+    @classmethod
+    def from_dict(cls, record):
+        """A stakeholder from a labelled record, as imported or saved."""
+        return cls(
+            record.get("name"),
+            record.get("role"),
+            ENGAGEMENT_SCORES.get(record.get("influence"), 0),
+            ENGAGEMENT_SCORES.get(record.get("interest"), 0),
+            _SENTIMENT_CODES.get(record.get("sentiment"), MISSING),
+            record.get("concerns"),
+            timestamp(record.get("added_at")),
+        )
+
+    def to_dict(self):
+        """The stakeholder with labels for its levels; fields never set are omitted."""
+        record = {
+            "name": self.name,
+            "role": self.role,
+            "influence": ENGAGEMENT_LEVELS[self.influence - 1] if self.influence else None,
+            "interest": ENGAGEMENT_LEVELS[self.interest - 1] if self.interest else None,
+            "sentiment": SENTIMENTS[self.sentiment] if self.sentiment != MISSING else None,
+            "concerns": self.concerns,
+            "added_at": self.added_at,
+        }
+        return {field: value for field, value in record.items() if value is not None}
+
+
+def encoded_frame(name, role, influence, interest, sentiment):
+    """The Stakeholder Alignment table from already-encoded columns.
+
+    ``influence`` and ``interest`` are 1-4 scores and ``sentiment`` a
+    Categorical over the ``SENTIMENT_COLORS`` keys. Row labels are positions
+    in the stakeholder list.
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame({
+        "name": name,
+        "role": role,
+        "influence": np.asarray(influence, dtype=np.int8),
+        "interest": np.asarray(interest, dtype=np.int8),
+        "sentiment": pd.Categorical(sentiment, categories=list(SENTIMENT_COLORS)),
+    })
+    frame["quadrant"] = engagement_quadrants(frame["influence"], frame["interest"])
+    return frame
+
+
+def stakeholder_frame(stakeholders):
+    """``Stakeholder`` records encoded for the matrix: int8 scores, categorical sentiment, quadrant.
+
+    Concerns are left out; read them from the records by position when a
+    stakeholder is looked at.
+    """
+    import pandas as pd
+
+    stakeholders = list(stakeholders)
+
+    def codes(field):
+        return np.fromiter((getattr(stakeholder, field) for stakeholder in stakeholders), dtype=np.int8,
+                           count=len(stakeholders))
+
+    # Unset levels count as Medium
+    influence, interest = codes("influence"), codes("interest")
+    influence[influence == 0] = ENGAGEMENT_SCORES["Medium"]
+    interest[interest == 0] = ENGAGEMENT_SCORES["Medium"]
+    return encoded_frame(
+        [stakeholder.name for stakeholder in stakeholders],
+        [stakeholder.role for stakeholder in stakeholders],
+        influence, interest,
+        pd.Categorical.from_codes(codes("sentiment"), categories=SENTIMENTS),
+    )
+
+
+def matrix_cells(frame, sample=3):
+    """Stakeholders per interest x influence cell and sentiment.
+
+    Each row has the ``count`` for one sentiment in one cell, the cell's
+    ``total`` and up to ``sample`` of the stakeholders' ``names``, so the
+    matrix size does not depend on the number of stakeholders.
+    """
+    grouped = frame.groupby(["interest", "influence", "sentiment"], observed=True, sort=True)["name"]
+    cells = grouped.agg(count="size", names=lambda names: ", ".join(names.iloc[:sample].astype(str))).reset_index()
+    cells["total"] = cells.groupby(["interest", "influence"])["count"].transform("sum")
+    return cells
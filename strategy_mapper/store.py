@@ -0,0 +1,354 @@
+"""Columnar storage for the initiative portfolio.
+
+Initiatives are kept as typed NumPy columns with a stable integer ID per
+record and a hash index on name, so lookups by name or ID are O(1) and
+pages read whole columns instead of scanning a list of dicts. Ordinal fields
+are stored as int8 level codes and timestamps as seconds since the epoch;
+records and ``column`` turn codes back into labels for display.
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+# Free-text fields captured on the Initiative Definition page
+TEXT_FIELDS = [
+    "name", "business_problem", "ai_solution", "owner",
+    "phase1", "phase2", "phase3", "primary_metric", "secondary_metrics",
+]
+
+# Ordinal fields and their levels, lowest first
+ENUM_FIELDS = {
+    "timeline": ["3-6 months", "6-12 months", "12+ months"],
+    "complexity": ["Low", "Medium", "High"],
+    "business_impact": ["Low", "Medium", "High"],
+    "technical_risk": ["Low", "Medium", "High"],
+    "business_risk": ["Low", "Medium", "High"],
+    "timeline_risk": ["Low", "Medium", "High"],
+}
+
+# Figures saved by the Impact Estimation page; NaN until an analysis is saved
+NUMERIC_FIELDS = [
+    "cost_savings", "revenue_increase", "risk_reduction",
+    "technology_cost", "personnel_cost", "infrastructure_cost",
+    "total_benefits", "investment_required", "expected_roi", "payback_period",
+    "efficiency_gain", "quality_improvement", "time_savings",
+]
+
+# Times, as seconds since the epoch; NaN if unknown
+TIMESTAMP_FIELDS = ["created_at"]
+
+FIELDS = TEXT_FIELDS + list(ENUM_FIELDS) + NUMERIC_FIELDS + TIMESTAMP_FIELDS
+
+# Code of a missing ordinal value
+MISSING = -1
+
+_FLOAT_FIELDS = set(NUMERIC_FIELDS + TIMESTAMP_FIELDS)
+
+_CODES = {field: {level: code for code, level in enumerate(levels)} for field, levels in ENUM_FIELDS.items()}
+
+# Labels indexed by code; MISSING picks the trailing None
+_LABELS = {field: np.array(levels + [None], dtype=object) for field, levels in ENUM_FIELDS.items()}
+
+_INITIAL_CAPACITY = 16
+
+
+def timestamp(value):
+    """Seconds since the epoch from a number or an ISO date/time string, as saved by older versions."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return datetime.fromisoformat(value).timestamp()
+
+
+class _LazyColumns(dict):
+    """Column dict whose values may be zero-argument loaders.
+
+    A loader is replaced by the array it returns the first time the column
+    is read, so columns a page never touches are never decoded.
+    """
+
+    def __getitem__(self, field):
+        values = dict.__getitem__(self, field)
+        if callable(values):
+            values = values()
+            dict.__setitem__(self, field, values)
+        return values
+
+    def items(self):
+        return [(field, self[field]) for field in self]
+
+
+class InitiativeStore:
+    """Initiatives stored column-wise with stable IDs and a name index.
+
+    Removed rows are tombstoned and compacted once they make up half the
+    table, so IDs never change and removal does not shift other records.
+    ``version`` increases on every mutation and can be used as a cache key;
+    subscribers are told about each version bump together with the
+    ``(old, new)`` record pairs it changed (``old`` is None for additions,
+    ``new`` is None for removals).
+    """
+
+    def __init__(self, records=()):
+        self._capacity = _INITIAL_CAPACITY
+        self._size = 0
+        self._ids = np.zeros(self._capacity, dtype=np.int64)
+        self._alive = np.zeros(self._capacity, dtype=bool)
+        self._columns = {field: self._empty_column(field, self._capacity) for field in FIELDS}
+        self._row_of = {}
+        self._id_of_name = {}
+        self._next_id = 1
+        self._dead = 0
+        self.version = 0
+        self._live_cache = (None, None)
+        self._frame_cache = (None, None)
+        self._subscribers = []
+        if records:
+            self.extend(records)
+
+    @classmethod
+    def from_columns(cls, ids, columns):
+        """Build a store from whole columns, e.g. a reloaded snapshot.
+
+        ``columns`` maps fields to writable arrays of ``len(ids)`` values
+        (object arrays with None for missing text, int8 level codes with
+        ``MISSING`` for ordinal fields, floats with NaN for missing numbers
+        and timestamps), or to loaders returning such an array on first use. Fields left out
+        are empty. The data is trusted as-is: it is not validated.
+        """
+        store = cls()
+        size = len(ids)
+        store._capacity = store._size = size
+        store._ids = np.array(ids, dtype=np.int64)
+        store._alive = np.ones(size, dtype=bool)
+        store._columns = _LazyColumns(
+            (field, columns.get(field, lambda field=field: cls._empty_column(field, size))) for field in FIELDS
+        )
+        id_list = store._ids.tolist()
+        store._row_of = dict(zip(id_list, range(size)))
+        store._id_of_name = dict(zip(store._columns["name"].tolist(), id_list))
+        store._next_id = max(id_list, default=0) + 1
+        return store
+
+    @staticmethod
+    def _empty_column(field, size):
+        if field in _FLOAT_FIELDS:
+            return np.full(size, np.nan)
+        if field in ENUM_FIELDS:
+            return np.full(size, MISSING, dtype=np.int8)
+        return np.full(size, None, dtype=object)
+
+    def __len__(self):
+        return len(self._row_of)
+
+    def __contains__(self, name):
+        return name in self._id_of_name
+
+    def __iter__(self):
+        return self.records()
+
+    def _grow(self, needed):
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, self._capacity * 2)
+        self._ids = np.resize(self._ids, capacity)
+        self._alive = np.concatenate([self._alive[:self._size], np.zeros(capacity - self._size, dtype=bool)])
+        for field, values in self._columns.items():
+            column = self._empty_column(field, capacity)
+            column[:self._size] = values[:self._size]
+            self._columns[field] = column
+        self._capacity = capacity
+
+    def _changed(self, changes=()):
+        self.version += 1
+        for callback in self._subscribers:
+            callback(self, changes)
+
+    def subscribe(self, callback):
+        """Call ``callback(store, changes)`` after every mutation."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def _validate(self, record, initiative_id=None):
+        name = record.get("name")
+        if not name:
+            raise ValueError("Initiative name is required")
+        existing = self._id_of_name.get(name)
+        if existing is not None and existing != initiative_id:
+            raise ValueError(f"An initiative named '{name}' already exists")
+        for field, levels in ENUM_FIELDS.items():
+            value = record.get(field)
+            if value is not None and value not in levels:
+                raise ValueError(f"Invalid {field} '{value}' for initiative '{name}'")
+        for field in TIMESTAMP_FIELDS:
+            try:
+                timestamp(record.get(field))
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid {field} '{record[field]}' for initiative '{name}'") from None
+
+    def _write(self, row, record):
+        for field, value in record.items():
+            if field not in self._columns:
+                continue
+            if field in ENUM_FIELDS:
+                value = _CODES[field].get(value, MISSING)
+            elif field in TIMESTAMP_FIELDS:
+                value = timestamp(value)
+            self._columns[field][row] = np.nan if value is None and field in _FLOAT_FIELDS else value
+
+    def add(self, record):
+        """Append one initiative and return its ID."""
+        return self.extend([record])[0]
+
+    def extend(self, records):
+        """Append many initiatives in one batch and return their IDs.
+
+        The batch is validated up front (including duplicate names within
+        it), so either every record is added or none are.
+        """
+        records = list(records)
+        batch_names = set()
+        for record in records:
+            self._validate(record)
+            if record["name"] in batch_names:
+                raise ValueError(f"An initiative named '{record['name']}' already exists")
+            batch_names.add(record["name"])
+
+        self._grow(self._size + len(records))
+        ids = []
+        for record in records:
+            row = self._size
+            initiative_id = self._next_id
+            self._next_id += 1
+            self._size += 1
+            self._ids[row] = initiative_id
+            self._alive[row] = True
+            self._write(row, record)
+            self._row_of[initiative_id] = row
+            self._id_of_name[record["name"]] = initiative_id
+            ids.append(initiative_id)
+        if ids:
+            changes = [(None, self.get(i)) for i in ids] if self._subscribers else ()
+            self._changed(changes)
+        return ids
+
+    def update(self, initiative_id, fields):
+        """Update fields of an existing initiative in place."""
+        row = self._row_of[initiative_id]
+        old_name = self._columns["name"][row]
+        merged = {**self.get(initiative_id), **fields}
+        self._validate(merged, initiative_id)
+        old = self.get(initiative_id) if self._subscribers else None
+        self._write(row, fields)
+        if merged["name"] != old_name:
+            del self._id_of_name[old_name]
+            self._id_of_name[merged["name"]] = initiative_id
+        self._changed([(old, self.get(initiative_id))] if self._subscribers else ())
+
+    def remove(self, initiative_id):
+        """Remove an initiative; other IDs are unaffected."""
+        old = self.get(initiative_id) if self._subscribers else None
+        row = self._row_of.pop(initiative_id)
+        del self._id_of_name[self._columns["name"][row]]
+        self._alive[row] = False
+        self._dead += 1
+        self._changed([(old, None)] if self._subscribers else ())
+        if self._dead > _INITIAL_CAPACITY and self._dead * 2 > self._size:
+            self._compact()
+
+    def _compact(self):
+        rows = self._live_rows()
+        self._ids[:len(rows)] = self._ids[rows]
+        for field, values in self._columns.items():
+            column = self._empty_column(field, self._capacity)
+            column[:len(rows)] = values[rows]
+            self._columns[field] = column
+        self._alive[:] = False
+        self._alive[:len(rows)] = True
+        self._size = len(rows)
+        self._dead = 0
+        self._row_of = {int(initiative_id): row for row, initiative_id in enumerate(self._ids[:self._size])}
+        self._changed()
+
+    def _live_rows(self):
+        version, rows = self._live_cache
+        if version != self.version:
+            rows = np.flatnonzero(self._alive[:self._size])
+            self._live_cache = (self.version, rows)
+        return rows
+
+    def id_for(self, name):
+        """ID of the initiative called ``name``, or None."""
+        return self._id_of_name.get(name)
+
+    def get(self, initiative_id):
+        """One initiative as a dict; fields never set are omitted."""
+        row = self._row_of[initiative_id]
+        record = {"id": initiative_id}
+        for field, values in self._columns.items():
+            value = values[row]
+            if field in ENUM_FIELDS:
+                value = _LABELS[field][value]
+            if value is None or (field in _FLOAT_FIELDS and np.isnan(value)):
+                continue
+            record[field] = value.item() if isinstance(value, np.generic) else value
+        return record
+
+    def ids(self):
+        """IDs of all initiatives in insertion order."""
+        return self._ids[self._live_rows()]
+
+    def names(self):
+        return list(self._columns["name"][self._live_rows()])
+
+    def column(self, field, fill=None):
+        """All values of ``field`` in insertion order.
+
+        Ordinal fields are returned as labels; use ``codes`` to score them.
+        ``fill`` replaces missing values (NaN for numbers and timestamps,
+        None for the others).
+        """
+        values = self._columns[field][self._live_rows()]
+        if field in ENUM_FIELDS:
+            values = _LABELS[field][values]
+        if fill is not None:
+            if field in _FLOAT_FIELDS:
+                values = np.where(np.isnan(values), fill, values)
+            else:
+                values = np.where(values == None, fill, values)  # noqa: E711
+        return values
+
+    def codes(self, field):
+        """Level codes of the ordinal ``field`` in insertion order.
+
+        A code indexes ``ENUM_FIELDS[field]``; unset values are ``MISSING``.
+        """
+        return self._columns[field][self._live_rows()]
+
+    def records(self, ids=None):
+        """Iterate initiatives as dicts, in insertion order or the order of ``ids``."""
+        for initiative_id in (self.ids() if ids is None else ids):
+            yield self.get(int(initiative_id))
+
+    def frame(self):
+        """The portfolio as a DataFrame indexed by ID, cached per version.
+
+        Ordinal fields are ordered Categoricals. Treat the result as
+        read-only; it is shared between callers until the store changes.
+        """
+        version, frame = self._frame_cache
+        if version == self.version:
+            return frame
+
+        import pandas as pd
+
+        rows = self._live_rows()
+        data = {}
+        for field in FIELDS:
+            values = self._columns[field][rows]
+            if field in ENUM_FIELDS:
+                values = pd.Categorical.from_codes(values, categories=ENUM_FIELDS[field], ordered=True)
+            data[field] = values
+        frame = pd.DataFrame(data, index=pd.Index(self._ids[rows], name="id"))
+        self._frame_cache = (self.version, frame)
+        return frame
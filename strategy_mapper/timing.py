@@ -0,0 +1,287 @@
+"""Rerun instrumentation: how long each section of a rerun takes, and why reruns happen.
+
+Switched on with ``STRATEGY_MAPPER_TIMINGS=1``. Sections are timed with
+``section(name)`` and attributed to the page being shown. Totals for the
+process are kept in Prometheus text format. They are written to
+``STRATEGY_MAPPER_METRICS_FILE`` and served at
+``http://localhost:<STRATEGY_MAPPER_METRICS_PORT>/metrics`` when those are
+set; if the port cannot be bound, an error is logged and the endpoint stays
+off for the rest of the process. The last runs of each session are kept for the sidebar debug panel.
+
+When switched off, ``section`` returns one shared no-op context manager and
+the other entry points return straight away, so instrumented code costs a
+function call per section.
+"""
+
+import contextlib
+import functools
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get("STRATEGY_MAPPER_TIMINGS", "") not in ("", "0")
+
+METRICS_FILE = os.environ.get("STRATEGY_MAPPER_METRICS_FILE")
+METRICS_PORT = os.environ.get("STRATEGY_MAPPER_METRICS_PORT")
+
+# The metrics file is rewritten at most this often
+WRITE_INTERVAL_SECONDS = 10
+
+# Session-state key of the session's SessionTimings
+STATE_KEY = "timings"
+
+_NULL = contextlib.nullcontext()
+
+
+class Metrics:
+    """Process-wide section timings and rerun counts, safe to share between sessions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sections = {}
+        self._reruns = {}
+        self._written_at = 0.0
+
+    def record(self, page, section, seconds):
+        with self._lock:
+            stats = self._sections.get((page, section))
+            if stats is None:
+                self._sections[(page, section)] = [1, seconds, seconds]
+            else:
+                stats[0] += 1
+                stats[1] += seconds
+                stats[2] = max(stats[2], seconds)
+
+    def rerun(self, trigger):
+        with self._lock:
+            self._reruns[trigger] = self._reruns.get(trigger, 0) + 1
+
+    def prometheus(self):
+        """The metrics in the Prometheus text exposition format."""
+        with self._lock:
+            sections = sorted((key, list(stats)) for key, stats in self._sections.items())
+            reruns = sorted(self._reruns.items())
+        lines = [
+            "# HELP strategy_mapper_section_seconds Time spent in each section of a rerun.",
+            "# TYPE strategy_mapper_section_seconds summary",
+        ]
+        for (page, section), (count, total, _) in sections:
+            labels = _labels(page=page, section=section)
+            lines.append(f"strategy_mapper_section_seconds_count{labels} {count}")
+            lines.append(f"strategy_mapper_section_seconds_sum{labels} {total:.6f}")
+        lines += [
+            "# HELP strategy_mapper_section_seconds_max Slowest time in each section of a rerun.",
+            "# TYPE strategy_mapper_section_seconds_max gauge",
+        ]
+        for (page, section), (_, _, slowest) in sections:
+            lines.append(f"strategy_mapper_section_seconds_max{_labels(page=page, section=section)} {slowest:.6f}")
+        lines += [
+            "# HELP strategy_mapper_reruns_total Script reruns by what triggered them.",
+            "# TYPE strategy_mapper_reruns_total counter",
+        ]
+        for trigger, count in reruns:
+            lines.append(f"strategy_mapper_reruns_total{_labels(trigger=trigger)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, force=False):
+        """Write ``prometheus()`` to ``path`` (atomically), at most every ``WRITE_INTERVAL_SECONDS``."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._written_at < WRITE_INTERVAL_SECONDS:
+                return
+            self._written_at = now
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as file:
+            file.write(self.prometheus())
+        os.replace(temporary, path)
+
+
+def _labels(**labels):
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in labels.items()) + "}"
+
+
+metrics = Metrics()
+
+
+class SessionTimings:
+    """One session's section timings: the last run, and totals since the session started."""
+
+    def __init__(self):
+        self.page = None
+        self.running = False
+        self.started = None
+        self.last_run = []
+        self.last_seconds = None
+        self.current = []
+        self.stats = {}
+
+    def add(self, section, seconds):
+        self.current.append((section, seconds))
+        stats = self.stats.get((self.page, section))
+        if stats is None:
+            self.stats[(self.page, section)] = [1, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def slowest(self, count=10):
+        """``(page, section, runs, mean, max)`` of the sections with the slowest single run."""
+        rows = [(page, section, runs, total / runs, slowest)
+                for (page, section), (runs, total, slowest) in self.stats.items()]
+        return sorted(rows, key=lambda row: row[4], reverse=True)[:count]
+
+
+def _session():
+    import streamlit as st
+
+    return st.session_state.get(STATE_KEY)
+
+
+def _record(section, seconds):
+    timings = _session()
+    if timings is None:
+        metrics.record("", section, seconds)
+        return
+    metrics.record(timings.page or "", section, seconds)
+    timings.add(section, seconds)
+
+
+class _Section:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        _record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def section(name):
+    """Context manager timing the block as section ``name`` of the current run."""
+    if not ENABLED:
+        return _NULL
+    return _Section(name)
+
+
+def timed(name):
+    """Decorator timing each call as section ``name``.
+
+    For fragments: a call outside a full script run is a fragment rerun,
+    which is counted as a rerun triggered by ``fragment:<name>``.
+    """
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            timings = _session()
+            if timings is not None and not timings.running:
+                metrics.rerun(f"fragment:{name}")
+                timings.current = []
+            with _Section(name):
+                result = function(*args, **kwargs)
+            if timings is not None and not timings.running:
+                timings.last_run, timings.current = timings.current, []
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def plotly_chart(name, figure, **kwargs):
+    """``st.plotly_chart(figure, **kwargs)``, timed as section ``chart:<name>``."""
+    import streamlit as st
+
+    with section(f"chart:{name}"):
+        return st.plotly_chart(figure, **kwargs)
+
+
+_server_lock = threading.Lock()
+_server = None
+# Set once the endpoint has been started, or has failed to start
+_serving_attempted = False
+
+
+def _serve_metrics(port):
+    global _server, _serving_attempted
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    with _server_lock:
+        if _serving_attempted:
+            return
+        _serving_attempted = True
+        try:
+            # Local only: the metrics name pages and sections, not users
+            _server = ThreadingHTTPServer(("127.0.0.1", int(port)), Handler)
+        except (OSError, ValueError) as exc:
+            # E.g. the port is taken; the app runs on without the endpoint
+            logger.error("metrics endpoint disabled: cannot serve on port %s: %s", port, exc)
+            return
+        threading.Thread(target=_server.serve_forever, daemon=True).start()
+
+
+def start_run(page):
+    """Start timing a full script run of ``page`` and count what triggered it."""
+    if not ENABLED:
+        return
+    import streamlit as st
+
+    timings = st.session_state.get(STATE_KEY)
+    if timings is None:
+        timings = st.session_state[STATE_KEY] = SessionTimings()
+        trigger = "session_start"
+    elif page != timings.page:
+        trigger = "navigation"
+    else:
+        trigger = "interaction"
+    metrics.rerun(trigger)
+    if METRICS_PORT and not _serving_attempted:
+        _serve_metrics(METRICS_PORT)
+    timings.page = page
+    timings.running = True
+    timings.current = []
+    timings.started = time.perf_counter()
+
+
+def finish_run():
+    """Finish the run started by ``start_run`` and update the metrics file."""
+    if not ENABLED:
+        return
+    timings = _session()
+    if timings is None or not timings.running:
+        return
+    timings.running = False
+    timings.last_run, timings.current = timings.current, []
+    timings.last_seconds = time.perf_counter() - timings.started
+    metrics.record(timings.page or "", "run", timings.last_seconds)
+    if METRICS_FILE:
+        metrics.write(METRICS_FILE)
@@ -0,0 +1,289 @@
+"""Persistent workspaces on local SQLite.
+
+A workspace holds one session's goals, initiatives, stakeholders, saved
+assessment and business-unit assessments. Every record is a JSON row keyed by ``(workspace, kind,
+record_id)``, so opening a workspace is a single primary-key range scan and
+saving touches only the rows that changed. Changes are collected after each
+script run and written in one transaction once the session has been idle for
+``DEBOUNCE_SECONDS``.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import weakref
+
+from strategy_mapper import export
+from strategy_mapper.store import TIMESTAMP_FIELDS, timestamp
+
+DEFAULT_PATH = "workspaces.db"
+DEBOUNCE_SECONDS = 1.0
+
+# How long a write waits for another session's transaction to finish
+BUSY_TIMEOUT_SECONDS = 30
+
+# Session-state entries persisted as a list of records, one row per position
+LIST_KINDS = ["goals", "stakeholders", "unit_assessments"]
+
+# Session-state entries persisted as a single row
+VALUE_KINDS = ["business_objective", "capability_assessment"]
+
+INITIATIVES = "initiatives"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    workspace TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    record_id INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (workspace, kind, record_id)
+) WITHOUT ROWID
+"""
+
+_SELECT = "SELECT kind, record_id, data FROM records WHERE workspace = ? ORDER BY kind, record_id"
+_UPSERT = (
+    "INSERT INTO records (workspace, kind, record_id, data) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (workspace, kind, record_id) DO UPDATE SET data = excluded.data"
+)
+_DELETE = "DELETE FROM records WHERE workspace = ? AND kind = ? AND record_id = ?"
+_DELETE_KIND = "DELETE FROM records WHERE workspace = ? AND kind = ?"
+
+
+# Open workspaces, flushed at interpreter exit without keeping sessions alive
+_open = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for workspace in list(_open):
+        workspace.flush()
+
+
+def default_path():
+    """Database file, overridable with ``STRATEGY_MAPPER_DB``."""
+    return os.environ.get("STRATEGY_MAPPER_DB", DEFAULT_PATH)
+
+
+def _upgrade_timestamps(record):
+    # Older versions saved timestamps as text, and imports kept any text given
+    for field in TIMESTAMP_FIELDS:
+        if isinstance(record.get(field), str):
+            try:
+                record[field] = timestamp(record[field])
+            except ValueError:
+                del record[field]
+
+
+def _default(value):
+    # Record classes (such as stakeholders) are saved as their labelled dicts
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict is not None else str(value)
+
+
+def _dumps(value):
+    return json.dumps(value, separators=(",", ":"), default=_default)
+
+
+class Workspace:
+    """One workspace in a SQLite database, with debounced incremental saves.
+
+    ``load()`` returns the saved state; ``track(state)`` then records what was
+    loaded, and each later ``track(state)`` call queues only the rows that
+    differ from what has already been queued or written. Initiatives are
+    followed through the store's change feed rather than compared, and the
+    lists are compared only when their version has changed.
+    """
+
+    def __init__(self, path, workspace_id, debounce=DEBOUNCE_SECONDS):
+        self.path = path
+        self.workspace_id = workspace_id
+        self.debounce = debounce
+        self.writes = 0
+        self._conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._pending = {}
+        self._cleared = set()
+        self._saved = {}
+        self._list_versions = {}
+        self._store = None
+        self._initiative_keys = {}
+        self._loaded_keys = None
+        self._next_key = 1
+        self._rewrite = None
+        self._flush_lock = threading.Lock()
+        _open.add(self)
+
+    def load(self):
+        """Saved state as a dict of session-state values (initiatives as records)."""
+        state = {kind: [] for kind in LIST_KINDS + [INITIATIVES]}
+        keys = []
+        with self._lock:
+            for kind, record_id, data in self._conn.execute(_SELECT, (self.workspace_id,)):
+                value = json.loads(data)
+                if kind == INITIATIVES:
+                    value.pop("id", None)
+                    _upgrade_timestamps(value)
+                    keys.append(record_id)
+                    state[kind].append(value)
+                elif kind in LIST_KINDS:
+                    self._saved.setdefault(kind, []).append(data)
+                    state[kind].append(value)
+                else:
+                    self._saved[kind] = data
+                    state[kind] = value
+            self._loaded_keys = keys
+        return state
+
+    def track(self, state, version=None):
+        """Queue writes for everything in ``state`` that changed since the last call.
+
+        ``version(kind)`` gives the current version of each list in
+        ``LIST_KINDS`` (``DerivedData.version``); a list is only compared
+        with what was saved when its version has changed. Without it every
+        list is compared on every call.
+        """
+        with self._lock:
+            store = state.get(INITIATIVES)
+            if store is not None and store is not self._store:
+                self._attach(store)
+            for kind in LIST_KINDS:
+                current = None if version is None else version(kind)
+                if current is not None and self._list_versions.get(kind) == current:
+                    continue
+                self._track_list(kind, state.get(kind) or [])
+                self._list_versions[kind] = current
+            for kind in VALUE_KINDS:
+                self._track_value(kind, state.get(kind))
+            if self._pending or self._cleared or self._rewrite is not None:
+                self._schedule()
+
+    def _attach(self, store):
+        keys = self._loaded_keys
+        if self._store is None and keys is not None and len(keys) == len(store):
+            # The store was just built from load(); map its IDs to saved rows
+            self._initiative_keys = dict(zip((int(i) for i in store.ids()), keys))
+            self._next_key = max(keys, default=0) + 1
+        else:
+            # A different store replaced the portfolio (an import or a
+            # snapshot); rewrite it in full. The store's per-version frame is
+            # taken here, in the script run, so the timer thread serializes a
+            # copy the session cannot edit or compact meanwhile
+            self._clear_kind(INITIATIVES)
+            ids = store.ids().tolist()
+            self._initiative_keys = dict(zip(ids, ids))
+            self._next_key = max(ids, default=0) + 1
+            self._rewrite = store.frame()
+        self._loaded_keys = None
+        self._store = store
+        store.subscribe(self._on_initiatives_changed)
+
+    def _on_initiatives_changed(self, store, changes):
+        if store is not self._store:
+            return
+        with self._lock:
+            for old, new in changes:
+                self._queue_initiative(old, new)
+            if self._pending:
+                self._schedule()
+
+    def _queue_initiative(self, old, new):
+        if new is None:
+            key = self._initiative_keys.pop(old["id"], None)
+            if key is not None:
+                self._pending[(INITIATIVES, key)] = None
+            return
+        key = self._initiative_keys.get(new["id"])
+        if key is None:
+            key = self._initiative_keys[new["id"]] = self._next_key
+            self._next_key += 1
+        self._pending[(INITIATIVES, key)] = _dumps(new)
+
+    def _clear_kind(self, kind):
+        self._cleared.add(kind)
+        if kind == INITIATIVES:
+            self._rewrite = None
+        for key in [key for key in self._pending if key[0] == kind]:
+            del self._pending[key]
+
+    def _track_list(self, kind, items):
+        saved = self._saved.setdefault(kind, [])
+        for position, item in enumerate(items):
+            data = _dumps(item)
+            if position < len(saved):
+                if saved[position] == data:
+                    continue
+                saved[position] = data
+            else:
+                saved.append(data)
+            self._pending[(kind, position)] = data
+        for position in range(len(items), len(saved)):
+            self._pending[(kind, position)] = None
+        del saved[len(items):]
+
+    def _track_value(self, kind, value):
+        data = None if value is None else _dumps(value)
+        if self._saved.get(kind) != data:
+            self._saved[kind] = data
+            self._pending[(kind, 0)] = data
+
+    def _schedule(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.debounce, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """Write all queued changes in one transaction."""
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not (self._pending or self._cleared or self._rewrite is not None):
+                    return
+                pending, cleared, rewrite = self._pending, self._cleared, self._rewrite
+                self._pending, self._cleared, self._rewrite = {}, set(), None
+
+            # Serialize a replaced portfolio outside the lock so script runs
+            # are not held up. Initiatives edited or removed since it was
+            # taken are queued by the change feed and written from there
+            rows = []
+            if rewrite is not None:
+                for record in export.initiative_records(rewrite, rewrite.index):
+                    if (INITIATIVES, record["id"]) in pending:
+                        continue
+                    del record["type"]
+                    rows.append((INITIATIVES, record["id"], _dumps(record)))
+            rows.extend((kind, key, data) for (kind, key), data in pending.items() if data is not None)
+
+            workspace = self.workspace_id
+            try:
+                with self._conn:
+                    self._conn.executemany(_DELETE_KIND, [(workspace, kind) for kind in cleared])
+                    self._conn.executemany(
+                        _DELETE, [(workspace, kind, key) for (kind, key), data in pending.items() if data is None]
+                    )
+                    self._conn.executemany(_UPSERT, [(workspace, kind, key, data) for kind, key, data in rows])
+            except sqlite3.OperationalError:
+                # Still locked after the busy timeout; requeue behind any newer changes and retry
+                with self._lock:
+                    self._pending = {**pending, **self._pending}
+                    if self._rewrite is None and INITIATIVES not in self._cleared:
+                        self._rewrite = rewrite
+                    self._cleared |= cleared
+                    self._schedule()
+                return
+            self.writes += 1
+
+    def close(self):
+        self.flush()
+        _open.discard(self)
+        self._conn.close()
@@ -0,0 +1,53 @@
+import csv
+import json
+
+from strategy_mapper import batch
+
+
+def _write_portfolio(path, rows):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_partially_analysed_portfolio(tmp_path):
+    # The top-ranked initiative (the only quick win) has no impact figures yet
+    rows = [
+        {
+            "name": f"Initiative {i}",
+            "business_problem": "Problem",
+            "complexity": "Low",
+            "business_impact": "High" if i == 0 else "Low",
+            "timeline": "3-6 months",
+            "investment_required": "" if i == 0 else 100_000,
+            "total_benefits": "" if i == 0 else 110_000,
+        }
+        for i in range(6)
+    ]
+    _write_portfolio(tmp_path / "partial.csv", rows)
+
+    summary = batch.run_portfolio(str(tmp_path / "partial.csv"), str(tmp_path))
+
+    assert summary["status"] == "ok", summary.get("message")
+    assert summary["initiatives"] == 6
+    assert summary["top_initiative"] == "Initiative 0"
+    with open(tmp_path / "partial.ndjson") as file:
+        records = [json.loads(line) for line in file]
+    timeline = [record for record in records if record["type"] == "timeline"]
+    assert [item["initiative"] for item in timeline][0] == "Initiative 0"
+    assert timeline[0]["investment"] is None
+    assert timeline[1]["investment"] == 100_000
+
+
+def test_run_reports_failed_portfolio(tmp_path):
+    source = tmp_path / "in"
+    source.mkdir()
+    _write_portfolio(source / "good.csv", [{"name": "A", "business_problem": "Problem"}])
+    (source / "bad.json").write_text("not json")
+
+    results = batch.run(str(source), str(tmp_path / "out"), workers=1)
+
+    statuses = {result["portfolio"]: result["status"] for result in results}
+    assert statuses == {"bad": "failed", "good": "ok"}
+    assert (tmp_path / "out" / batch.SUMMARY_FILE).exists()
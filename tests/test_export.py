@@ -0,0 +1,76 @@
+import json
+from datetime import datetime
+
+from strategy_mapper import export, portfolio
+from strategy_mapper.stakeholders import Stakeholder
+from strategy_mapper.store import InitiativeStore
+
+
+def _store(count):
+    return InitiativeStore([
+        {"name": f"Initiative {i}", "business_problem": "Problem", "expected_roi": float(i),
+         "payback_period": float("inf") if i == 0 else 1.5}
+        for i in range(count)
+    ])
+
+
+def _report(store, stakeholders=()):
+    return export.report_records(
+        portfolio.summarize(store), store.frame(), portfolio.priority_order(store), list(stakeholders),
+        generated=datetime(2025, 1, 1),
+    )
+
+
+def test_report_is_header_then_initiatives_in_order_then_stakeholders():
+    store = _store(3)
+    people = [Stakeholder.from_dict({"name": "Ada", "role": "CFO"})]
+
+    records = [json.loads(line) for line in export.ndjson_lines(_report(store, people))]
+
+    assert [record["type"] for record in records] == ["header", "initiative", "initiative", "initiative",
+                                                      "stakeholder"]
+    assert records[0]["total_initiatives"] == 3 and records[0]["stakeholders"] == 1
+    assert [record["name"] for record in records[1:4]] == ["Initiative 2", "Initiative 1", "Initiative 0"]
+    # Infinite payback is written as null; fields never set are left out
+    assert records[3]["payback_period"] is None
+    assert "owner" not in records[1]
+
+
+def test_initiative_records_span_chunks():
+    store = _store(export.CHUNK_SIZE * 2 + 5)
+    ids = store.ids()[::-1]
+
+    records = list(export.initiative_records(store.frame(), ids))
+
+    assert [record["id"] for record in records] == ids.tolist()
+
+
+def test_export_job_reads_the_portfolio_as_it_was():
+    store = _store(50)
+    job = export.ExportJob("key", _report(store))
+    store.update(store.id_for("Initiative 3"), {"name": "Renamed"})
+    store.remove(store.id_for("Initiative 4"))
+
+    assert job.wait(10)
+    assert job.error is None and job.rows == 51
+    names = [json.loads(line).get("name") for line in job.read().splitlines()]
+    assert "Initiative 3" in names and "Initiative 4" in names and "Renamed" not in names
+
+
+def test_export_job_reports_errors():
+    def failing():
+        yield {"type": "header"}
+        raise RuntimeError("disk full")
+
+    job = export.ExportJob("key", failing())
+
+    assert job.wait(10)
+    assert isinstance(job.error, RuntimeError)
+    assert job.rows == 1
+
+
+def test_finite():
+    assert export.finite(float("nan")) is None
+    assert export.finite(float("-inf")) is None
+    assert export.finite(1.5) == 1.5
+    assert export.finite("text") == "text"
@@ -0,0 +1,144 @@
+import io
+
+import pytest
+
+from strategy_mapper import export, importer, portfolio
+from strategy_mapper.stakeholders import Stakeholder
+from strategy_mapper.store import TEXT_FIELDS, InitiativeStore
+
+
+def _rows(text, fmt="csv", collection="initiatives"):
+    return importer.iter_rows(io.BytesIO(text.encode()), fmt, collection)
+
+
+def test_missing_optional_columns_default_like_the_form():
+    store = InitiativeStore()
+    result = importer.import_initiatives(store, _rows(
+        "name,business_problem,owner\n"
+        "Churn model,Customers leave,\n"
+    ))
+
+    assert result["added"] == 1 and result["error_count"] == 0
+    initiative = next(store.records())
+    for field in TEXT_FIELDS:
+        assert field in initiative
+    assert initiative["ai_solution"] == ""
+    assert initiative["owner"] == ""
+    assert initiative["timeline"] == importer.INITIATIVE_DEFAULTS["timeline"]
+
+
+def test_invalid_rows_are_reported_and_skipped():
+    store = InitiativeStore([{"name": "Existing", "business_problem": "Problem"}])
+    result = importer.import_initiatives(store, _rows(
+        "name,business_problem,complexity,investment_required\n"
+        "Good,Problem,High,1000\n"
+        ",Problem,Low,\n"
+        "Bad level,Problem,Extreme,\n"
+        "Bad number,Problem,Low,lots\n"
+        "Existing,Problem,Low,\n"
+        "Good,Problem,Low,\n"
+    ))
+
+    assert result["rows"] == 6 and result["added"] == 1 and result["error_count"] == 5
+    assert [row for row, _ in result["errors"]] == [2, 3, 4, 5, 6]
+    assert "name is required" in result["errors"][0][1]
+    assert "complexity must be one of" in result["errors"][1][1]
+    assert "must be a number" in result["errors"][2][1]
+    assert "already exists" in result["errors"][3][1]
+    assert store.names() == ["Existing", "Good"]
+    assert store.get(store.id_for("Good"))["investment_required"] == 1000.0
+
+
+def test_malformed_ndjson_line_does_not_stop_the_import():
+    store = InitiativeStore()
+    result = importer.import_initiatives(store, _rows(
+        '{"name": "First", "business_problem": "Problem"}\n'
+        '{"name": "Broken", \n'
+        "\n"
+        '["not", "an", "object"]\n'
+        '{"name": "Last", "business_problem": "Problem"}\n',
+        "ndjson",
+    ))
+
+    assert store.names() == ["First", "Last"]
+    assert result["error_count"] == 2
+    assert result["errors"][0][1].startswith("Invalid JSON")
+    assert result["errors"][1][1] == "Expected an object"
+
+
+def test_json_array_is_read_in_pieces():
+    count = 2_000
+    text = "[" + ", ".join(
+        f'{{"name": "Initiative {i}", "business_problem": "{"x" * 50}"}}' for i in range(count)
+    ) + "]"
+    assert len(text) > 2 * importer._READ_SIZE
+    store = InitiativeStore()
+    chunks = []
+
+    result = importer.import_initiatives(store, _rows(text, "json"), on_chunk=chunks.append, chunk_size=500)
+
+    assert result["added"] == count and result["error_count"] == 0
+    assert chunks == [500, 1000, 1500, 2000, 2000]
+
+
+def test_truncated_json_keeps_the_rows_before_it():
+    store = InitiativeStore()
+    result = importer.import_initiatives(store, _rows(
+        '[{"name": "First", "business_problem": "Problem"}, {"name": "Cut', "json"
+    ))
+
+    assert store.names() == ["First"]
+    assert result["error_count"] == 1 and "Could not read file" in result["errors"][0][1]
+
+
+def test_export_round_trips_through_import():
+    source = InitiativeStore([
+        {"name": "Churn model", "business_problem": "Customers leave", "owner": "Data team",
+         "timeline": "12+ months", "complexity": "High", "business_impact": "High",
+         "investment_required": 250_000.0, "payback_period": float("inf"), "created_at": 1_700_000_000.0},
+        {"name": "Sparse", "business_problem": "Unknown"},
+    ])
+    people = [Stakeholder.from_dict({"name": "Ada", "role": "CFO", "influence": "High", "sentiment": "Neutral"})]
+    records = export.report_records(
+        portfolio.summarize(source), source.frame(), portfolio.priority_order(source), people
+    )
+    data = b"".join(export.ndjson_lines(records))
+
+    store = InitiativeStore()
+    initiatives = importer.import_initiatives(store, importer.iter_rows(io.BytesIO(data), "ndjson", "initiatives"))
+    stakeholders = []
+    imported_people = importer.import_stakeholders(
+        stakeholders, importer.iter_rows(io.BytesIO(data), "ndjson", "stakeholders")
+    )
+
+    # The header and the other collection's records are skipped, not errors
+    assert initiatives == {"rows": 2, "added": 2, "error_count": 0, "errors": []}
+    assert imported_people["rows"] == 1 and imported_people["error_count"] == 0
+    churn = store.get(store.id_for("Churn model"))
+    original = source.get(source.id_for("Churn model"))
+    for field in ["owner", "timeline", "complexity", "business_impact", "investment_required", "created_at"]:
+        assert churn[field] == original[field]
+    assert "payback_period" not in churn
+    assert stakeholders[0].to_dict()["influence"] == "High"
+
+
+def test_assessments_need_unique_names():
+    assessments = [{"name": "Finance", "data_quality": "Good"}]
+    result = importer.import_assessments(assessments, _rows(
+        "name,data_quality,dev_ops\n"
+        "Finance,Poor,Basic\n"
+        "Sales,Excellent,\n"
+        "Ops,Great,Basic\n"
+    ))
+
+    assert result["added"] == 1 and result["error_count"] == 2
+    assert [assessment["name"] for assessment in assessments] == ["Finance", "Sales"]
+    assert "dev_ops" not in assessments[1]
+    assert "assessed_at" in assessments[1]
+
+
+def test_file_format_from_extension():
+    assert importer.file_format("Portfolio.JSONL") == "ndjson"
+    assert importer.file_format("portfolio.csv") == "csv"
+    with pytest.raises(ValueError):
+        importer.file_format("portfolio.xlsx")
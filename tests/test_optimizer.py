@@ -0,0 +1,100 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategy_mapper import optimizer
+from strategy_mapper.store import InitiativeStore
+
+
+def _items(count, seed):
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        "name": [f"Initiative {i}" for i in range(count)],
+        "investment": [rng.choice([0.0, rng.uniform(1, 100)]) for _ in range(count)],
+        "value": [rng.uniform(-20, 150) for _ in range(count)],
+    }, index=pd.Index(range(1, count + 1), name="id"))
+
+
+def _brute_force(items, budget, include=(), exclude=()):
+    """Best total value over every subset that fits, checked all at once."""
+    costs = items["investment"].to_numpy()
+    values = items["value"].to_numpy()
+    subsets = (np.arange(2 ** len(items))[:, None] >> np.arange(len(items))) & 1 == 1
+    forced = items.index.isin(list(include))
+    allowed = (subsets[:, forced].all(axis=1) & ~subsets[:, items.index.isin(list(exclude))].any(axis=1)
+               & (subsets @ costs <= budget))
+    return float((subsets[allowed] @ values).max())
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_exact_matches_brute_force(seed):
+    items = _items(12, seed)
+    budget = float(items["investment"].sum()) * random.Random(seed).uniform(0.1, 0.6)
+
+    result = optimizer.optimize(items, budget, "Exact")
+
+    assert result["optimal"] and result["method"] == "Exact"
+    assert result["value"] == pytest.approx(_brute_force(items, budget))
+    assert result["investment"] <= budget + 1e-9
+    assert result["selected"] == sorted(result["selected"])
+
+
+def test_include_and_exclude_are_honoured():
+    items = _items(10, seed=42)
+    budget = float(items["investment"].sum()) / 2
+    include, exclude = [2, 5], [1, 3]
+
+    result = optimizer.optimize(items, budget, "Exact", include, exclude)
+
+    assert set(include) <= set(result["selected"])
+    assert not set(exclude) & set(result["selected"])
+    assert result["value"] == pytest.approx(_brute_force(items, budget, include, exclude))
+    with pytest.raises(ValueError):
+        optimizer.optimize(items, 0.5, "Exact", include=[items["investment"].idxmax()])
+
+
+def test_greedy_is_within_half_of_the_optimum():
+    for seed in range(20):
+        items = _items(12, seed)
+        budget = float(items["investment"].sum()) / 3
+        greedy = optimizer.optimize(items, budget, "Fast (greedy)")
+        assert not greedy["optimal"]
+        assert greedy["investment"] <= budget + 1e-9
+        assert greedy["value"] >= _brute_force(items, budget) / 2 - 1e-9
+
+
+def test_node_limit_returns_the_best_selection_found():
+    values = np.random.default_rng(0).uniform(1, 10, 40)
+    costs = values * np.random.default_rng(1).uniform(0.95, 1.05, 40)
+    taken, finished = optimizer._branch_and_bound(values, costs, costs.sum() / 2, node_limit=50)
+    assert not finished
+    assert costs[taken].sum() <= costs.sum() / 2
+
+
+def test_ranked_selection_takes_priorities_while_they_fit():
+    items = pd.DataFrame({"name": list("abcd"), "investment": [60.0, 50.0, 30.0, 10.0], "value": [1.0] * 4},
+                         index=pd.Index([1, 2, 3, 4], name="id"))
+
+    result = optimizer.ranked_selection(items, [2, 1, 9, 3, 4], 100.0, exclude=[4])
+
+    # 1 no longer fits after 2; 9 has no impact analysis; 4 is excluded
+    assert result["selected"] == [2, 3]
+    assert result["investment"] == 80.0
+
+
+def test_candidates_leave_out_unanalysed_initiatives():
+    store = InitiativeStore([
+        {"name": "Analysed", "business_problem": "p", "timeline": "3-6 months",
+         "investment_required": 100.0, "total_benefits": 300.0, "technical_risk": "High"},
+        {"name": "Not analysed", "business_problem": "p"},
+    ])
+
+    plain = optimizer.candidates(store, "Annual benefits")
+    adjusted = optimizer.candidates(store, "Annual benefits", risk_adjusted=True)
+
+    assert plain["name"].tolist() == ["Analysed"]
+    assert plain["value"].iloc[0] == 300.0
+    assert adjusted["value"].iloc[0] == pytest.approx(300.0 * (1 - optimizer.RISK_DISCOUNTS["High"]))
+    assert optimizer.candidates(store)["value"].iloc[0] < 3 * 300.0
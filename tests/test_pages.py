@@ -0,0 +1,32 @@
+import io
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from strategy_mapper import importer
+from strategy_mapper.store import InitiativeStore
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # Keep the test session out of the real workspace database
+    monkeypatch.setenv("STRATEGY_MAPPER_DB", str(tmp_path / "workspaces.db"))
+    app = AppTest.from_file(APP, default_timeout=60)
+    app.run()
+    return app
+
+
+def test_initiative_list_shows_imported_initiatives_without_optional_fields(app):
+    store = InitiativeStore()
+    importer.import_initiatives(store, importer.iter_rows(
+        io.BytesIO(b"name,business_problem\nChurn model,Customers leave\n"), "csv", "initiatives"
+    ))
+    app.session_state.initiatives = store
+    app.session_state.current_page = "3. Initiative Definition"
+    app.run()
+
+    assert not app.exception
+    assert [expander.label for expander in app.expander if "Churn model" in expander.label]
@@ -0,0 +1,127 @@
+import random
+
+import numpy as np
+import pytest
+
+from strategy_mapper import portfolio
+from strategy_mapper.store import ENUM_FIELDS, MISSING, InitiativeStore
+
+LEVELS = ENUM_FIELDS["complexity"]
+
+
+def _record(rng, name):
+    return {
+        "name": name,
+        "business_problem": "Problem",
+        "complexity": rng.choice(LEVELS),
+        "business_impact": rng.choice(LEVELS),
+        # A few shared ROI values so that ties are common
+        "expected_roi": rng.choice([0.0, 50.0, 120.0, rng.uniform(-50, 300)]),
+        "investment_required": rng.choice([1e5, 2e5, rng.uniform(1e4, 1e6)]),
+    }
+
+
+def _expected_order(store, tie_break):
+    field, fill = portfolio.TIE_BREAKS[tie_break]
+    scores = portfolio.priority_scores(
+        portfolio.code_scores(store.codes("complexity")),
+        portfolio.code_scores(store.codes("business_impact")),
+        store.column("expected_roi", fill=0),
+    )
+    ids = store.ids().tolist()
+    ties = ids if field == "id" else store.column(field, fill=fill).tolist()
+    return [entry[2] for entry in sorted(zip((-scores).tolist(), ties, ids))]
+
+
+def test_level_lookups_follow_the_store_levels():
+    codes = np.array([0, 1, 2, MISSING])
+    assert portfolio.code_scores(codes).tolist() == [1, 2, 3, 2]
+    assert portfolio.code_scores(codes, default=0).tolist() == [1, 2, 3, 0]
+    assert portfolio.timeline_months(codes).tolist() == [
+        portfolio.TIMELINE_MONTHS[level] for level in ENUM_FIELDS["timeline"]
+    ] + [portfolio.TIMELINE_MONTHS["6-12 months"]]
+    assert ENUM_FIELDS["business_impact"][portfolio.HIGH] == "High"
+
+
+def test_priority_scores_rank_quick_wins_then_strategic_bets():
+    scores = portfolio.priority_scores([1, 3, 1], [3, 3, 1], [0.0, 0.0, 90.0])
+    assert scores.tolist() == [100.0, 50.0, 90.0]
+    assert portfolio.record_priority({"complexity": "Low", "business_impact": "High", "expected_roi": 5}) == 105.0
+
+
+@pytest.mark.parametrize("tie_break", list(portfolio.TIE_BREAKS))
+def test_priority_index_stays_sorted_through_edits(tie_break):
+    rng = random.Random(tie_break)
+    store = InitiativeStore([_record(rng, f"Initiative {i}") for i in range(300)])
+    index = portfolio.PriorityIndex(store, tie_break)
+    store.subscribe(lambda changed, changes: index.apply(changes))
+    assert index.ordered() == _expected_order(store, tie_break)
+
+    for step in range(600):
+        ids = store.ids().tolist()
+        action = rng.random()
+        if action < 0.3:
+            store.remove(rng.choice(ids))
+        elif action < 0.7:
+            fields = _record(rng, f"Edited {step}")
+            store.update(rng.choice(ids), fields)
+        else:
+            store.add(_record(rng, f"Added {step}"))
+        if step % 25 == 0:
+            expected = _expected_order(store, tie_break)
+            assert index.ordered() == expected
+            assert index.top(10) == expected[:10]
+
+    expected = _expected_order(store, tie_break)
+    assert index.ordered() == expected
+    assert index.top(len(store) + 5) == expected
+    assert len(index) == len(store)
+
+
+def test_priority_index_ordered_lists_do_not_change_later():
+    rng = random.Random(1)
+    store = InitiativeStore([_record(rng, f"Initiative {i}") for i in range(50)])
+    index = portfolio.PriorityIndex(store)
+    store.subscribe(lambda changed, changes: index.apply(changes))
+    before = index.ordered()
+    copy = list(before)
+
+    store.remove(before[0])
+    store.add(_record(rng, "New"))
+
+    assert before == copy
+    assert index.ordered() == _expected_order(store, portfolio.DEFAULT_TIE_BREAK)
+
+
+def test_priority_index_resorts_after_a_large_batch():
+    rng = random.Random(2)
+    store = InitiativeStore([_record(rng, f"Initiative {i}") for i in range(10)])
+    index = portfolio.PriorityIndex(store)
+    store.subscribe(lambda changed, changes: index.apply(changes))
+    index.ordered()
+
+    store.extend(_record(rng, f"Bulk {i}") for i in range(portfolio.RESORT_CHANGES + 1))
+
+    assert index.ordered() == _expected_order(store, portfolio.DEFAULT_TIE_BREAK)
+
+
+def test_priority_order_matches_the_index():
+    rng = random.Random(3)
+    store = InitiativeStore([_record(rng, f"Initiative {i}") for i in range(200)])
+    assert portfolio.priority_order(store).tolist() == portfolio.PriorityIndex(store).ordered()
+
+
+def test_summary_changes_match_a_full_summary():
+    rng = random.Random(4)
+    store = InitiativeStore([_record(rng, f"Initiative {i}") for i in range(20)])
+    summary = portfolio.summarize(store)
+    store.subscribe(lambda changed, changes: portfolio.apply_summary_changes(summary, changes))
+
+    store.remove(store.ids()[0].item())
+    store.update(store.ids()[0].item(), {"business_impact": "High", "investment_required": 1.0})
+    store.add(_record(rng, "New"))
+
+    expected = portfolio.summarize(store)
+    assert summary.keys() == expected.keys()
+    for key, value in expected.items():
+        assert summary[key] == pytest.approx(value)
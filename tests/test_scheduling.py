@@ -0,0 +1,116 @@
+import random
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from strategy_mapper import portfolio, scheduling
+from strategy_mapper.store import ENUM_FIELDS, InitiativeStore
+
+QUARTER = scheduling.MONTHS_PER_QUARTER
+
+
+def _store(count, seed):
+    rng = random.Random(seed)
+    return InitiativeStore([
+        {
+            "name": f"Initiative {i}",
+            "business_problem": "Problem",
+            "owner": rng.choice(["Ann", "Bo", "Cy", None]),
+            "timeline": rng.choice(ENUM_FIELDS["timeline"] + [None]),
+            "investment_required": rng.choice([None, 50_000.0, rng.uniform(1e4, 4e5)]),
+        }
+        for i in range(count)
+    ])
+
+
+def _reference(store, order, budget_cap, owner_limit):
+    """The same serial scheduling with linear scans instead of heaps and a segment tree."""
+    records = {record["id"]: record for record in store.records()}
+    months = dict(zip(ENUM_FIELDS["timeline"], portfolio.timeline_months(np.arange(3)).tolist()))
+    budgets = defaultdict(lambda: float(budget_cap))
+    slots = defaultdict(list)
+    starts = []
+    for initiative_id in order:
+        record = records[initiative_id]
+        duration = months.get(record.get("timeline"), portfolio.TIMELINE_MONTHS["6-12 months"])
+        owner = record.get("owner")
+        ready = 0
+        if owner_limit is not None and owner and len(slots[owner]) >= owner_limit:
+            ready = min(slots[owner])
+        start = ready
+        if budget_cap is not None:
+            amount = min(record.get("investment_required", 0), budget_cap)
+            quarter = ready // QUARTER
+            while budgets[quarter] < amount:
+                quarter += 1
+            budgets[quarter] -= amount
+            start = max(ready, quarter * QUARTER)
+        if owner_limit is not None and owner:
+            if len(slots[owner]) >= owner_limit:
+                slots[owner].remove(min(slots[owner]))
+            slots[owner].append(start + duration)
+        starts.append(start)
+    return starts
+
+
+@pytest.mark.parametrize("seed, budget_cap, owner_limit", [
+    (0, None, None), (1, None, 1), (2, None, 2), (3, 300_000, None), (4, 300_000, 1), (5, 120_000, 3),
+])
+def test_schedule_matches_reference(seed, budget_cap, owner_limit):
+    store = _store(150, seed)
+    order = portfolio.priority_order(store).tolist()
+
+    scheduled = scheduling.schedule(store, order, budget_cap, owner_limit)
+
+    assert scheduled.index.tolist() == order
+    assert scheduled["start_month"].tolist() == _reference(store, order, budget_cap, owner_limit)
+    assert (scheduled["quarter"] == scheduled["start_month"] // QUARTER).all()
+
+
+def test_schedule_respects_limits():
+    budget_cap, owner_limit = 250_000, 1
+    store = _store(200, seed=7)
+    scheduled = scheduling.schedule(store, portfolio.priority_order(store), budget_cap, owner_limit)
+
+    over = scheduled["over_budget"]
+    assert over.any()
+    assert (scheduled[~over].groupby("quarter")["investment"].sum() <= budget_cap + 1e-6).all()
+    for initiative_id, quarter in scheduled.loc[over, "quarter"].items():
+        # An initiative over the cap is the only commitment of its quarter
+        others = scheduled[(scheduled["quarter"] == quarter) & (scheduled.index != initiative_id)]
+        assert (others["investment"] == 0).all()
+    for _, rows in scheduled[scheduled["owner"].notna()].groupby("owner"):
+        intervals = sorted(zip(rows["start_month"], rows["end_month"]))
+        for (_, end), (start, _) in zip(intervals, intervals[1:]):
+            assert start >= end
+
+
+def test_unconstrained_schedule_starts_everything_at_once():
+    store = _store(20, seed=3)
+    scheduled = scheduling.schedule(store, store.ids())
+    assert (scheduled["start_month"] == 0).all()
+    assert not scheduled["over_budget"].any()
+
+
+def test_quarter_budgets_first_fit():
+    budgets = scheduling._QuarterBudgets(10, 100.0)
+    for quarter in [0, 1, 2, 4]:
+        budgets.spend(quarter, 80.0)
+    assert budgets.first_fit(0, 20.0) == 0
+    assert budgets.first_fit(0, 50.0) == 3
+    assert budgets.first_fit(4, 50.0) == 5
+    with pytest.raises(ValueError):
+        budgets.first_fit(0, 101.0)
+
+
+def test_gantt_rows_reach_past_the_nanosecond_range():
+    store = _store(3, seed=1)
+    scheduled = scheduling.schedule(store, store.ids())
+    scheduled.loc[:, "end_month"] = 12 * 400
+
+    rows = scheduling.gantt_rows(scheduled, datetime(2025, 1, 1), limit=2)
+
+    assert len(rows) == 2
+    assert rows["End"].iloc[0].year > 2262
@@ -0,0 +1,35 @@
+from strategy_mapper import snapshot
+from strategy_mapper.stakeholders import Stakeholder, stakeholder_frame
+from strategy_mapper.store import InitiativeStore
+
+
+def test_snapshot_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("STRATEGY_MAPPER_SNAPSHOTS", str(tmp_path))
+    store = InitiativeStore([
+        {"name": "Churn model", "business_problem": "Customers leave", "timeline": "3-6 months",
+         "complexity": "High", "investment_required": 1000.0, "created_at": 1_700_000_000.0},
+        {"name": "Sparse", "business_problem": "Unknown"},
+    ])
+    store.remove(store.id_for("Churn model"))
+    store.add({"name": "Forecasting", "business_problem": "Demand", "owner": "Ops"})
+    people = [Stakeholder.from_dict({"name": "Ada", "role": "CFO", "influence": "High", "sentiment": "Champion"})]
+    units = [{"name": "Finance", "data_quality": "Good", "assessed_at": 1_700_000_000.0}, {"name": "Sales"}]
+    assessment = {"readiness_score": 20, "scores": {"data_quality": "Good"}}
+    directory = snapshot.default_directory("../workspace 1")
+    path = snapshot.snapshot_path(directory, "Q3 plan")
+
+    snapshot.save(path, store, people, ["Grow"], assessment, "Growth", units)
+    data = snapshot.load(path)
+
+    loaded = data["initiatives"]
+    assert list(loaded.records()) == list(store.records())
+    assert loaded.add({"name": "Next", "business_problem": "Problem"}) == store.ids().max() + 1
+    assert [person.to_dict() for person in data["stakeholders"]] == [person.to_dict() for person in people]
+    assert data["stakeholder_frame"].equals(stakeholder_frame(people))
+    assert data["goals"] == ["Grow"] and data["business_objective"] == "Growth"
+    assert data["capability_assessment"] == assessment
+    assert data["unit_assessments"] == units
+    # Names are made safe for the file system, and kept inside the workspace's directory
+    assert snapshot.list_snapshots(directory) == ["Q3_plan"]
+    assert directory.startswith(str(tmp_path)) and ".." not in directory
+    assert snapshot.list_snapshots(snapshot.default_directory("another")) == []
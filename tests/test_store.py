@@ -0,0 +1,122 @@
+import math
+
+import numpy as np
+import pytest
+
+from strategy_mapper.store import MISSING, InitiativeStore
+
+
+def _records(count, start=0):
+    return [{"name": f"Initiative {i}", "business_problem": "Problem", "complexity": "Medium"}
+            for i in range(start, start + count)]
+
+
+def test_ids_are_stable_across_removal_and_compaction():
+    store = InitiativeStore(_records(100))
+    ids = store.ids().tolist()
+    # Removing more than half the table compacts it
+    for initiative_id in ids[:60]:
+        store.remove(initiative_id)
+
+    assert len(store) == 40
+    assert store.ids().tolist() == ids[60:]
+    for initiative_id in ids[60:]:
+        assert store.get(initiative_id)["name"] == f"Initiative {initiative_id - 1}"
+    with pytest.raises(KeyError):
+        store.get(ids[0])
+    # New IDs never reuse removed ones
+    assert store.add(_records(1, 1000)[0]) == ids[-1] + 1
+
+
+def test_removed_names_can_be_reused():
+    store = InitiativeStore(_records(3))
+    store.remove(store.id_for("Initiative 1"))
+
+    assert "Initiative 1" not in store
+    new_id = store.add({"name": "Initiative 1", "business_problem": "Again"})
+    assert store.id_for("Initiative 1") == new_id
+
+
+def test_extend_validates_the_whole_batch():
+    store = InitiativeStore(_records(2))
+    version = store.version
+    with pytest.raises(ValueError):
+        store.extend(_records(2, 5) + [{"name": "Initiative 0", "business_problem": "Duplicate"}])
+    with pytest.raises(ValueError):
+        store.extend([{"name": "Bad level", "complexity": "Extreme"}])
+
+    assert len(store) == 2
+    assert store.version == version
+
+
+def test_unset_fields_are_missing():
+    store = InitiativeStore([{"name": "Sparse", "business_problem": "Problem"}])
+    record = store.get(store.id_for("Sparse"))
+
+    assert "investment_required" not in record and "timeline" not in record
+    assert store.codes("timeline").tolist() == [MISSING]
+    assert math.isnan(store.column("investment_required")[0])
+    assert store.column("investment_required", fill=0).tolist() == [0]
+
+
+def test_update_renames_and_rescores():
+    store = InitiativeStore(_records(2))
+    initiative_id = store.id_for("Initiative 0")
+    store.update(initiative_id, {"name": "Renamed", "complexity": "High", "investment_required": 5.0})
+
+    assert store.id_for("Initiative 0") is None
+    assert store.id_for("Renamed") == initiative_id
+    assert store.get(initiative_id)["complexity"] == "High"
+    with pytest.raises(ValueError):
+        store.update(initiative_id, {"name": "Initiative 1"})
+
+
+def test_change_feed_reports_old_and_new_records():
+    store = InitiativeStore(_records(2))
+    seen = []
+    store.subscribe(lambda changed, changes: seen.append((changed.version, list(changes))))
+
+    added = store.add({"name": "New", "business_problem": "Problem"})
+    store.update(added, {"owner": "Data team"})
+    store.remove(added)
+
+    versions = [version for version, _ in seen]
+    assert versions == sorted(versions) and len(set(versions)) == 3
+    (old, new), = seen[0][1]
+    assert old is None and new["name"] == "New"
+    (old, new), = seen[1][1]
+    assert "owner" not in old and new["owner"] == "Data team"
+    (old, new), = seen[2][1]
+    assert old["owner"] == "Data team" and new is None
+
+
+def test_frame_is_a_per_version_snapshot():
+    store = InitiativeStore(_records(3))
+    frame = store.frame()
+    assert store.frame() is frame
+
+    store.update(store.id_for("Initiative 0"), {"complexity": "High"})
+
+    assert frame.loc[store.id_for("Initiative 0"), "complexity"] == "Medium"
+    assert store.frame().loc[store.id_for("Initiative 0"), "complexity"] == "High"
+    assert list(store.frame().index) == store.ids().tolist()
+
+
+def test_from_columns_loads_lazily():
+    loaded = []
+
+    def owners():
+        loaded.append("owner")
+        return np.array(["A", None], dtype=object)
+
+    store = InitiativeStore.from_columns([7, 9], {
+        "name": np.array(["First", "Second"], dtype=object),
+        "owner": owners,
+        "complexity": np.array([0, MISSING], dtype=np.int8),
+    })
+
+    assert loaded == []
+    assert store.id_for("Second") == 9
+    assert store.get(7) == {"id": 7, "name": "First", "owner": "A", "complexity": "Low"}
+    assert loaded == ["owner"]
+    assert store.add({"name": "Third", "business_problem": "Problem"}) == 10
@@ -0,0 +1,80 @@
+from strategy_mapper import workspace
+from strategy_mapper.store import InitiativeStore
+
+
+def _initiatives(count, prefix="Initiative"):
+    return [
+        {"name": f"{prefix} {i}", "business_problem": "Problem", "timeline": "3-6 months",
+         "investment_required": 1000.0 * i, "created_at": 1_700_000_000.0 + i}
+        for i in range(count)
+    ]
+
+
+def _open(path, workspace_id="test"):
+    return workspace.Workspace(str(path), workspace_id, debounce=60)
+
+
+def _saved(path, workspace_id="test"):
+    state = _open(path, workspace_id).load()
+    return sorted(state["initiatives"], key=lambda record: record["name"])
+
+
+def _current(store):
+    records = [{key: value for key, value in record.items() if key != "id"} for record in store.records()]
+    return sorted(records, key=lambda record: record["name"])
+
+
+def test_lists_and_values_round_trip(tmp_path):
+    path = tmp_path / "workspaces.db"
+    saved = _open(path)
+    saved.track({"goals": ["Grow revenue", "Cut costs"], "business_objective": "Growth"})
+    saved.flush()
+
+    state = _open(path).load()
+    assert state["goals"] == ["Grow revenue", "Cut costs"]
+    assert state["business_objective"] == "Growth"
+
+
+def test_replaced_portfolio_is_rewritten_with_later_edits(tmp_path):
+    path = tmp_path / "workspaces.db"
+    saved = _open(path)
+    saved.track({"initiatives": InitiativeStore(_initiatives(3, "Old"))})
+    saved.flush()
+
+    # An import replaces the portfolio; the session keeps editing it,
+    # compacting it too, before the debounced write
+    store = InitiativeStore(_initiatives(300))
+    saved.track({"initiatives": store})
+    ids = store.ids().tolist()
+    for initiative_id in ids[:200]:
+        store.remove(initiative_id)
+    store.update(ids[250], {"owner": "Data team"})
+    store.add({"name": "Added later", "business_problem": "Problem"})
+    saved.flush()
+
+    assert _saved(path) == _current(store)
+
+
+def test_edits_are_saved_incrementally(tmp_path):
+    path = tmp_path / "workspaces.db"
+    saved = _open(path)
+    store = InitiativeStore(_initiatives(5))
+    saved.track({"initiatives": store})
+    saved.flush()
+    writes = saved.writes
+
+    store.update(store.ids()[0].item(), {"complexity": "High"})
+    store.remove(store.ids()[1].item())
+    saved.flush()
+
+    assert saved.writes == writes + 1
+    assert _saved(path) == _current(store)
+
+
+def test_workspaces_are_separate(tmp_path):
+    path = tmp_path / "workspaces.db"
+    first = _open(path, "first")
+    first.track({"goals": ["Only here"]})
+    first.flush()
+
+    assert _open(path, "second").load()["goals"] == []